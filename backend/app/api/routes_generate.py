@@ -1,27 +1,102 @@
-from fastapi import APIRouter, HTTPException
-from app.schemas.request_schema import GenerateRequest
-from app.schemas.response_schema import GenerateResponse
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from app.core.config import settings
+from app.schemas.request_schema import GenerateRequest, BatchGenerateRequest
+from app.schemas.response_schema import JobSubmitResponse, JobStatusResponse
+from app.services.jobs.service import job_service
 from app.services.orchestrator_service import orchestrator_service
 from app.core.logger import logger
 
 router = APIRouter()
 
-@router.post("/generate", response_model=GenerateResponse)
+@router.post("/generate", response_model=JobSubmitResponse, status_code=202)
 async def generate_podcast(request: GenerateRequest):
     """
-    Generate a finance market brief and podcast.
+    Enqueue a finance market brief and podcast generation job.
+    Poll GET /jobs/{job_id} for progress and the final result.
     """
     logger.info(f"Received generate request for: {request.name}")
-    result = await orchestrator_service.generate_podcast(
+    job = await job_service.submit({
+        "name": request.name,
+        "voice_agent": request.voice_agent,
+        "language": request.language
+    })
+
+    return {
+        "status": job["status"],
+        "job_id": job["job_id"],
+        "status_url": f"{settings.API_V1_STR}/jobs/{job['job_id']}"
+    }
+
+@router.post("/generate/batch", response_model=JobSubmitResponse, status_code=202)
+async def generate_batch(request: BatchGenerateRequest):
+    """
+    Enqueue one episode for many podcast names.
+    Research runs once; each name only adds its own intro to the TTS cost.
+    Poll GET /jobs/{job_id} for progress and the per-name results.
+    """
+    logger.info(f"Received batch generate request for {len(request.brands)} name(s)")
+    job = await job_service.submit({
+        "brands": [brand.model_dump() for brand in request.brands],
+        "output_format": request.format
+    })
+
+    return {
+        "status": job["status"],
+        "job_id": job["job_id"],
+        "status_url": f"{settings.API_V1_STR}/jobs/{job['job_id']}"
+    }
+
+@router.post("/generate/stream")
+async def stream_podcast(
+    request: GenerateRequest,
+    format: str = Query("mp3", pattern="^(mp3|wav)$", description="Stream encoding: 'mp3' or 'wav'")
+):
+    """
+    Generate a single-language podcast and stream its audio progressively.
+    Audio starts flowing as soon as the first TTS chunk is synthesized.
+    """
+    if request.language == "both":
+        raise HTTPException(status_code=400, detail="Streaming supports one language at a time: use 'en' or 'hi'")
+
+    logger.info(f"Received stream request for: {request.name}")
+    result = await orchestrator_service.open_audio_stream(
         name=request.name,
         voice_agent=request.voice_agent,
-        language=request.language
+        language=request.language,
+        output_format=format
     )
-    
+
     if result["status"] == "error":
-        if result["error"] == "Insufficient verified updates for yesterday.":
-            # This is a business error, not a server error
-            return result
         raise HTTPException(status_code=500, detail=result["error"])
-        
-    return result
+
+    return StreamingResponse(
+        result["stream"],
+        media_type=result["media_type"],
+        headers={"Cache-Control": "no-cache"}
+    )
+
+@router.get("/jobs/{job_id}", response_model=JobStatusResponse)
+async def get_job(job_id: str):
+    """
+    Get status, progress and (once finished) the result of a generation job.
+    """
+    job = await job_service.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return job
+
+@router.post("/jobs/{job_id}/retry", response_model=JobStatusResponse, status_code=202)
+async def retry_job(job_id: str):
+    """
+    Re-queue a failed generation job. Scripts and already synthesized
+    audio chunks from the failed attempt are reused.
+    """
+    job = await job_service.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job["status"] != "failed":
+        raise HTTPException(status_code=409, detail=f"Only failed jobs can be retried (status: {job['status']})")
+
+    return await job_service.retry(job_id)
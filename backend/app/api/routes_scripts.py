@@ -0,0 +1,58 @@
+from fastapi import APIRouter, HTTPException
+from app.schemas.request_schema import RenderRequest, RerenderRequest
+from app.schemas.response_schema import ScriptRecordResponse, RenderResponse, RerenderResponse
+from app.services.orchestrator_service import orchestrator_service
+from app.services.scripts.store import script_store
+from app.core.logger import logger
+
+router = APIRouter()
+
+@router.get("/scripts/{script_id}", response_model=ScriptRecordResponse)
+async def get_script(script_id: str):
+    """
+    Get a stored script artifact (English + Hindi) by id.
+    """
+    record = await script_store.get(script_id)
+    if not record:
+        raise HTTPException(status_code=404, detail="Script not found")
+
+    return record
+
+@router.post("/scripts/{script_id}/render", response_model=RenderResponse)
+async def render_script(script_id: str, request: RenderRequest):
+    """
+    Synthesize a stored script to one or more (language, speaker) targets.
+    No research is run: re-voicing an episode only costs TTS.
+    """
+    logger.info(f"Received render request for script {script_id} ({len(request.targets)} target(s))")
+    result = await orchestrator_service.render_script(
+        script_id=script_id,
+        targets=[target.model_dump() for target in request.targets],
+        output_format=request.format
+    )
+
+    if result["error"] == "Script not found":
+        raise HTTPException(status_code=404, detail="Script not found")
+
+    return result
+
+@router.post("/scripts/{script_id}/rerender", response_model=RerenderResponse)
+async def rerender_script(script_id: str, request: RerenderRequest):
+    """
+    Re-render an edited version of a stored script.
+    Only chunks whose text changed are synthesized; the rest of the audio
+    is spliced from the previous render. Returns the edited script's new id.
+    """
+    logger.info(f"Received rerender request for script {script_id} ({request.language})")
+    result = await orchestrator_service.rerender_script(
+        script_id=script_id,
+        language=request.language,
+        script=request.script,
+        speaker=request.speaker,
+        output_format=request.format
+    )
+
+    if result["error"] == "Script not found":
+        raise HTTPException(status_code=404, detail="Script not found")
+
+    return result
@@ -0,0 +1,57 @@
+from fastapi import APIRouter
+
+from app.services.jobs.service import job_service
+from app.services.podcast.service import podcast_service
+from app.services.unified_agent.script_cache import script_cache
+from app.services.unified_agent.service import unified_agent_service
+
+router = APIRouter()
+
+@router.get("/stats/tts-cache")
+async def tts_cache_stats():
+    """
+    TTS chunk cache hit/miss counters and sizes.
+    """
+    return podcast_service.get_tts_cache_stats()
+
+@router.get("/stats/jobs")
+async def job_stats():
+    """
+    Job queue depth and worker utilization.
+    """
+    return await job_service.stats()
+
+@router.get("/stats/audio-executor")
+async def audio_executor_stats():
+    """
+    Audio DSP executor queue depth, in-flight work and timings.
+    """
+    return podcast_service.get_audio_executor_stats()
+
+@router.get("/stats/sarvam-client")
+async def sarvam_client_stats():
+    """
+    Shared Sarvam HTTP client pool utilization and request counters.
+    """
+    return podcast_service.get_sarvam_client_stats()
+
+@router.get("/stats/script-cache")
+async def script_cache_stats():
+    """
+    Agent script cache hits, misses and coalesced (single-flight) requests.
+    """
+    return script_cache.stats()
+
+@router.get("/stats/agent-sessions")
+async def agent_session_stats():
+    """
+    Agent session lifecycle (created, deleted, active) and process RSS.
+    """
+    return unified_agent_service.get_session_stats()
+
+@router.get("/stats/agent-runners")
+async def agent_runner_stats():
+    """
+    Agent runner pool utilization and wait times for a run slot.
+    """
+    return unified_agent_service.get_runner_pool_stats()
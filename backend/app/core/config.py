@@ -18,6 +18,88 @@ class Settings(BaseSettings):
     # Storage Paths
     AUDIO_STORAGE_PATH: str = "storage/audio"
     RAW_DATA_STORAGE_PATH: str = "storage/raw_data"
+    SCRIPT_STORE_PATH: str = "storage/scripts"
+    RENDER_STORE_PATH: str = "storage/renders"  # Per-chunk render manifests + master WAVs for incremental re-render
+
+    # Artifact Storage Backend (audio, saved scripts, raw data, script/render stores)
+    STORAGE_BACKEND: str = "local"  # "local" or "s3"
+    S3_BUCKET: str = os.getenv("S3_BUCKET", "")
+    S3_PREFIX: str = ""
+    S3_ENDPOINT_URL: str = os.getenv("S3_ENDPOINT_URL", "")  # e.g. http://localhost:9000 for MinIO
+    S3_REGION: str = "us-east-1"
+    S3_ACCESS_KEY_ID: str = os.getenv("S3_ACCESS_KEY_ID", "")
+    S3_SECRET_ACCESS_KEY: str = os.getenv("S3_SECRET_ACCESS_KEY", "")
+
+    # Job Queue Settings
+    JOB_BACKEND: str = "sqlite"  # "sqlite" or "memory"
+    JOB_DB_PATH: str = "storage/jobs.db"
+    JOB_WORKERS: int = 2
+    JOB_POLL_INTERVAL_SECONDS: float = 1.0
+    # Running jobs are leased to their worker and the lease is renewed by a heartbeat;
+    # jobs with an expired lease (dead worker) are requeued at startup and by idle workers
+    JOB_LEASE_SECONDS: int = 120
+    JOB_HEARTBEAT_SECONDS: float = 30.0
+    JOB_STALE_AFTER_SECONDS: int = 1800  # Jobs claimed without a lease (older databases)
+
+    # Sarvam TTS Settings
+    SARVAM_TTS_URL: str = "https://api.sarvam.ai/text-to-speech"
+    SARVAM_HTTP_MAX_CONNECTIONS: int = 20
+    SARVAM_HTTP_MAX_KEEPALIVE: int = 10
+    SARVAM_HTTP2: bool = True
+    SARVAM_HTTP_TIMEOUT: float = 60.0
+    SARVAM_TTS_CONCURRENT: bool = True
+    SARVAM_TTS_MAX_CONCURRENCY: int = 4
+    SARVAM_TTS_RATE_LIMIT_PER_SECOND: float = 10.0
+    # Chunks packed into one request's `inputs` array (1 disables batching)
+    SARVAM_TTS_BATCH_SIZE: int = 3
+    SARVAM_TTS_BATCH_MAX_CHARS: int = 1500
+    # After a refused batch, send single-input requests for this long (0: only the refused batch)
+    SARVAM_TTS_BATCH_PAUSE_SECONDS: float = 300.0
+    SARVAM_TTS_MAX_RETRIES: int = 4
+    SARVAM_TTS_RETRY_BASE_SECONDS: float = 0.5
+    SARVAM_TTS_RETRY_MAX_SECONDS: float = 20.0
+    SARVAM_TTS_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    SARVAM_TTS_CIRCUIT_RESET_SECONDS: float = 30.0
+
+    # TTS Chunk Cache Settings
+    TTS_CACHE_ENABLED: bool = True
+    TTS_CACHE_PATH: str = "storage/tts_cache"  # Internal; keep outside AUDIO_STORAGE_PATH (served at /audio)
+    TTS_CACHE_MAX_DISK_MB: int = 512
+    TTS_CACHE_MAX_MEMORY_MB: int = 64
+
+    # Agent Script Cache Settings
+    SCRIPT_CACHE_ENABLED: bool = True
+    SCRIPT_CACHE_PATH: str = "storage/script_cache"
+    SCRIPT_CACHE_TTL_SECONDS: int = 12 * 60 * 60
+
+    # Agent Generation Settings
+    # "single": one call researches, writes English, then translates to Hindi
+    # "pipeline": one research call, then English and Hindi writers in parallel
+    AGENT_GENERATION_MODE: str = "single"
+
+    # Agent Session Settings
+    AGENT_SESSION_BACKEND: str = "sqlite"  # "sqlite" or "memory"
+    AGENT_SESSION_DB_URL: str = "sqlite:///storage/agent_sessions.db"
+    # Sessions idle longer than this are purged at startup (left by crashed runs)
+    AGENT_SESSION_MAX_AGE_SECONDS: int = 60 * 60
+
+    # Agent Runner Pool Settings
+    AGENT_MAX_CONCURRENT_RUNS: int = 4
+
+    # Agent Streaming Settings
+    # Stream agent output so TTS of the English script overlaps Hindi generation
+    AGENT_STREAMING_ENABLED: bool = True
+
+    # Script Splitting Settings
+    SCRIPT_SPLIT_STRATEGY: str = "balanced"  # "balanced" or "greedy" (legacy)
+
+    # Podcast Audio Settings
+    PODCAST_PARALLEL_LANGUAGES: bool = True
+
+    # Audio DSP Executor Settings
+    AUDIO_EXECUTOR_KIND: str = "thread"  # "thread" or "process"
+    AUDIO_EXECUTOR_WORKERS: int = 2
+    AUDIO_EXECUTOR_MAX_INFLIGHT: int = 4
     
     class Config:
         case_sensitive = True
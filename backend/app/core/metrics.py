@@ -0,0 +1,184 @@
+# core/metrics.py
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+try:
+    from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+
+class _NoopMetric:
+    """Stand-in for prometheus metrics when prometheus_client is not installed"""
+
+    def labels(self, *args, **kwargs) -> "_NoopMetric":
+        return self
+
+    def inc(self, amount: float = 1) -> None:
+        pass
+
+    def observe(self, amount: float) -> None:
+        pass
+
+
+def _counter(name: str, documentation: str, labelnames: Tuple[str, ...]):
+    return Counter(name, documentation, labelnames) if PROMETHEUS_AVAILABLE else _NoopMetric()
+
+
+def _histogram(name: str, documentation: str, labelnames: Tuple[str, ...], buckets: Tuple[float, ...]):
+    return Histogram(name, documentation, labelnames, buckets=buckets) if PROMETHEUS_AVAILABLE else _NoopMetric()
+
+
+# Pipeline stages span milliseconds (splitting) to minutes (agent research)
+_STAGE_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300, 600)
+_REQUEST_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 3, 5, 8, 12, 20, 30, 60)
+_CHARS_BUCKETS = (50, 100, 200, 300, 400, 450, 500, 1000, 2000)
+_BYTES_BUCKETS = (16e3, 64e3, 128e3, 256e3, 512e3, 1e6, 2e6, 4e6)
+
+STAGE_SECONDS = _histogram(
+    "podcast_stage_seconds",
+    "Duration of pipeline stages (agent, splitting, tts, wav_combine, mp3_encode, save, ...)",
+    ("stage", "language"),
+    _STAGE_BUCKETS,
+)
+STAGE_FAILURES = _counter(
+    "podcast_stage_failures_total",
+    "Pipeline stages that raised",
+    ("stage", "language"),
+)
+GENERATIONS = _counter(
+    "podcast_generations_total",
+    "Finished generation requests by mode and status",
+    ("mode", "status"),
+)
+TTS_REQUEST_SECONDS = _histogram(
+    "podcast_tts_request_seconds",
+    "Round-trip time of Sarvam TTS HTTP attempts",
+    ("outcome",),
+    _REQUEST_BUCKETS,
+)
+TTS_RETRIES = _counter(
+    "podcast_tts_retries_total",
+    "Sarvam TTS attempts that were retried, by reason (status code, transport, no_audio)",
+    ("reason",),
+)
+TTS_CHUNKS = _counter(
+    "podcast_tts_chunks_total",
+    "TTS chunks synthesized, by source (api or cache)",
+    ("language", "source"),
+)
+TTS_CHUNK_CHARS = _histogram(
+    "podcast_tts_chunk_chars",
+    "Characters per TTS chunk",
+    ("language", "source"),
+    _CHARS_BUCKETS,
+)
+TTS_CHUNK_BYTES = _histogram(
+    "podcast_tts_chunk_audio_bytes",
+    "WAV bytes returned per TTS chunk",
+    ("language", "source"),
+    _BYTES_BUCKETS,
+)
+TTS_CHUNK_SECONDS = _histogram(
+    "podcast_tts_chunk_seconds",
+    "Time to obtain one chunk's audio (cache lookup or API round-trips including retries)",
+    ("language", "source"),
+    _REQUEST_BUCKETS,
+)
+
+
+class RequestTimings:
+    """
+    Stage durations of one generation request, returned in its result.
+
+    Stages reported without a language are summed under their name;
+    per-language stages (tts, mp3_encode, ...) are kept per language,
+    since languages run concurrently and their sum would be misleading.
+    """
+
+    def __init__(self):
+        self._started = time.perf_counter()
+        self._stages: Dict[str, Any] = {}
+
+    def add(self, stage: str, seconds: float, language: Optional[str] = None):
+        if language is None:
+            self._stages[stage] = self._stages.get(stage, 0.0) + seconds
+        else:
+            per_language = self._stages.setdefault(stage, {})
+            if isinstance(per_language, dict):
+                per_language[language] = per_language.get(language, 0.0) + seconds
+
+    def as_dict(self) -> Dict[str, Any]:
+        timings = {
+            stage: (
+                {lang: round(seconds, 3) for lang, seconds in value.items()}
+                if isinstance(value, dict) else round(value, 3)
+            )
+            for stage, value in self._stages.items()
+        }
+        timings["total"] = round(time.perf_counter() - self._started, 3)
+        return timings
+
+
+# Timings of the request running in the current task; tasks created while
+# it is set (per-language TTS, ...) inherit it through the copied context
+_request_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def start_request_timings() -> RequestTimings:
+    """Begin collecting stage timings for the request running in this task."""
+    timings = RequestTimings()
+    _request_timings.set(timings)
+    return timings
+
+
+def observe_stage(stage: str, seconds: float, language: Optional[str] = None):
+    """Record a stage duration in the histogram and the current request's timings."""
+    STAGE_SECONDS.labels(stage=stage, language=language or "all").observe(seconds)
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.add(stage, seconds, language)
+
+
+@contextmanager
+def stage_timer(stage: str, language: Optional[str] = None) -> Iterator[None]:
+    """Time a block as a pipeline stage (also counts failures)."""
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        STAGE_FAILURES.labels(stage=stage, language=language or "all").inc()
+        raise
+    finally:
+        observe_stage(stage, time.perf_counter() - started, language)
+
+
+def record_tts_chunk(language: str, chars: int, audio_bytes: int, seconds: float, source: str):
+    """Record one chunk's audio, served by the Sarvam API ("api") or the TTS cache ("cache")."""
+    TTS_CHUNKS.labels(language=language, source=source).inc()
+    TTS_CHUNK_CHARS.labels(language=language, source=source).observe(chars)
+    TTS_CHUNK_BYTES.labels(language=language, source=source).observe(audio_bytes)
+    TTS_CHUNK_SECONDS.labels(language=language, source=source).observe(seconds)
+
+
+def record_tts_request(outcome: str, seconds: float):
+    """Record one HTTP attempt: "success", "retry" or "failure"."""
+    TTS_REQUEST_SECONDS.labels(outcome=outcome).observe(seconds)
+
+
+def record_tts_retry(reason: str):
+    TTS_RETRIES.labels(reason=reason).inc()
+
+
+def record_generation(mode: str, status: str):
+    GENERATIONS.labels(mode=mode, status=status).inc()
+
+
+def render_metrics() -> Optional[Tuple[bytes, str]]:
+    """Prometheus exposition of every metric, or None if prometheus_client is missing."""
+    if not PROMETHEUS_AVAILABLE:
+        return None
+    return generate_latest(), CONTENT_TYPE_LATEST
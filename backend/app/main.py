@@ -1,11 +1,34 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import PlainTextResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from app.api import routes_generate
+from app.api import routes_generate, routes_scripts, routes_stats
 from app.core.config import settings
+from app.core.metrics import render_metrics
+from app.services.jobs.service import job_service
+from app.services.podcast.service import podcast_service
+from app.services.storage.backends import LocalStorageBackend, storage_backend
+from app.services.unified_agent.service import unified_agent_service
 import os
+import mimetypes
 
-app = FastAPI(title=settings.PROJECT_NAME)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Startup: open the pooled Sarvam client, initialize agents and the
+    # runner pool, then spawn background job workers
+    await podcast_service.startup()
+    await unified_agent_service.startup()
+    await job_service.start()
+    yield
+    # Shutdown: stop workers (returning in-flight jobs to the queue), then release pools
+    await job_service.stop()
+    await unified_agent_service.shutdown()
+    await podcast_service.shutdown()
+
+
+app = FastAPI(title=settings.PROJECT_NAME, lifespan=lifespan)
 
 # CORS middleware
 app.add_middleware(
@@ -20,16 +43,35 @@ app.add_middleware(
 os.makedirs(settings.AUDIO_STORAGE_PATH, exist_ok=True)
 os.makedirs(settings.RAW_DATA_STORAGE_PATH, exist_ok=True)
 
-# Mount static files for audio
-app.mount("/audio", StaticFiles(directory=settings.AUDIO_STORAGE_PATH), name="audio")
+# Audio files: served from disk, or proxied from the storage backend (S3-compatible)
+if isinstance(storage_backend, LocalStorageBackend):
+    app.mount("/audio", StaticFiles(directory=settings.AUDIO_STORAGE_PATH), name="audio")
+else:
+    @app.get("/audio/{filename}", include_in_schema=False)
+    async def audio_file(filename: str):
+        data = await storage_backend.read(os.path.join(settings.AUDIO_STORAGE_PATH, filename))
+        if data is None:
+            raise HTTPException(status_code=404, detail="Not Found")
+        return Response(content=data, media_type=mimetypes.guess_type(filename)[0] or "application/octet-stream")
 
 # Include routers
 app.include_router(routes_generate.router, prefix=f"{settings.API_V1_STR}", tags=["Generate"])
+app.include_router(routes_scripts.router, prefix=f"{settings.API_V1_STR}", tags=["Scripts"])
+app.include_router(routes_stats.router, prefix=f"{settings.API_V1_STR}", tags=["Stats"])
 
 @app.get("/")
 async def root():
     return {"message": f"Welcome to {settings.PROJECT_NAME} API"}
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics: per-stage latency histograms and TTS chunk/request counters."""
+    exposition = render_metrics()
+    if exposition is None:
+        return PlainTextResponse("prometheus_client is not installed", status_code=503)
+    body, content_type = exposition
+    return Response(content=body, media_type=content_type)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
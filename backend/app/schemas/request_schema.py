@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 
 class GenerateRequest(BaseModel):
     """Request model for podcast generation with language support"""
@@ -28,4 +28,127 @@ class GenerateRequest(BaseModel):
                 "voice_agent": "sachit",
                 "language": "en"
             }
-        }
\ No newline at end of file
+        }
+
+class RenderTarget(BaseModel):
+    """One (language, speaker) rendering of a stored script"""
+    language: str = Field(
+        ...,
+        description="Script language to render: 'en' or 'hi'",
+        pattern="^(en|hi)$",
+        example="hi"
+    )
+    speaker: Optional[str] = Field(
+        None,
+        description="Speaker/voice name (defaults to 'sachit' for English, 'anushka' for Hindi)",
+        example="karan"
+    )
+
+
+class RenderRequest(BaseModel):
+    """Request model for rendering a stored script to one or more voices"""
+    targets: List[RenderTarget] = Field(
+        ...,
+        description="(language, speaker) pairs to synthesize concurrently",
+        min_length=1,
+        max_length=8
+    )
+    format: str = Field(
+        "mp3",
+        description="Audio format: 'mp3' or 'wav'",
+        pattern="^(mp3|wav)$"
+    )
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "targets": [
+                    {"language": "en", "speaker": "anushka"},
+                    {"language": "hi", "speaker": "karan"}
+                ],
+                "format": "mp3"
+            }
+        }
+
+
+class RerenderRequest(BaseModel):
+    """Request model for re-rendering an edited script incrementally"""
+    language: str = Field(
+        ...,
+        description="Language of the edited script: 'en' or 'hi'",
+        pattern="^(en|hi)$",
+        example="en"
+    )
+    script: str = Field(
+        ...,
+        description="Full edited script text; only sentences that changed are re-synthesized",
+        min_length=1
+    )
+    speaker: Optional[str] = Field(
+        None,
+        description="Speaker/voice name (defaults to 'sachit' for English, 'anushka' for Hindi)",
+        pattern="^[A-Za-z0-9-]+$",
+        example="sachit"
+    )
+    format: str = Field(
+        "mp3",
+        description="Audio format: 'mp3' or 'wav'",
+        pattern="^(mp3|wav)$"
+    )
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "language": "en",
+                "script": "Welcome to the Nippon India Financial Podcast. Today's Edition: 2026-02-26. The repo rate was held at 6.25 percent...",
+                "speaker": "sachit",
+                "format": "mp3"
+            }
+        }
+
+
+class BatchBrand(BaseModel):
+    """One podcast name in a batch generation request"""
+    name: str = Field(
+        ...,
+        description="Podcast name/attribution spoken in the intro",
+        min_length=1,
+        example="Nippon India Financial"
+    )
+    voice_agent: Optional[str] = Field(
+        None,
+        description="Speaker/voice name (defaults to 'sachit' for English, 'anushka' for Hindi)",
+        example="sachit"
+    )
+    language: str = Field(
+        "both",
+        description="Target language: 'en', 'hi', or 'both' (default)",
+        pattern="^(en|hi|both)$",
+        example="en"
+    )
+
+
+class BatchGenerateRequest(BaseModel):
+    """Request model for generating the same episode for many podcast names"""
+    brands: List[BatchBrand] = Field(
+        ...,
+        description="Podcast names to generate; research and the shared script body are produced once",
+        min_length=1,
+        max_length=100
+    )
+    format: str = Field(
+        "mp3",
+        description="Audio format: 'mp3' or 'wav'",
+        pattern="^(mp3|wav)$"
+    )
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "brands": [
+                    {"name": "Nippon India Financial", "voice_agent": "sachit", "language": "en"},
+                    {"name": "Axis Money Daily", "voice_agent": None, "language": "both"}
+                ],
+                "format": "mp3"
+            }
+        }
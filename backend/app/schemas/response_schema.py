@@ -1,11 +1,11 @@
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, List
+from typing import Any, Optional, Dict, List
 
 
 class ScriptInfo(BaseModel):
     """Script information"""
-    eng_pod: str = Field(..., description="English podcast script")
-    hin_pod: str = Field(..., description="Hindi podcast script")
+    eng_pod: Optional[str] = Field(None, description="English podcast script (None if not requested)")
+    hin_pod: Optional[str] = Field(None, description="Hindi podcast script (None if not requested)")
 
 
 class ScriptLengths(BaseModel):
@@ -69,9 +69,14 @@ class GenerateResponse(BaseModel):
         description="Target language: 'en', 'hi', or 'both'",
         example="en"
     )
-    scripts: Dict[str, str] = Field(
+    script_id: Optional[str] = Field(
+        None,
+        description="Id of the stored scripts; render them again via POST /scripts/{script_id}/render",
+        example="9c1e4f0a2b7d3e5f6a8b0c1d"
+    )
+    scripts: Dict[str, Optional[str]] = Field(
         ...,
-        description="Generated podcast scripts - eng_pod and hin_pod",
+        description="Generated podcast scripts - eng_pod and hin_pod (None for a language that was not requested)",
         example={
             "eng_pod": "Welcome to the Nippon India Financial Podcast...",
             "hin_pod": "निप्पॉन इंडिया वित्तीय पॉडकास्ट में आपका स्वागत है..."
@@ -108,6 +113,18 @@ class GenerateResponse(BaseModel):
             "total": 6
         }
     )
+    timings: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Seconds spent per pipeline stage; per-language stages are broken down by language",
+        example={
+            "agent": 38.412,
+            "splitting": 0.004,
+            "tts": {"en": 21.37},
+            "mp3_encode": {"en": 0.35},
+            "save": {"en": 0.002},
+            "total": 60.51
+        }
+    )
     error: Optional[str] = Field(
         None,
         description="Error message (None if successful)"
@@ -128,12 +145,12 @@ class GenerateResponse(BaseModel):
                 "language": "en",
                 "scripts": {
                     "eng_pod": "Welcome to the Nippon India Financial Podcast. Today's Edition: 2026-02-26. Central banks across the world have been making significant policy decisions...",
-                    "hin_pod": "निप्पॉन इंडिया वित्तीय पॉडकास्ट में आपका स्वागत है। आज का संस्करण: 2026-02-26। विश्व भर के केंद्रीय बैंक ऐसे नीतिगत निर्णय ले रहे हैं..."
+                    "hin_pod": None
                 },
                 "script_lengths": {
                     "eng_pod": 1500,
-                    "hin_pod": 1600,
-                    "total": 3100
+                    "hin_pod": 0,
+                    "total": 1500
                 },
                 "audio": {
                     "eng_pod_audio": "/audio/podcast_en_20260226_120000.mp3",
@@ -142,8 +159,16 @@ class GenerateResponse(BaseModel):
                 "speaker": "sachit",
                 "chunks": {
                     "eng_pod_count": 3,
-                    "hin_pod_count": 3,
-                    "total": 6
+                    "hin_pod_count": 0,
+                    "total": 3
+                },
+                "timings": {
+                    "agent": 38.412,
+                    "splitting": 0.004,
+                    "tts": {"en": 21.37},
+                    "mp3_encode": {"en": 0.35},
+                    "save": {"en": 0.002},
+                    "total": 60.51
                 },
                 "error": None,
                 "timestamp": "2026-02-26T12:00:00"
@@ -151,6 +176,56 @@ class GenerateResponse(BaseModel):
         }
 
 
+class RerenderResponse(BaseModel):
+    """Response model for an incremental re-render of an edited script"""
+    status: str = Field(..., description="'success' or 'error'", example="success")
+    script_id: Optional[str] = Field(None, description="Id of the stored edited script", example="4d7a0c9e1b3f5a7c9e1d3b5f")
+    previous_script_id: str = Field(..., description="Id of the script that was edited", example="9c1e4f0a2b7d3e5f6a8b0c1d")
+    language: str = Field(..., example="en")
+    speaker: Optional[str] = Field(None, example="sachit")
+    audio: Optional[str] = Field(None, description="Path to the re-rendered audio file", example="/audio/podcast_en_20260226_120000_a1b2c3.mp3")
+    chunks: Optional[Dict[str, int]] = Field(
+        None,
+        description="Chunks spliced from the previous render vs. newly synthesized",
+        example={"reused": 11, "synthesized": 1, "total": 12}
+    )
+    error: Optional[str] = Field(None, description="Error message if the re-render failed")
+    timestamp: str = Field(..., description="Timestamp of rendering (ISO format)")
+
+
+class BatchBrandResult(BaseModel):
+    """Outcome of one podcast name in a batch"""
+    name: str = Field(..., example="Nippon India Financial")
+    language: str = Field(..., description="'en', 'hi', or 'both'", example="en")
+    speaker: Optional[str] = Field(None, description="Speaker of the first rendered language", example="sachit")
+    script_id: Optional[str] = Field(None, description="Id of this name's stored scripts", example="9c1e4f0a2b7d3e5f6a8b0c1d")
+    audio: Dict[str, Optional[str]] = Field(
+        ...,
+        description="Paths to this name's audio files",
+        example={"eng_pod_audio": "/audio/podcast_en_20260226_120000_a1b2c3.mp3", "hin_pod_audio": None}
+    )
+    error: Optional[str] = Field(None, description="Error message if any language failed for this name")
+
+
+class BatchGenerateResponse(BaseModel):
+    """
+    Result of a batch generation job (POST /generate/batch).
+    Research and the shared script body are produced once; each name only
+    adds its branded intro.
+    """
+    status: str = Field(..., description="'success' if every name rendered, else 'error'", example="success")
+    date: str = Field(..., description="Date of podcast generation (YYYY-MM-DD)", example="2026-02-26")
+    results: List[BatchBrandResult] = Field(..., description="One entry per requested name, in request order")
+    chunks: Dict[str, Optional[Dict[str, int]]] = Field(
+        ...,
+        description="Per language: TTS chunks shared by every name, and branded segments synthesized per name",
+        example={"en": {"shared": 9, "branded_segments": 1}, "hi": None}
+    )
+    timings: Optional[Dict[str, Any]] = Field(None, description="Seconds spent per pipeline stage")
+    error: Optional[str] = Field(None, description="Combined error message of failed names")
+    timestamp: str = Field(..., description="Timestamp of generation (ISO format)", example="2026-02-26T12:00:00")
+
+
 class ErrorResponse(BaseModel):
     """Error response model"""
     status: str = Field(
@@ -247,4 +322,68 @@ class HealthCheckResponse(BaseModel):
     message: str = Field(
         "Podcast generation service is running",
         example="Podcast generation service is running"
-    )
\ No newline at end of file
+    )
+
+class JobSubmitResponse(BaseModel):
+    """Response model returned when a generation job is enqueued"""
+    status: str = Field("queued", description="Job status at submission", example="queued")
+    job_id: str = Field(..., description="Job identifier", example="3f2b9c0e7d5a4c1e9b8a6f4d2c0e1a7b")
+    status_url: str = Field(
+        ...,
+        description="URL to poll for job status and result",
+        example="/api/v1/jobs/3f2b9c0e7d5a4c1e9b8a6f4d2c0e1a7b"
+    )
+
+
+class JobStatusResponse(BaseModel):
+    """Response model for polling a generation job"""
+    job_id: str = Field(..., description="Job identifier")
+    status: str = Field(
+        ...,
+        description="Job status: 'queued', 'running', 'succeeded' or 'failed'",
+        example="running"
+    )
+    stage: Optional[str] = Field(
+        None,
+        description="Current pipeline stage",
+        example="generating_audio"
+    )
+    progress: float = Field(0.0, description="Progress from 0.0 to 1.0", example=0.45)
+    params: Dict[str, Any] = Field(..., description="Original generate request parameters")
+    result: Optional[Dict[str, Any]] = Field(
+        None,
+        description="GenerateResponse (BatchGenerateResponse for batch jobs) payload once the job has finished"
+    )
+    error: Optional[str] = Field(None, description="Error message if the job failed")
+    created_at: str = Field(..., description="Submission timestamp (ISO format)")
+    updated_at: str = Field(..., description="Last update timestamp (ISO format)")
+    started_at: Optional[str] = Field(None, description="Start timestamp (ISO format)")
+    finished_at: Optional[str] = Field(None, description="Completion timestamp (ISO format)")
+
+
+class ScriptRecordResponse(BaseModel):
+    """Response model for a stored script artifact"""
+    script_id: str = Field(..., description="Script identifier", example="9c1e4f0a2b7d3e5f6a8b0c1d")
+    date: str = Field(..., description="News date the script covers", example="2026-02-26")
+    attribution: str = Field(..., description="Podcast attribution", example="Nippon India Financial")
+    scripts: Dict[str, str] = Field(..., description="eng_pod and/or hin_pod scripts (only the generated languages)")
+    script_lengths: Dict[str, int] = Field(..., description="Length of each script in characters")
+    metadata: Dict[str, Any] = Field(default_factory=dict, description="Generation metadata (prompt version, ...)")
+    created_at: str = Field(..., description="Creation timestamp (ISO format)")
+
+
+class RenderResult(BaseModel):
+    """Outcome of one (language, speaker) render"""
+    language: str = Field(..., example="hi")
+    speaker: Optional[str] = Field(None, example="karan")
+    audio: Optional[str] = Field(None, description="Path to the rendered audio file", example="/audio/podcast_hi_20260226_120000.mp3")
+    error: Optional[str] = Field(None, description="Error message if this render failed")
+
+
+class RenderResponse(BaseModel):
+    """Response model for rendering a stored script"""
+    status: str = Field(..., description="'success' if every target rendered, else 'error'", example="success")
+    script_id: str = Field(..., example="9c1e4f0a2b7d3e5f6a8b0c1d")
+    renders: List[RenderResult] = Field(..., description="One entry per requested target, in request order")
+    error: Optional[str] = Field(None, description="Combined error message of failed targets")
+    timestamp: str = Field(..., description="Timestamp of rendering (ISO format)")
@@ -0,0 +1,329 @@
+# services/jobs/backends.py
+import os
+import json
+import asyncio
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from app.core.logger import logger
+
+
+JOB_STATUSES = ("queued", "running", "succeeded", "failed")
+
+
+def lease_deadline(lease_seconds: float) -> str:
+    return (datetime.now() + timedelta(seconds=lease_seconds)).isoformat()
+
+
+class JobBackend(ABC):
+    """
+    Storage + dispatch backend for podcast generation jobs.
+    
+    Jobs are plain dicts:
+    {
+        "job_id": "...",
+        "status": "queued" | "running" | "succeeded" | "failed",
+        "stage": "queued",
+        "progress": 0.0,
+        "params": {...},
+        "result": {...} or None,
+        "error": None,
+        "created_at": "...", "updated_at": "...",
+        "started_at": None, "finished_at": None,
+        "worker_id": None, "lease_expires_at": None
+    }
+    
+    A claimed job is leased to one worker (worker_id) until
+    lease_expires_at; the worker extends the lease with heartbeat()
+    while the job runs, so only jobs whose worker died are requeued.
+    """
+
+    def __init__(self):
+        # Wakes idle workers in this process as soon as a job is enqueued
+        self._new_work = asyncio.Event()
+
+    @abstractmethod
+    async def enqueue(self, job: Dict[str, Any]) -> None:
+        """Persist a new job in the 'queued' state."""
+
+    @abstractmethod
+    async def claim(self, worker_id: str, lease_seconds: float) -> Optional[Dict[str, Any]]:
+        """Atomically take the oldest queued job, mark it 'running' and lease it to worker_id."""
+
+    @abstractmethod
+    async def heartbeat(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        """Extend worker_id's lease on a running job. False if the lease was lost."""
+
+    @abstractmethod
+    async def update(self, job_id: str, **fields: Any) -> None:
+        """Update fields of an existing job."""
+
+    @abstractmethod
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch a job by id."""
+
+    @abstractmethod
+    async def counts(self) -> Dict[str, int]:
+        """Number of jobs per status."""
+
+    async def wait_for_work(self, timeout: float) -> None:
+        """Block until a local enqueue signals new work, or until timeout."""
+        try:
+            await asyncio.wait_for(self._new_work.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._new_work.clear()
+
+    async def requeue_stale(self, older_than_seconds: float) -> int:
+        """
+        Return interrupted 'running' jobs (lease expired, i.e. their worker
+        stopped heartbeating) to the queue. Jobs without a lease, claimed
+        before leases existed, are requeued once idle for
+        older_than_seconds. Returns count.
+        """
+        return 0
+
+    async def close(self) -> None:
+        """Release backend resources."""
+
+
+class InMemoryJobBackend(JobBackend):
+    """Process-local backend. Jobs are lost on restart."""
+
+    def __init__(self):
+        super().__init__()
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._queue: List[str] = []
+
+    async def enqueue(self, job: Dict[str, Any]) -> None:
+        self._jobs[job["job_id"]] = dict(job)
+        self._queue.append(job["job_id"])
+        self._new_work.set()
+
+    async def claim(self, worker_id: str, lease_seconds: float) -> Optional[Dict[str, Any]]:
+        while self._queue:
+            job_id = self._queue.pop(0)
+            job = self._jobs.get(job_id)
+            if job and job["status"] == "queued":
+                now = datetime.now().isoformat()
+                job.update(
+                    status="running", started_at=now, updated_at=now,
+                    worker_id=worker_id, lease_expires_at=lease_deadline(lease_seconds)
+                )
+                return dict(job)
+        return None
+
+    async def heartbeat(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        job = self._jobs.get(job_id)
+        if not job or job["status"] != "running" or job.get("worker_id") != worker_id:
+            return False
+        job["lease_expires_at"] = lease_deadline(lease_seconds)
+        return True
+
+    async def update(self, job_id: str, **fields: Any) -> None:
+        job = self._jobs.get(job_id)
+        if not job:
+            return
+        job.update(fields, updated_at=datetime.now().isoformat())
+        if fields.get("status") == "queued":
+            self._queue.append(job_id)
+            self._new_work.set()
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self._jobs.get(job_id)
+        return dict(job) if job else None
+
+    async def counts(self) -> Dict[str, int]:
+        counts = {status: 0 for status in JOB_STATUSES}
+        for job in self._jobs.values():
+            counts[job["status"]] = counts.get(job["status"], 0) + 1
+        return counts
+
+
+class SQLiteJobBackend(JobBackend):
+    """
+    SQLite-backed job queue. Jobs survive restarts, and several uvicorn
+    processes can share one database file: claims run inside
+    BEGIN IMMEDIATE so each job is taken by exactly one worker.
+    """
+
+    _JSON_FIELDS = ("params", "result")
+
+    def __init__(self, db_path: str):
+        super().__init__()
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                stage TEXT,
+                progress REAL NOT NULL DEFAULT 0,
+                params TEXT,
+                result TEXT,
+                error TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                started_at TEXT,
+                finished_at TEXT,
+                worker_id TEXT,
+                lease_expires_at TEXT
+            )
+            """
+        )
+        # Databases created before job leases lack the lease columns
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        for column in ("worker_id", "lease_expires_at"):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} TEXT")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at)")
+
+    def _row_to_job(self, row: sqlite3.Row) -> Dict[str, Any]:
+        job = dict(row)
+        for field in self._JSON_FIELDS:
+            if job.get(field) is not None:
+                job[field] = json.loads(job[field])
+        return job
+
+    def _enqueue_sync(self, job: Dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO jobs (job_id, status, stage, progress, params, result, error,
+                                  created_at, updated_at, started_at, finished_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    job["job_id"], job["status"], job.get("stage"), job.get("progress", 0.0),
+                    json.dumps(job.get("params"), ensure_ascii=False),
+                    json.dumps(job["result"], ensure_ascii=False) if job.get("result") is not None else None,
+                    job.get("error"), job["created_at"], job["updated_at"],
+                    job.get("started_at"), job.get("finished_at"),
+                ),
+            )
+
+    def _claim_sync(self, worker_id: str, lease_seconds: float) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT * FROM jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1"
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+
+                now = datetime.now().isoformat()
+                lease_expires_at = lease_deadline(lease_seconds)
+                self._conn.execute(
+                    "UPDATE jobs SET status = 'running', started_at = ?, updated_at = ?, "
+                    "worker_id = ?, lease_expires_at = ? WHERE job_id = ?",
+                    (now, now, worker_id, lease_expires_at, row["job_id"]),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+            job = self._row_to_job(row)
+            job.update(
+                status="running", started_at=now, updated_at=now,
+                worker_id=worker_id, lease_expires_at=lease_expires_at
+            )
+            return job
+
+    def _heartbeat_sync(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET lease_expires_at = ? "
+                "WHERE job_id = ? AND worker_id = ? AND status = 'running'",
+                (lease_deadline(lease_seconds), job_id, worker_id),
+            )
+        return cursor.rowcount == 1
+
+    def _update_sync(self, job_id: str, fields: Dict[str, Any]) -> None:
+        fields = dict(fields, updated_at=datetime.now().isoformat())
+        for field in self._JSON_FIELDS:
+            if field in fields and fields[field] is not None:
+                fields[field] = json.dumps(fields[field], ensure_ascii=False)
+
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock:
+            self._conn.execute(
+                f"UPDATE jobs SET {columns} WHERE job_id = ?",
+                (*fields.values(), job_id),
+            )
+
+    def _get_sync(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def _counts_sync(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+        counts = {status: 0 for status in JOB_STATUSES}
+        counts.update({row["status"]: row["n"] for row in rows})
+        return counts
+
+    def _requeue_stale_sync(self, older_than_seconds: float) -> int:
+        now = datetime.now()
+        cutoff = (now - timedelta(seconds=older_than_seconds)).isoformat()
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = 'queued', stage = 'queued', progress = 0, updated_at = ?, "
+                "worker_id = NULL, lease_expires_at = NULL "
+                "WHERE status = 'running' AND ("
+                "lease_expires_at < ? OR (lease_expires_at IS NULL AND updated_at < ?))",
+                (now.isoformat(), now.isoformat(), cutoff),
+            )
+        return cursor.rowcount
+
+    async def enqueue(self, job: Dict[str, Any]) -> None:
+        await asyncio.to_thread(self._enqueue_sync, job)
+        self._new_work.set()
+
+    async def claim(self, worker_id: str, lease_seconds: float) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._claim_sync, worker_id, lease_seconds)
+
+    async def heartbeat(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        return await asyncio.to_thread(self._heartbeat_sync, job_id, worker_id, lease_seconds)
+
+    async def update(self, job_id: str, **fields: Any) -> None:
+        await asyncio.to_thread(self._update_sync, job_id, fields)
+        if fields.get("status") == "queued":
+            self._new_work.set()
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._get_sync, job_id)
+
+    async def counts(self) -> Dict[str, int]:
+        return await asyncio.to_thread(self._counts_sync)
+
+    async def requeue_stale(self, older_than_seconds: float) -> int:
+        return await asyncio.to_thread(self._requeue_stale_sync, older_than_seconds)
+
+    async def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def create_job_backend(kind: str, db_path: str) -> JobBackend:
+    """Build the configured job backend ('memory' or 'sqlite')."""
+    if kind == "memory":
+        return InMemoryJobBackend()
+    if kind == "sqlite":
+        return SQLiteJobBackend(db_path)
+
+    logger.warning(f"Unknown JOB_BACKEND '{kind}', falling back to in-memory jobs")
+    return InMemoryJobBackend()
@@ -0,0 +1,248 @@
+# services/jobs/service.py
+import os
+import uuid
+import time
+import socket
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.core.metrics import record_generation
+from app.services.orchestrator_service import orchestrator_service
+
+from .backends import JobBackend, create_job_backend
+
+
+class JobService:
+    """
+    Background job runner for podcast generation.
+    
+    POST /generate enqueues a job and returns immediately; a pool of
+    worker tasks claims queued jobs from the backend and runs
+    OrchestratorService.generate_podcast (generate_batch for
+    POST /generate/batch), recording stage and progress
+    so clients can poll GET /jobs/{job_id}.
+    
+    Each worker leases the job it claims and heartbeats the lease while
+    the job runs, so a restart of one process only requeues jobs whose
+    worker is gone, never a long TTS stage still running elsewhere.
+    """
+
+    def __init__(self):
+        self.backend: Optional[JobBackend] = None
+        self._workers: List[asyncio.Task] = []
+        self._running_jobs: Dict[int, str] = {}
+        # Unique per process, so workers of processes sharing a database are distinguishable
+        self.instance_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._last_requeue = 0.0
+
+    async def start(self, workers: Optional[int] = None) -> None:
+        """Open the backend and spawn the worker pool."""
+        if self._workers:
+            return
+
+        workers = workers or settings.JOB_WORKERS
+        self.backend = self.backend or create_job_backend(settings.JOB_BACKEND, settings.JOB_DB_PATH)
+
+        await self._requeue_stale()
+
+        self._workers = [
+            asyncio.create_task(self._worker_loop(worker_id), name=f"job-worker-{worker_id}")
+            for worker_id in range(1, workers + 1)
+        ]
+        logger.info(f"✓ Job workers started ({workers} workers, backend: {settings.JOB_BACKEND})")
+
+    async def stop(self) -> None:
+        """Cancel the worker pool and return in-flight jobs to the queue."""
+        # Workers drop their job from _running_jobs as they exit, so read it first
+        in_flight = list(self._running_jobs.values())
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        if self.backend:
+            for job_id in in_flight:
+                await self.backend.update(
+                    job_id, status="queued", stage="queued", progress=0.0,
+                    worker_id=None, lease_expires_at=None
+                )
+            self._running_jobs.clear()
+            await self.backend.close()
+            self.backend = None
+
+        logger.info("Job workers stopped")
+
+    async def submit(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Enqueue a podcast generation job and return its record."""
+        if not self.backend:
+            self.backend = create_job_backend(settings.JOB_BACKEND, settings.JOB_DB_PATH)
+
+        now = datetime.now().isoformat()
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "status": "queued",
+            "stage": "queued",
+            "progress": 0.0,
+            "params": params,
+            "result": None,
+            "error": None,
+            "created_at": now,
+            "updated_at": now,
+            "started_at": None,
+            "finished_at": None,
+            "worker_id": None,
+            "lease_expires_at": None,
+        }
+        await self.backend.enqueue(job)
+        target = params.get("name") or f"batch of {len(params.get('brands') or [])} name(s)"
+        logger.info(f"Job {job['job_id']} queued for: {target}")
+        return job
+
+    async def retry(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Re-queue a failed job under the same id.
+        
+        Scripts from the failed attempt (and the chunks a streamed attempt
+        voiced them with) are carried into the job params, so the agent
+        step is skipped and chunks already synthesized are served from the
+        TTS cache: the retry resumes at the failed chunk.
+        """
+        job = await self.get_job(job_id)
+        if not job or job["status"] != "failed":
+            return None
+
+        params = dict(job["params"])
+        result = job.get("result") or {}
+        scripts = result.get("scripts") or {}
+        if scripts.get("eng_pod") or scripts.get("hin_pod"):
+            params["scripts"] = scripts
+            if result.get("script_chunks"):
+                params["script_chunks"] = result["script_chunks"]
+
+        await self.backend.update(
+            job_id,
+            status="queued",
+            stage="queued",
+            progress=0.0,
+            params=params,
+            result=None,
+            error=None,
+            finished_at=None,
+        )
+        logger.info(f"Job {job_id} re-queued for retry (resume from scripts: {'scripts' in params})")
+        return await self.get_job(job_id)
+
+    async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        if not self.backend:
+            return None
+        return await self.backend.get(job_id)
+
+    async def stats(self) -> Dict[str, Any]:
+        counts = await self.backend.counts() if self.backend else {}
+        return {
+            "backend": settings.JOB_BACKEND,
+            "workers": len(self._workers),
+            "busy_workers": len(self._running_jobs),
+            "jobs": counts,
+        }
+
+    async def _worker_loop(self, worker_id: int) -> None:
+        lease_owner = f"{self.instance_id}:{worker_id}"
+        while True:
+            try:
+                job = await self.backend.claim(lease_owner, settings.JOB_LEASE_SECONDS)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Job worker {worker_id} failed to claim a job: {str(e)}")
+                job = None
+
+            if job is None:
+                # Recover jobs whose worker died in another process without waiting for a restart
+                if time.monotonic() - self._last_requeue >= settings.JOB_LEASE_SECONDS:
+                    await self._requeue_stale()
+                await self.backend.wait_for_work(settings.JOB_POLL_INTERVAL_SECONDS)
+                continue
+
+            self._running_jobs[worker_id] = job["job_id"]
+            heartbeat = asyncio.create_task(self._heartbeat(job["job_id"], lease_owner))
+            try:
+                await self._run_job(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # e.g. the backend failed to record the outcome; keep the worker alive
+                logger.exception(f"Job worker {worker_id} failed while running job {job['job_id']}: {str(e)}")
+            finally:
+                heartbeat.cancel()
+                await asyncio.gather(heartbeat, return_exceptions=True)
+                self._running_jobs.pop(worker_id, None)
+
+    async def _requeue_stale(self) -> None:
+        """Return jobs with an expired lease to the queue (at startup, then once per lease period)."""
+        self._last_requeue = time.monotonic()
+        try:
+            requeued = await self.backend.requeue_stale(settings.JOB_STALE_AFTER_SECONDS)
+        except Exception as e:
+            logger.error(f"Failed to requeue interrupted jobs: {str(e)}")
+            return
+        if requeued:
+            logger.info(f"Requeued {requeued} interrupted job(s)")
+
+    async def _heartbeat(self, job_id: str, lease_owner: str) -> None:
+        """Extend the job's lease every JOB_HEARTBEAT_SECONDS until cancelled."""
+        while True:
+            await asyncio.sleep(settings.JOB_HEARTBEAT_SECONDS)
+            try:
+                if not await self.backend.heartbeat(job_id, lease_owner, settings.JOB_LEASE_SECONDS):
+                    logger.warning(f"Job {job_id} lease lost by {lease_owner} (requeued elsewhere?)")
+                    return
+            except Exception as e:
+                logger.error(f"Job {job_id} heartbeat failed: {str(e)}")
+
+    async def _run_job(self, job: Dict[str, Any]) -> None:
+        job_id = job["job_id"]
+        logger.info(f"Job {job_id} started")
+
+        async def report_progress(stage: str, progress: float) -> None:
+            # Progress is informational: a failed write must not fail the job
+            try:
+                await self.backend.update(job_id, stage=stage, progress=progress)
+            except Exception as e:
+                logger.error(f"Job {job_id} progress update failed: {str(e)}")
+
+        try:
+            # Batch jobs (POST /generate/batch) carry a list of brands instead of a name
+            run = orchestrator_service.generate_batch if "brands" in job["params"] else orchestrator_service.generate_podcast
+            result = await run(
+                **job["params"],
+                progress_callback=report_progress
+            )
+            error = result.get("error")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.exception(f"Job {job_id} crashed: {str(e)}")
+            result, error = None, str(e)
+
+        succeeded = bool(result) and result.get("status") == "success"
+        record_generation("batch" if "brands" in job["params"] else "podcast", "success" if succeeded else "error")
+        fields = {
+            "status": "succeeded" if succeeded else "failed",
+            "stage": "done" if succeeded else "failed",
+            "result": result,
+            "error": error,
+            "finished_at": datetime.now().isoformat(),
+            "lease_expires_at": None,
+        }
+        if succeeded:
+            fields["progress"] = 1.0
+        await self.backend.update(job_id, **fields)
+        logger.info(f"Job {job_id} {'succeeded' if succeeded else 'failed'}")
+
+
+# Global instance
+job_service = JobService()
@@ -1,13 +1,30 @@
 import os
 import json
+import asyncio
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Callable, Awaitable
 
 from app.core.config import settings
 from app.core.logger import logger
+from app.core.metrics import RequestTimings, start_request_timings, stage_timer
 from app.services.unified_agent.service import unified_agent_service
 from app.services.podcast.service import podcast_service
-from app.services.podcast.script_splitting import split_podcast_scripts, validate_script_chunks
+from app.services.podcast.script_splitting import (
+    IncrementalScriptSplitter,
+    split_podcast_scripts,
+    validate_script_chunks,
+)
+from app.services.podcast.branding import ensure_brand_placeholder, fill_brand, split_branded_template
+from app.services.scripts.renders import render_store
+from app.services.scripts.store import script_store
+from app.services.storage.backends import storage_backend
+from app.services.unified_agent.prompt_builder import (
+    BRAND_PLACEHOLDER,
+    PROMPT_VERSION,
+    SCRIPT_KEYS,
+    SCRIPT_LANGUAGES,
+    resolve_languages,
+)
 
 
 class OrchestratorService:
@@ -15,20 +32,32 @@ class OrchestratorService:
     Main orchestration service for podcast generation.
     
     Workflow:
-    1. Generate podcast scripts (English + Hindi) using agent
+    1. Generate podcast scripts using agent (only the languages to be voiced)
     2. Split scripts into chunks for Sarvam TTS
     3. Generate audio based on selected language:
        - "en" → English audio only
        - "hi" → Hindi audio only
        - "both" → Both English and Hindi audio
     4. Return results with generated scripts and audio files
+    
+    Scripts are persisted with a script_id, so render_script can re-voice
+    an episode later without re-running the agent.
+    
+    With AGENT_STREAMING_ENABLED, steps 1-3 overlap: agent output is
+    cleaned, split and sent to TTS as it streams in, so English audio is
+    synthesized while the Hindi script is still being written.
     """
 
+    DEFAULT_SPEAKERS = {"en": "sachit", "hi": "anushka"}
+
     async def generate_podcast(
         self,
         name: str,
         voice_agent: Optional[str] = None,
-        language: str = "both"
+        language: str = "both",
+        progress_callback: Optional[Callable[[str, float], Awaitable[None]]] = None,
+        scripts: Optional[Dict[str, str]] = None,
+        script_chunks: Optional[Dict[str, List[str]]] = None
     ) -> Dict[str, Any]:
         """
         Main orchestration pipeline for podcast generation.
@@ -40,6 +69,17 @@ class OrchestratorService:
                      - "en": English audio only
                      - "hi": Hindi audio only
                      - "both": Both English and Hindi audio (default)
+            progress_callback: Optional async callable(stage, progress) invoked
+                     as each step starts (used by background jobs)
+            scripts: Optional {"eng_pod": ..., "hin_pod": ...} from an earlier
+                     attempt. Skips the agent step so a retried job only
+                     re-synthesizes chunks missing from the TTS cache.
+            script_chunks: Optional {"en": [...], "hi": [...]} chunks the
+                     scripts were voiced with (streamed attempts split them
+                     incrementally); reused so the TTS cache keys match.
+        
+        Only the scripts for `language` are generated: for "en" the result
+        has scripts["hin_pod"] = None (and vice versa).
         
         Returns:
             Dictionary with generated podcast scripts and audio paths:
@@ -48,6 +88,7 @@ class OrchestratorService:
                 "date": "2026-02-26",
                 "name": "Nippon India Financial",
                 "language": "en",
+                "script_id": "9c1e4f0a2b7d3e5f6a8b0c1d",
                 "scripts": {
                     "eng_pod": "...",
                     "hin_pod": "..."
@@ -65,10 +106,14 @@ class OrchestratorService:
                     "eng_pod_count": 3,
                     "hin_pod_count": 3
                 },
+                "timings": {"agent": 38.4, "splitting": 0.01, "tts": {"en": 21.4, "hi": 23.9}, "total": 64.2},
                 "error": None
             }
         """
         yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+        generated_scripts = None
+        script_id = None
+        timings = start_request_timings()
         
         try:
             # Validate language parameter
@@ -90,58 +135,97 @@ class OrchestratorService:
             logger.info(f"Date: {yesterday}")
             logger.info("=" * 70)
 
+            languages = resolve_languages(language)
+            resume = bool(scripts) and all(scripts.get(SCRIPT_KEYS[lang]) for lang in languages)
+
+            if settings.AGENT_STREAMING_ENABLED and not resume:
+                return await self._generate_podcast_streaming(
+                    name, voice_agent, language, progress_callback, yesterday, timings
+                )
+
             # ===== STEP 1: GENERATE SCRIPTS =====
+            await self._report_progress(progress_callback, "generating_scripts", 0.05)
             logger.info("\n[STEP 1/4] GENERATING PODCAST SCRIPTS")
             logger.info("-" * 70)
-            logger.info(f"Using unified agent to generate English and Hindi scripts...")
 
-            scripts_result = await unified_agent_service.process_podcast_request(
-                target_date=yesterday,
-                attribution=name
-            )
+            if resume:
+                logger.info("Reusing scripts from the previous attempt (resuming audio generation)...")
+                eng_script = scripts.get("eng_pod")
+                hin_script = scripts.get("hin_pod")
+            else:
+                logger.info(f"Using unified agent to generate scripts for: {', '.join(languages)}...")
 
-            if not scripts_result.get("success"):
-                error_msg = scripts_result.get("error", "Agent failed")
-                logger.error(f"Script generation failed: {error_msg}")
-                return self._error_response(error_msg, yesterday, name, language)
+                with stage_timer("agent"):
+                    scripts_result = await unified_agent_service.process_podcast_request(
+                        target_date=yesterday,
+                        attribution=name,
+                        languages=languages
+                    )
+
+                if not scripts_result.get("success"):
+                    error_msg = scripts_result.get("error", "Agent failed")
+                    logger.error(f"Script generation failed: {error_msg}")
+                    return self._error_response(error_msg, yesterday, name, language)
 
-            # Extract scripts
-            eng_script = scripts_result.get("eng_pod", "")
-            hin_script = scripts_result.get("hin_pod", "")
+                # Extract scripts
+                eng_script = scripts_result.get("eng_pod")
+                hin_script = scripts_result.get("hin_pod")
 
-            if not eng_script or not hin_script:
-                error_msg = "Agent did not return both English and Hindi scripts"
-                logger.error(error_msg)
-                return self._error_response(error_msg, yesterday, name, language)
+                if not all(scripts_result.get(SCRIPT_KEYS[lang]) for lang in languages):
+                    error_msg = "Agent did not return the requested scripts"
+                    logger.error(error_msg)
+                    return self._error_response(error_msg, yesterday, name, language)
 
-            logger.info(f"✓ English script generated: {len(eng_script)} characters")
-            logger.info(f"✓ Hindi script generated: {len(hin_script)} characters")
+                # Save raw data for audit
+                logger.info("\nSaving raw data for audit...")
+                await self._save_raw_data(scripts_result, yesterday, name)
+                logger.info("✓ Raw data saved")
 
-            # Save raw data for audit
-            logger.info("\nSaving raw data for audit...")
-            self._save_raw_data(scripts_result, yesterday, name)
-            logger.info("✓ Raw data saved")
+            generated_scripts = {"eng_pod": eng_script, "hin_pod": hin_script}
+            self._log_script_lengths(generated_scripts)
+            script_id = await script_store.save(
+                generated_scripts,
+                yesterday,
+                name,
+                metadata={"prompt_version": PROMPT_VERSION}
+            )
 
             # ===== STEP 2: SPLIT SCRIPTS INTO CHUNKS =====
+            await self._report_progress(progress_callback, "splitting_scripts", 0.4)
             logger.info("\n[STEP 2/4] SPLITTING SCRIPTS INTO CHUNKS")
             logger.info("-" * 70)
-            logger.info("Splitting both scripts into chunks for Sarvam TTS (max 500 chars)...")
+            logger.info("Splitting scripts into chunks for Sarvam TTS (max 500 chars)...")
 
-            chunks = split_podcast_scripts(
-                eng_script=eng_script,
-                hin_script=hin_script,
-                max_length=500
-            )
+            # A resumed script is voiced with the chunks of the earlier attempt
+            stored_chunks = {
+                lang: list(lang_chunks)
+                for lang, lang_chunks in (script_chunks or {}).items()
+                if lang in languages and lang_chunks
+            }
+
+            with stage_timer("splitting"):
+                chunks = split_podcast_scripts(
+                    eng_script=eng_script if "en" in languages and "en" not in stored_chunks else None,
+                    hin_script=hin_script if "hi" in languages and "hi" not in stored_chunks else None,
+                    max_length=500
+                )
+
+            for lang, lang_chunks in stored_chunks.items():
+                logger.info(f"Reusing {len(lang_chunks)} {lang} chunks from the previous attempt")
+                chunks[f"{SCRIPT_KEYS[lang]}_chunks"] = lang_chunks
+                chunks[f"{SCRIPT_KEYS[lang]}_count"] = len(lang_chunks)
+            chunks["total_chunks"] = chunks["eng_pod_count"] + chunks["hin_pod_count"]
 
-            if not validate_script_chunks(chunks):
+            if not validate_script_chunks(chunks, languages):
                 error_msg = "Script chunk validation failed"
                 logger.error(error_msg)
-                return self._error_response(error_msg, yesterday, name, language)
+                return self._error_response(error_msg, yesterday, name, language, scripts=generated_scripts, script_id=script_id)
 
             logger.info(f"✓ English chunks: {chunks['eng_pod_count']}")
             logger.info(f"✓ Hindi chunks: {chunks['hin_pod_count']}")
 
             # ===== STEP 3: GENERATE AUDIO BASED ON LANGUAGE =====
+            await self._report_progress(progress_callback, "generating_audio", 0.45)
             logger.info("\n[STEP 3/4] GENERATING PODCAST AUDIO")
             logger.info("-" * 70)
 
@@ -156,16 +240,17 @@ class OrchestratorService:
                 eng_audio_path = await podcast_service.generate_audio_from_script(
                     script=eng_script,
                     sarvam_api_key=settings.SARVAM_API_KEY,
-                    tts_url="https://api.sarvam.ai/text-to-speech",
+                    tts_url=podcast_service.tts_url,
                     language="en",
                     output_format="mp3",
-                    speaker=eng_speaker
+                    speaker=eng_speaker,
+                    chunks=chunks["eng_pod_chunks"]
                 )
 
                 if not eng_audio_path:
                     error_msg = "Failed to generate English audio"
                     logger.error(error_msg)
-                    return self._error_response(error_msg, yesterday, name, language)
+                    return self._error_response(error_msg, yesterday, name, language, scripts=generated_scripts, script_id=script_id)
 
                 audio_paths = {
                     "eng_pod_audio": eng_audio_path,
@@ -181,16 +266,17 @@ class OrchestratorService:
                 hin_audio_path = await podcast_service.generate_audio_from_script(
                     script=hin_script,
                     sarvam_api_key=settings.SARVAM_API_KEY,
-                    tts_url="https://api.sarvam.ai/text-to-speech",
+                    tts_url=podcast_service.tts_url,
                     language="hi",
                     output_format="mp3",
-                    speaker=hin_speaker
+                    speaker=hin_speaker,
+                    chunks=chunks["hin_pod_chunks"]
                 )
 
                 if not hin_audio_path:
                     error_msg = "Failed to generate Hindi audio"
                     logger.error(error_msg)
-                    return self._error_response(error_msg, yesterday, name, language)
+                    return self._error_response(error_msg, yesterday, name, language, scripts=generated_scripts, script_id=script_id)
 
                 audio_paths = {
                     "eng_pod_audio": None,
@@ -209,16 +295,18 @@ class OrchestratorService:
                     eng_script=eng_script,
                     hin_script=hin_script,
                     sarvam_api_key=settings.SARVAM_API_KEY,
-                    tts_url="https://api.sarvam.ai/text-to-speech",
+                    tts_url=podcast_service.tts_url,
                     output_format="mp3",
                     eng_speaker=eng_speaker,
-                    hin_speaker=hin_speaker
+                    hin_speaker=hin_speaker,
+                    eng_chunks=chunks["eng_pod_chunks"],
+                    hin_chunks=chunks["hin_pod_chunks"]
                 )
 
                 if not audio_result or not audio_result.get("success"):
                     error_msg = "Failed to generate audio"
                     logger.error(error_msg)
-                    return self._error_response(error_msg, yesterday, name, language)
+                    return self._error_response(error_msg, yesterday, name, language, scripts=generated_scripts, script_id=script_id)
 
                 audio_paths = {
                     "eng_pod_audio": audio_result.get("eng_pod_audio"),
@@ -226,70 +314,772 @@ class OrchestratorService:
                 }
                 logger.info(f"✓ English audio: {audio_paths['eng_pod_audio']}")
                 logger.info(f"✓ Hindi audio: {audio_paths['hin_pod_audio']}")
+                logger.info(f"✓ Audio timings (s): {audio_result.get('timings')}")
 
             # ===== STEP 4: COMPILE RESULTS =====
-            logger.info("\n[STEP 4/4] COMPILING RESULTS")
-            logger.info("-" * 70)
+            await self._report_progress(progress_callback, "compiling_results", 0.95)
+            return self._compile_result(
+                name,
+                voice_agent,
+                language,
+                yesterday,
+                script_id,
+                generated_scripts,
+                audio_paths,
+                {"eng_pod_count": chunks['eng_pod_count'], "hin_pod_count": chunks['hin_pod_count']},
+                timings.as_dict()
+            )
+
+        except Exception as e:
+            logger.exception(f"Orchestrator pipeline failed: {str(e)}")
+            return self._error_response(str(e), yesterday, name, language, scripts=generated_scripts, script_id=script_id)
+
+    async def _generate_podcast_streaming(
+        self,
+        name: str,
+        voice_agent: Optional[str],
+        language: str,
+        progress_callback: Optional[Callable[[str, float], Awaitable[None]]],
+        yesterday: str,
+        timings: RequestTimings
+    ) -> Dict[str, Any]:
+        """
+        Steps 1-3 of generate_podcast with the agent output streamed.
+        
+        Each requested language gets a chunk queue fed by an
+        IncrementalScriptSplitter and a TTS task consuming it. The English
+        queue is closed as soon as the Hindi marker appears, so its audio
+        can finish while Hindi is still being generated.
+        
+        The incremental splitter packs differently from split_script, so the
+        streamed chunks are stored with the script record (and kept in an
+        error result for job retries): resumes and re-renders voice the same
+        chunks and hit the TTS cache.
+        """
+        targets = resolve_languages(language)
+        speakers = {lang: voice_agent or self.DEFAULT_SPEAKERS[lang] for lang in targets}
+        splitters = {lang: IncrementalScriptSplitter(max_length=500, language=lang) for lang in targets}
+        queues: Dict[str, asyncio.Queue] = {lang: asyncio.Queue() for lang in targets}
+        streamed_chunks: Dict[str, List[str]] = {lang: [] for lang in targets}
+        closed = set()
+
+        async def chunk_source(lang: str):
+            while True:
+                chunk = await queues[lang].get()
+                if chunk is None:
+                    return
+                yield chunk
+
+        def push(lang: str, chunks: List[str]):
+            for chunk in chunks:
+                queues[lang].put_nowait(chunk)
+            streamed_chunks[lang].extend(chunks)
+
+        def close(lang: str):
+            if lang in closed:
+                return
+            closed.add(lang)
+            push(lang, splitters[lang].close())
+            queues[lang].put_nowait(None)
+            logger.info(f"✓ {lang} script complete — {len(streamed_chunks[lang])} chunks queued for TTS")
+
+        await self._report_progress(progress_callback, "generating_scripts", 0.05)
+        logger.info("\n[STEP 1-3/4] STREAMING SCRIPTS INTO CHUNKING AND TTS")
+        logger.info("-" * 70)
+
+        audio_tasks = {
+            lang: asyncio.create_task(
+                podcast_service.generate_audio_from_chunk_stream(
+                    chunk_source=chunk_source(lang),
+                    sarvam_api_key=settings.SARVAM_API_KEY,
+                    tts_url=podcast_service.tts_url,
+                    language=lang,
+                    output_format="mp3",
+                    speaker=speakers[lang]
+                )
+            )
+            for lang in targets
+        }
+
+        scripts_result: Dict[str, Any] = {}
+        try:
+            # Splitting and TTS run inside this stage as the text streams in
+            with stage_timer("agent"):
+                async for event in unified_agent_service.stream_podcast_request(
+                    target_date=yesterday,
+                    attribution=name,
+                    languages=targets
+                ):
+                    lang = event.get("language")
+                    if event["type"] == "text" and lang in splitters and lang not in closed:
+                        push(lang, splitters[lang].feed(event["text"]))
+                    elif event["type"] == "end" and lang in splitters:
+                        close(lang)
+                    elif event["type"] == "result":
+                        scripts_result = event["result"]
+        except BaseException:
+            for task in audio_tasks.values():
+                task.cancel()
+            await asyncio.gather(*audio_tasks.values(), return_exceptions=True)
+            raise
+
+        if not scripts_result.get("success"):
+            # Partial scripts failed validation; drop the audio started from them
+            for task in audio_tasks.values():
+                task.cancel()
+            await asyncio.gather(*audio_tasks.values(), return_exceptions=True)
+            error_msg = scripts_result.get("error", "Agent failed")
+            logger.error(f"Script generation failed: {error_msg}")
+            return self._error_response(error_msg, yesterday, name, language)
+
+        for lang in targets:
+            close(lang)
+
+        generated_scripts = {"eng_pod": scripts_result.get("eng_pod"), "hin_pod": scripts_result.get("hin_pod")}
+        self._log_script_lengths(generated_scripts)
+
+        await self._save_raw_data(scripts_result, yesterday, name)
+        script_id = await script_store.save(
+            generated_scripts,
+            yesterday,
+            name,
+            metadata={"prompt_version": PROMPT_VERSION, "chunks": streamed_chunks}
+        )
+
+        await self._report_progress(progress_callback, "generating_audio", 0.45)
+        logger.info("Waiting for streamed audio to finish...")
+        with stage_timer("audio_tail"):
+            audio_results = await asyncio.gather(*audio_tasks.values(), return_exceptions=True)
+
+        audio_paths = {"eng_pod_audio": None, "hin_pod_audio": None}
+        for lang, audio_path in zip(audio_tasks, audio_results):
+            if isinstance(audio_path, Exception) or not audio_path:
+                error_msg = f"Failed to generate {'English' if lang == 'en' else 'Hindi'} audio"
+                logger.error(error_msg)
+                return self._error_response(
+                    error_msg, yesterday, name, language,
+                    scripts=generated_scripts, script_id=script_id, script_chunks=streamed_chunks
+                )
+            audio_paths["eng_pod_audio" if lang == "en" else "hin_pod_audio"] = audio_path
+
+        await self._report_progress(progress_callback, "compiling_results", 0.95)
+        return self._compile_result(
+            name,
+            voice_agent,
+            language,
+            yesterday,
+            script_id,
+            generated_scripts,
+            audio_paths,
+            {"eng_pod_count": len(streamed_chunks.get("en", [])), "hin_pod_count": len(streamed_chunks.get("hi", []))},
+            timings.as_dict()
+        )
+
+    def _log_script_lengths(self, scripts: Dict[str, Optional[str]]):
+        if scripts.get("eng_pod"):
+            logger.info(f"✓ English script: {len(scripts['eng_pod'])} characters")
+        if scripts.get("hin_pod"):
+            logger.info(f"✓ Hindi script: {len(scripts['hin_pod'])} characters")
 
-            result = {
+    def _compile_result(
+        self,
+        name: str,
+        voice_agent: Optional[str],
+        language: str,
+        date: str,
+        script_id: Optional[str],
+        scripts: Dict[str, str],
+        audio_paths: Dict[str, Optional[str]],
+        chunk_counts: Dict[str, int],
+        timings: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Build the success result of generate_podcast (step 4)"""
+        logger.info("\n[STEP 4/4] COMPILING RESULTS")
+        logger.info("-" * 70)
+
+        eng_script = scripts["eng_pod"] or ""
+        hin_script = scripts["hin_pod"] or ""
+
+        result = {
+            "status": "success",
+            "date": date,
+            "name": name,
+            "attribution": name,
+            "language": language,
+            "script_id": script_id,
+            "scripts": scripts,
+            "script_lengths": {
+                "eng_pod": len(eng_script),
+                "hin_pod": len(hin_script),
+                "total": len(eng_script) + len(hin_script)
+            },
+            "audio": audio_paths,
+            "speaker": voice_agent or ("sachit" if language == "en" else "anushka"),
+            "chunks": {
+                "eng_pod_count": chunk_counts["eng_pod_count"],
+                "hin_pod_count": chunk_counts["hin_pod_count"],
+                "total": chunk_counts["eng_pod_count"] + chunk_counts["hin_pod_count"]
+            },
+            "timings": timings,
+            "error": None,
+            "timestamp": datetime.now().isoformat()
+        }
+
+        logger.info("\n" + "=" * 70)
+        logger.info("✓ PODCAST GENERATION COMPLETE")
+        logger.info("=" * 70)
+        logger.info(f"Status: Success")
+        logger.info(f"Language: {language}")
+        logger.info(f"Timings (s): {timings}")
+        
+        if language == "en" or language == "both":
+            logger.info(f"English Audio: {audio_paths['eng_pod_audio']}")
+        
+        if language == "hi" or language == "both":
+            logger.info(f"Hindi Audio: {audio_paths['hin_pod_audio']}")
+        
+        logger.info("=" * 70 + "\n")
+
+        return result
+
+    async def open_audio_stream(
+        self,
+        name: str,
+        voice_agent: Optional[str] = None,
+        language: str = "en",
+        output_format: str = "mp3"
+    ) -> Dict[str, Any]:
+        """
+        Generate the script for a single language and open a progressive
+        audio stream of it ("mp3" via ffmpeg pipe, or "wav").
+        
+        The stream is primed before returning: the first item is only
+        produced once chunk 1 has come back from Sarvam, so TTS failures on
+        the first chunk surface as an error response instead of a broken
+        stream.
+        
+        Returns:
+            {"status": "success", "stream": <async iterator of bytes>, "media_type": "audio/mpeg", ...}
+            or a standard error response
+        """
+        yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+
+        if language not in ["en", "hi"]:
+            return self._error_response(
+                f"Invalid language for streaming: {language}. Use 'en' or 'hi'",
+                yesterday,
+                name,
+                language
+            )
+
+        try:
+            scripts_result = await unified_agent_service.process_podcast_request(
+                target_date=yesterday,
+                attribution=name,
+                languages=(language,)
+            )
+
+            if not scripts_result.get("success"):
+                return self._error_response(scripts_result.get("error", "Agent failed"), yesterday, name, language)
+
+            script = scripts_result.get("eng_pod" if language == "en" else "hin_pod", "")
+            if not script:
+                return self._error_response("Agent did not return a script", yesterday, name, language)
+
+            await self._save_raw_data(scripts_result, yesterday, name)
+
+            speaker = voice_agent or ("sachit" if language == "en" else "anushka")
+            stream = podcast_service.stream_audio_from_script(
+                script=script,
+                sarvam_api_key=settings.SARVAM_API_KEY,
+                tts_url=podcast_service.tts_url,
+                language=language,
+                speaker=speaker,
+                output_format=output_format
+            )
+
+            # Wait for chunk 1 so the response only starts once audio is flowing
+            first_bytes = await stream.__anext__()
+
+            async def primed_stream():
+                yield first_bytes
+                async for data in stream:
+                    yield data
+
+            logger.info(f"✓ Audio stream opened for {name} ({language})")
+            return {
                 "status": "success",
                 "date": yesterday,
                 "name": name,
-                "attribution": name,
                 "language": language,
-                "scripts": {
-                    "eng_pod": eng_script,
-                    "hin_pod": hin_script
-                },
-                "script_lengths": {
-                    "eng_pod": len(eng_script),
-                    "hin_pod": len(hin_script),
-                    "total": len(eng_script) + len(hin_script)
-                },
-                "audio": audio_paths,
-                "speaker": voice_agent or ("sachit" if language == "en" else "anushka"),
-                "chunks": {
-                    "eng_pod_count": chunks['eng_pod_count'],
-                    "hin_pod_count": chunks['hin_pod_count'],
-                    "total": chunks['total_chunks']
-                },
-                "error": None,
+                "speaker": speaker,
+                "media_type": podcast_service.stream_media_type(output_format),
+                "stream": primed_stream()
+            }
+
+        except Exception as e:
+            logger.exception(f"Failed to open audio stream: {str(e)}")
+            return self._error_response(str(e), yesterday, name, language)
+
+    async def render_script(
+        self,
+        script_id: str,
+        targets: List[Dict[str, Optional[str]]],
+        output_format: str = "mp3"
+    ) -> Dict[str, Any]:
+        """
+        Render a stored script to one or more (language, speaker) targets.
+        
+        Targets are synthesized concurrently and no research is run, so
+        re-voicing an episode only costs TTS (and chunks already in the
+        TTS cache cost nothing). Each render is stored with its per-chunk
+        manifest so an edited script can be re-rendered incrementally
+        (see rerender_script).
+        
+        Args:
+            script_id: Id returned in the generate result
+            targets: [{"language": "en" | "hi", "speaker": "sachit" | None}, ...]
+            output_format: "mp3" or "wav"
+        
+        Returns:
+            {
+                "status": "success",
+                "script_id": "...",
+                "renders": [
+                    {"language": "en", "speaker": "sachit", "audio": "/audio/...", "error": None},
+                    ...
+                ],
+                "error": None
+            }
+        """
+        record = await script_store.get(script_id)
+        if not record:
+            return {
+                "status": "error",
+                "script_id": script_id,
+                "renders": [],
+                "error": "Script not found",
                 "timestamp": datetime.now().isoformat()
             }
 
+        async def render(target: Dict[str, Optional[str]]) -> Dict[str, Any]:
+            language = target["language"]
+            speaker = target.get("speaker") or self.DEFAULT_SPEAKERS[language]
+            script = record["scripts"].get(SCRIPT_KEYS[language])
+            if not script:
+                return {
+                    "language": language,
+                    "speaker": speaker,
+                    "audio": None,
+                    "error": f"Script {script_id} has no {language} script"
+                }
+
+            audio_path = await self._render_tracked(
+                script_id, script, language, speaker, output_format,
+                chunks=record.get("metadata", {}).get("chunks", {}).get(language)
+            )
+            return {
+                "language": language,
+                "speaker": speaker,
+                "audio": audio_path,
+                "error": None if audio_path else f"Failed to generate {language} audio for {speaker}"
+            }
+
+        logger.info(f"Rendering script {script_id} to {len(targets)} target(s)...")
+        renders = await asyncio.gather(*(render(target) for target in targets), return_exceptions=True)
+
+        for i, render_result in enumerate(renders):
+            if isinstance(render_result, Exception):
+                logger.error(f"Render of script {script_id} failed: {str(render_result)}")
+                renders[i] = {
+                    "language": targets[i]["language"],
+                    "speaker": targets[i].get("speaker"),
+                    "audio": None,
+                    "error": str(render_result)
+                }
+
+        failed = [r for r in renders if r["error"]]
+        if failed:
+            logger.error(f"{len(failed)}/{len(renders)} render(s) of script {script_id} failed")
+        else:
+            logger.info(f"✓ Script {script_id} rendered to {len(renders)} target(s)")
+
+        return {
+            "status": "error" if failed else "success",
+            "script_id": script_id,
+            "renders": renders,
+            "error": "; ".join(r["error"] for r in failed) or None,
+            "timestamp": datetime.now().isoformat()
+        }
+
+    async def rerender_script(
+        self,
+        script_id: str,
+        language: str,
+        script: str,
+        speaker: Optional[str] = None,
+        output_format: str = "mp3"
+    ) -> Dict[str, Any]:
+        """
+        Re-render an edited script, synthesizing only the changed chunks.
+        
+        The edited text is aligned against the chunks of the stored render
+        of (script_id, language, speaker): unchanged chunks are spliced from
+        that render's PCM and only the edited sentences go to TTS. The
+        edited script is stored as a new script (its script_id is returned)
+        with its own render, so later corrections chain from it.
+        
+        Scripts without a stored render (e.g. from POST /generate) get one
+        rebuilt from the TTS cache first, which costs no new synthesis for
+        chunks that were voiced before.
+        
+        Returns:
+            {
+                "status": "success",
+                "script_id": "<id of the edited script>",
+                "previous_script_id": "<script_id>",
+                "language": "en",
+                "speaker": "sachit",
+                "audio": "/audio/podcast_en_....mp3",
+                "chunks": {"reused": 11, "synthesized": 1, "total": 12},
+                "error": None
+            }
+        """
+        speaker = speaker or self.DEFAULT_SPEAKERS[language]
+
+        def rerender_error(error_msg: str) -> Dict[str, Any]:
+            return {
+                "status": "error",
+                "script_id": None,
+                "previous_script_id": script_id,
+                "language": language,
+                "speaker": speaker,
+                "audio": None,
+                "chunks": None,
+                "error": error_msg,
+                "timestamp": datetime.now().isoformat()
+            }
+
+        record = await script_store.get(script_id)
+        if not record:
+            return rerender_error("Script not found")
+        old_script = record["scripts"].get(SCRIPT_KEYS[language])
+        if not old_script:
+            return rerender_error(f"Script {script_id} has no {language} script")
+
+        stored = await render_store.get(script_id, language, speaker)
+        if stored is None:
+            logger.info(f"No stored render of {script_id} ({language}, {speaker}) — rebuilding baseline")
+            baseline = await podcast_service.render_script_incremental(
+                script=old_script,
+                sarvam_api_key=settings.SARVAM_API_KEY,
+                tts_url=podcast_service.tts_url,
+                language=language,
+                speaker=speaker,
+                output_format=None,
+                chunks=record.get("metadata", {}).get("chunks", {}).get(language)
+            )
+            if not baseline:
+                return rerender_error(f"Failed to render the current {language} script")
+            await render_store.save(script_id, language, speaker, baseline["manifest"], baseline["master"])
+            stored = (baseline["manifest"], baseline["master"])
+
+        previous, previous_master = stored
+        rendered = await podcast_service.render_script_incremental(
+            script=script,
+            sarvam_api_key=settings.SARVAM_API_KEY,
+            tts_url=podcast_service.tts_url,
+            language=language,
+            speaker=speaker,
+            output_format=output_format,
+            previous=previous,
+            previous_master=previous_master
+        )
+        if not rendered:
+            return rerender_error(f"Failed to re-render {language} audio for {speaker}")
+
+        edited_scripts = dict(record["scripts"])
+        edited_scripts[SCRIPT_KEYS[language]] = script
+        # Streamed chunks describe the original text; the edit has its own render
+        metadata = {key: value for key, value in record.get("metadata", {}).items() if key != "chunks"}
+        new_script_id = await script_store.save(
+            edited_scripts,
+            record["date"],
+            record["attribution"],
+            metadata={**metadata, "edited_from": script_id}
+        )
+        await render_store.save(new_script_id, language, speaker, rendered["manifest"], rendered["master"])
+
+        logger.info(
+            f"✓ Script {script_id} re-rendered as {new_script_id} "
+            f"({rendered['synthesized']} chunk(s) synthesized, {rendered['reused']} reused)"
+        )
+        return {
+            "status": "success",
+            "script_id": new_script_id,
+            "previous_script_id": script_id,
+            "language": language,
+            "speaker": speaker,
+            "audio": rendered["audio"],
+            "chunks": {
+                "reused": rendered["reused"],
+                "synthesized": rendered["synthesized"],
+                "total": rendered["reused"] + rendered["synthesized"]
+            },
+            "error": None,
+            "timestamp": datetime.now().isoformat()
+        }
+
+    async def _render_tracked(
+        self,
+        script_id: str,
+        script: str,
+        language: str,
+        speaker: str,
+        output_format: str,
+        chunks: Optional[List[str]] = None
+    ) -> Optional[str]:
+        """
+        Render a stored script and keep its per-chunk manifest for later
+        incremental re-renders. Chunks of an existing render of the same
+        target are reused; without one, `chunks` (the streamed chunks of
+        the script, if stored) are voiced. Returns the audio path (None if failed).
+        """
+        stored = await render_store.get(script_id, language, speaker)
+        previous, previous_master = stored if stored else (None, None)
+
+        rendered = await podcast_service.render_script_incremental(
+            script=script,
+            sarvam_api_key=settings.SARVAM_API_KEY,
+            tts_url=podcast_service.tts_url,
+            language=language,
+            speaker=speaker,
+            output_format=output_format,
+            previous=previous,
+            previous_master=previous_master,
+            chunks=chunks
+        )
+        if not rendered:
+            return None
+
+        await render_store.save(script_id, language, speaker, rendered["manifest"], rendered["master"])
+        return rendered["audio"]
+
+    async def generate_batch(
+        self,
+        brands: List[Dict[str, Optional[str]]],
+        output_format: str = "mp3",
+        progress_callback: Optional[Callable[[str, float], Awaitable[None]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate the same episode for many podcast names in one pass.
+
+        Research and script writing run ONCE, with BRAND_PLACEHOLDER as the
+        attribution. Each name is then substituted into the scripts; only
+        the branded sentences (the intro) are synthesized per name, while
+        the shared body is synthesized once per (language, speaker) and
+        spliced into every file.
+
+        Args:
+            brands: [{"name": "...", "voice_agent": "sachit" | None, "language": "en" | "hi" | "both"}, ...]
+            output_format: "mp3" or "wav"
+            progress_callback: Optional async callable(stage, progress) (used by background jobs)
+
+        Returns:
+            {
+                "status": "success",
+                "date": "2026-02-26",
+                "results": [
+                    {
+                        "name": "Nippon India Financial",
+                        "language": "en",
+                        "speaker": "sachit",
+                        "script_id": "...",
+                        "audio": {"eng_pod_audio": "/audio/...", "hin_pod_audio": None},
+                        "error": None
+                    },
+                    ...
+                ],
+                "chunks": {"en": {"shared": 9, "branded_segments": 1}, "hi": None},
+                "timings": {"agent": 40.1, "tts": {"en": 18.2}, "total": 61.0},
+                "error": None
+            }
+        """
+        yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+        timings = start_request_timings()
+
+        def batch_error(error_msg: str) -> Dict[str, Any]:
+            return {
+                "status": "error",
+                "date": yesterday,
+                "results": [],
+                "chunks": {},
+                "error": error_msg,
+                "timestamp": datetime.now().isoformat()
+            }
+
+        invalid = [brand["language"] for brand in brands if brand.get("language", "both") not in ["en", "hi", "both"]]
+        if invalid:
+            return batch_error(f"Invalid language: {invalid[0]}. Use 'en', 'hi', or 'both'")
+        if not brands:
+            return batch_error("No podcast names given")
+
+        brand_languages = [resolve_languages(brand.get("language", "both")) for brand in brands]
+        languages = resolve_languages({lang for langs in brand_languages for lang in langs})
+
+        logger.info("=" * 70)
+        logger.info("STARTING BATCH PODCAST GENERATION")
+        logger.info("=" * 70)
+        logger.info(f"Names: {len(brands)}")
+        logger.info(f"Languages: {', '.join(languages)}")
+        logger.info(f"Date: {yesterday}")
+        logger.info("=" * 70)
+
+        try:
+            # ===== STEP 1: ONE SET OF TEMPLATED SCRIPTS =====
+            await self._report_progress(progress_callback, "generating_scripts", 0.05)
+            logger.info("\n[STEP 1/3] GENERATING TEMPLATED SCRIPTS (research once)")
+            logger.info("-" * 70)
+
+            with stage_timer("agent"):
+                scripts_result = await unified_agent_service.process_podcast_request(
+                    target_date=yesterday,
+                    attribution=BRAND_PLACEHOLDER,
+                    languages=languages
+                )
+            if not scripts_result.get("success"):
+                error_msg = scripts_result.get("error", "Agent failed")
+                logger.error(f"Script generation failed: {error_msg}")
+                return batch_error(error_msg)
+            if not all(scripts_result.get(SCRIPT_KEYS[lang]) for lang in languages):
+                return batch_error("Agent did not return the requested scripts")
+
+            await self._save_raw_data(scripts_result, yesterday, "batch")
+            templates = {
+                lang: ensure_brand_placeholder(scripts_result[SCRIPT_KEYS[lang]], lang, yesterday)
+                for lang in languages
+            }
+
+            # ===== STEP 2: SHARED BODY ONCE, BRANDED INTROS PER NAME =====
+            await self._report_progress(progress_callback, "generating_audio", 0.4)
+            logger.info("\n[STEP 2/3] GENERATING SHARED AND BRANDED AUDIO")
+            logger.info("-" * 70)
+
+            segments = {lang: split_branded_template(templates[lang], lang, max_length=500) for lang in languages}
+            members = {
+                lang: [i for i, langs in enumerate(brand_languages) if lang in langs]
+                for lang in languages
+            }
+            language_results = await asyncio.gather(*(
+                podcast_service.generate_branded_audio(
+                    segments=segments[lang],
+                    brands=[
+                        {
+                            "name": brands[i]["name"],
+                            "speaker": brands[i].get("voice_agent") or self.DEFAULT_SPEAKERS[lang]
+                        }
+                        for i in members[lang]
+                    ],
+                    sarvam_api_key=settings.SARVAM_API_KEY,
+                    tts_url=podcast_service.tts_url,
+                    language=lang,
+                    output_format=output_format
+                )
+                for lang in languages
+            ))
+            rendered = {
+                (lang, i): render
+                for lang, renders in zip(languages, language_results)
+                for i, render in zip(members[lang], renders)
+            }
+
+            # ===== STEP 3: STORE SCRIPTS AND COMPILE RESULTS =====
+            await self._report_progress(progress_callback, "compiling_results", 0.95)
+            logger.info("\n[STEP 3/3] COMPILING RESULTS")
+            logger.info("-" * 70)
+
+            results = []
+            for i, brand in enumerate(brands):
+                name = brand["name"]
+                brand_scripts = {
+                    SCRIPT_KEYS[lang]: fill_brand(templates[lang], name) if lang in brand_languages[i] else None
+                    for lang in SCRIPT_LANGUAGES
+                }
+                script_id = await script_store.save(
+                    brand_scripts,
+                    yesterday,
+                    name,
+                    metadata={"prompt_version": PROMPT_VERSION, "batch": True}
+                )
+                renders = [rendered[(lang, i)] for lang in brand_languages[i]]
+                errors = [render["error"] for render in renders if render["error"]]
+                results.append({
+                    "name": name,
+                    "language": brand.get("language", "both"),
+                    "speaker": renders[0]["speaker"],
+                    "script_id": script_id,
+                    "audio": {
+                        "eng_pod_audio": rendered[("en", i)]["audio"] if "en" in brand_languages[i] else None,
+                        "hin_pod_audio": rendered[("hi", i)]["audio"] if "hi" in brand_languages[i] else None
+                    },
+                    "error": "; ".join(errors) or None
+                })
+
+            failed = [result for result in results if result["error"]]
+            chunk_counts = {
+                lang: {
+                    "shared": sum(1 for segment in segments[lang] if not segment["branded"]),
+                    "branded_segments": sum(1 for segment in segments[lang] if segment["branded"])
+                } if lang in languages else None
+                for lang in SCRIPT_LANGUAGES
+            }
+
             logger.info("\n" + "=" * 70)
-            logger.info("✓ PODCAST GENERATION COMPLETE")
-            logger.info("=" * 70)
-            logger.info(f"Status: Success")
-            logger.info(f"Language: {language}")
-            
-            if language == "en" or language == "both":
-                logger.info(f"English Audio: {audio_paths['eng_pod_audio']}")
-            
-            if language == "hi" or language == "both":
-                logger.info(f"Hindi Audio: {audio_paths['hin_pod_audio']}")
-            
+            logger.info(f"✓ BATCH GENERATION COMPLETE — {len(results) - len(failed)}/{len(results)} name(s) succeeded")
             logger.info("=" * 70 + "\n")
 
-            return result
+            return {
+                "status": "error" if failed else "success",
+                "date": yesterday,
+                "results": results,
+                "chunks": chunk_counts,
+                "timings": timings.as_dict(),
+                "error": "; ".join(f"{result['name']}: {result['error']}" for result in failed) or None,
+                "timestamp": datetime.now().isoformat()
+            }
 
         except Exception as e:
-            logger.exception(f"Orchestrator pipeline failed: {str(e)}")
-            return self._error_response(str(e), yesterday, name, language)
+            logger.exception(f"Batch generation failed: {str(e)}")
+            return batch_error(str(e))
 
-    def _save_raw_data(self, data: Any, date_str: str, podcast_name: str):
-        """Save raw generated data for audit and debugging"""
+    async def _report_progress(
+        self,
+        progress_callback: Optional[Callable[[str, float], Awaitable[None]]],
+        stage: str,
+        progress: float
+    ):
+        """Forward stage progress to the caller; never fail the pipeline over it"""
+        if not progress_callback:
+            return
+        try:
+            await progress_callback(stage, progress)
+        except Exception as e:
+            logger.warning(f"Progress callback failed at {stage}: {str(e)}")
+
+    async def _save_raw_data(self, data: Any, date_str: str, podcast_name: str):
+        """Save raw generated data for audit and debugging (written off the event loop)"""
         try:
             timestamp = datetime.now().strftime('%H%M%S')
             filename = f"raw_{podcast_name}_{date_str}_{timestamp}.json"
             filepath = os.path.join(settings.RAW_DATA_STORAGE_PATH, filename)
             
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
-            
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            location = await storage_backend.write(
+                filepath,
+                json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8"),
+                content_type="application/json"
+            )
             
-            logger.debug(f"Raw data saved: {filepath}")
+            logger.debug(f"Raw data saved: {location}")
         except Exception as e:
             logger.error(f"Failed to save raw data: {str(e)}")
 
@@ -298,15 +1088,23 @@ class OrchestratorService:
         error_msg: str,
         date: str,
         name: str,
-        language: str = "both"
+        language: str = "both",
+        scripts: Optional[Dict[str, str]] = None,
+        script_id: Optional[str] = None,
+        script_chunks: Optional[Dict[str, List[str]]] = None
     ) -> Dict[str, Any]:
-        """Generate standardized error response"""
-        return {
+        """
+        Generate standardized error response.
+        Scripts produced before the failure (and the chunks they were
+        streamed to TTS with) are kept so a retry can resume from them.
+        """
+        response = {
             "status": "error",
             "date": date,
             "name": name,
             "language": language,
-            "scripts": {
+            "script_id": script_id,
+            "scripts": scripts or {
                 "eng_pod": None,
                 "hin_pod": None
             },
@@ -317,6 +1115,9 @@ class OrchestratorService:
             "error": error_msg,
             "timestamp": datetime.now().isoformat()
         }
+        if script_chunks:
+            response["script_chunks"] = script_chunks
+        return response
 
 
 # Global instance
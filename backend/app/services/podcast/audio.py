@@ -1,9 +1,13 @@
 # services/podcast/audio.py
 import os
+import time
+import uuid
+import asyncio
 import base64
 import io
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Any, AsyncIterator, Tuple
 
 try:
     import httpx
@@ -13,8 +17,29 @@ except ImportError:
 
 from app.core.config import settings
 from app.core.logger import logger
+from app.services.storage.backends import storage_backend
+from app.core.metrics import (
+    observe_stage,
+    record_tts_chunk,
+    record_tts_request,
+    record_tts_retry,
+    stage_timer,
+)
 
 from .ffmpeg_check import PYDUB_AVAILABLE
+from .rate_limit import get_rate_limiter
+from .resilience import (
+    RETRYABLE_STATUS_CODES,
+    CircuitOpenError,
+    backoff_delay,
+    parse_retry_after,
+    sarvam_circuit_breaker,
+)
+from .sarvam_client import SarvamTTSClient
+from .tts_cache import tts_chunk_cache
+from .executor import audio_executor
+from .encoder import FFmpegPipeEncoder, encode_wav_to_mp3, stream_wav_as_mp3
+from .wav_utils import parse_wav, same_format, build_wav_header, concat_wav, WavFormatError
 from .script_splitting import split_podcast_scripts, get_script_chunk
 
 try:
@@ -24,10 +49,615 @@ except ImportError:
     pass
 
 
+@asynccontextmanager
+async def sarvam_client_scope(
+    sarvam_client: Optional[SarvamTTSClient],
+    sarvam_api_key: str,
+    tts_url: str,
+) -> AsyncIterator[SarvamTTSClient]:
+    """
+    Yield the shared pooled client when one is given; otherwise open a
+    temporary client for the duration of the call.
+    """
+    if sarvam_client is not None:
+        if not sarvam_client.is_open:
+            await sarvam_client.start()
+        yield sarvam_client
+        return
+
+    async with SarvamTTSClient(api_key=sarvam_api_key, tts_url=tts_url) as client:
+        yield client
+
+
+class TTSChunkError(Exception):
+    """Raised when Sarvam TTS fails to return audio for a single chunk."""
+
+
+class TTSBatchRejectedError(TTSChunkError):
+    """Raised when Sarvam refuses the shape of a multi-input request (see BATCH_REJECTED_STATUS_CODES)."""
+
+
+# Statuses that mean the batched payload itself was refused (bad request,
+# too large, invalid inputs). Others (401/403 auth or quota, 404, ...) fail
+# every input alike, so splitting the batch would only repeat the error.
+BATCH_REJECTED_STATUS_CODES = {400, 413, 422}
+
+
+def build_tts_payload(chunk: str, language: str, speaker: str) -> Dict:
+    """Build the Sarvam TTS request payload for one script chunk."""
+    # Map language code
+    lang_code = "hi-IN" if language == "hi" else "en-IN"
+
+    return {
+        "inputs": [chunk],
+        "target_language_code": lang_code,
+        "speaker": speaker,
+        "pitch": 1.0,
+        "pace": 1.0,
+        "loudness": 1.5
+    }
+
+
+def group_chunk_batches(
+    chunks: List[str],
+    batch_size: int,
+    max_chars: int
+) -> List[List[Tuple[int, str]]]:
+    """
+    Pack consecutive chunks into batches of (1-based index, chunk) for
+    multi-input Sarvam requests, respecting the per-request input count
+    and total character limits.
+    """
+    batches: List[List[Tuple[int, str]]] = []
+    current: List[Tuple[int, str]] = []
+    current_chars = 0
+
+    for i, chunk in enumerate(chunks, 1):
+        if current and (len(current) >= batch_size or current_chars + len(chunk) > max_chars):
+            batches.append(current)
+            current, current_chars = [], 0
+        current.append((i, chunk))
+        current_chars += len(chunk)
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+async def request_tts_audio(
+    client: SarvamTTSClient,
+    payload: Dict,
+    label: str,
+    sarvam_api_key: str,
+    tts_url: str,
+    abort: Optional[asyncio.Event] = None,
+) -> List[bytes]:
+    """
+    POST one TTS payload and return the decoded WAV bytes for every input,
+    in input order.
+    
+    The request waits on the per-key rate limiter and passes the Sarvam
+    circuit breaker. Transient failures (timeouts, 429, 5xx) are retried
+    with exponential backoff and full jitter, honouring Retry-After.
+    
+    Args:
+        label: Chunk description for log and error messages (e.g. "chunk 3")
+        abort: Optional event; once set, no further retries are attempted
+    
+    Raises:
+        TTSBatchRejectedError: a multi-input request was refused for its shape
+                 (400/413/422, or fewer audios than inputs)
+        TTSChunkError: on a permanent failure, exhausted retries or open circuit
+    """
+    expected = len(payload["inputs"])
+    max_attempts = settings.SARVAM_TTS_MAX_RETRIES + 1
+
+    for attempt in range(1, max_attempts + 1):
+        try:
+            sarvam_circuit_breaker.before_call()
+        except CircuitOpenError as e:
+            raise TTSChunkError(f"{label.capitalize()} not sent: {str(e)}")
+
+        # Every exit from here on must record an outcome or release the
+        # breaker's half-open trial, or the circuit would reject all calls
+        outcome_recorded = False
+        try:
+            await get_rate_limiter(sarvam_api_key).acquire()
+
+            retry_after = None
+            status_code = None
+            attempt_started = time.perf_counter()
+            try:
+                resp = await client.post_tts(payload, api_key=sarvam_api_key, tts_url=tts_url)
+            except httpx.TransportError as e:
+                error = f"{type(e).__name__}: {str(e) or 'transport error'}"
+                reason = "transport"
+                retryable = True
+            else:
+                if resp.status_code == 200:
+                    try:
+                        body = resp.json()
+                    except ValueError:
+                        body = None
+                    audios = body.get("audios") if isinstance(body, dict) else None
+
+                    if audios and len(audios) == expected:
+                        sarvam_circuit_breaker.record_success()
+                        outcome_recorded = True
+                        record_tts_request("success", time.perf_counter() - attempt_started)
+                        return [base64.b64decode(audio) for audio in audios]
+
+                    if audios and expected > 1:
+                        sarvam_circuit_breaker.record_success()
+                        outcome_recorded = True
+                        record_tts_request("failure", time.perf_counter() - attempt_started)
+                        raise TTSBatchRejectedError(
+                            f"Sarvam returned {len(audios)} audios for {expected} inputs ({label})"
+                        )
+
+                    error = "no audio returned"
+                    reason = "no_audio"
+                    retryable = True
+                else:
+                    status_code = resp.status_code
+                    error = f"{resp.status_code} → {resp.text[:300]}"
+                    reason = str(resp.status_code)
+                    retryable = resp.status_code in RETRYABLE_STATUS_CODES
+                    retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+            attempt_seconds = time.perf_counter() - attempt_started
+
+            if retryable:
+                sarvam_circuit_breaker.record_failure()
+            else:
+                # A permanent 4xx means the endpoint is up; the request itself is bad
+                sarvam_circuit_breaker.record_success()
+            outcome_recorded = True
+        except asyncio.CancelledError:
+            if not outcome_recorded:
+                sarvam_circuit_breaker.release_trial()
+            raise
+        except Exception:
+            if not outcome_recorded:
+                sarvam_circuit_breaker.record_failure()
+            raise
+
+        if expected > 1 and status_code in BATCH_REJECTED_STATUS_CODES:
+            record_tts_request("failure", attempt_seconds)
+            raise TTSBatchRejectedError(f"Sarvam rejected batched request for {label}: {error}")
+
+        if not retryable or attempt == max_attempts or (abort is not None and abort.is_set()):
+            record_tts_request("failure", attempt_seconds)
+            raise TTSChunkError(f"Sarvam TTS failed for {label} after {attempt} attempt(s): {error}")
+
+        delay = backoff_delay(attempt, retry_after=retry_after)
+        client.retries += 1
+        record_tts_request("retry", attempt_seconds)
+        record_tts_retry(reason)
+        logger.warning(f"{label.capitalize()} attempt {attempt}/{max_attempts} failed ({error}); retrying in {delay:.2f}s")
+        await asyncio.sleep(delay)
+
+
+async def synthesize_chunk(
+    client: SarvamTTSClient,
+    chunk: str,
+    index: int,
+    total: int,
+    sarvam_api_key: str,
+    tts_url: str,
+    language: str,
+    speaker: str,
+    abort: Optional[asyncio.Event] = None,
+) -> bytes:
+    """
+    Send ONE chunk to Sarvam TTS and return the decoded WAV bytes.
+    `total` is only used for logging (0 when the chunk count is not known yet).
+    
+    Chunks already in the TTS cache are returned without an HTTP call.
+    Otherwise the chunk is requested with retry (see request_tts_audio)
+    and written to the TTS cache as soon as it arrives, so a retried
+    episode resumes at the failed chunk.
+    
+    Args:
+        abort: Optional event; once set, no further retries are attempted
+    
+    Raises:
+        TTSChunkError: on a permanent failure, exhausted retries or open circuit
+    """
+    payload = build_tts_payload(chunk, language, speaker)
+    started = time.perf_counter()
+
+    cache_key = None
+    if settings.TTS_CACHE_ENABLED:
+        cache_key = tts_chunk_cache.make_key(payload)
+        cached = await tts_chunk_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Chunk {index}/{total or '?'} served from TTS cache ({len(cached)} bytes)")
+            record_tts_chunk(language, len(chunk), len(cached), time.perf_counter() - started, "cache")
+            return cached
+
+    logger.info(f"Processing chunk {index}/{total or '?'} ({len(chunk)} chars)")
+    chunk_bytes = (await request_tts_audio(
+        client, payload, f"chunk {index}", sarvam_api_key, tts_url, abort=abort
+    ))[0]
+    logger.debug(f"✓ Chunk {index} audio received ({len(chunk_bytes)} bytes)")
+    record_tts_chunk(language, len(chunk), len(chunk_bytes), time.perf_counter() - started, "api")
+
+    if cache_key:
+        await tts_chunk_cache.put(cache_key, chunk_bytes)
+
+    return chunk_bytes
+
+
+async def synthesize_batch(
+    client: SarvamTTSClient,
+    batch: List[Tuple[int, str]],
+    total: int,
+    sarvam_api_key: str,
+    tts_url: str,
+    language: str,
+    speaker: str,
+    abort: Optional[asyncio.Event] = None,
+) -> List[bytes]:
+    """
+    Synthesize a batch of (index, chunk) pairs and return their WAV bytes
+    in batch order.
+    
+    Cached chunks are served from the TTS cache; only the misses are packed
+    into one multi-input Sarvam request, and audios[i] is mapped back to
+    the i-th miss. Each chunk is cached under its single-input key, so
+    batched and unbatched runs share cache entries.
+    
+    If Sarvam refuses a multi-input request, its misses are sent one by one
+    and batching pauses for SARVAM_TTS_BATCH_PAUSE_SECONDS (a bad batch
+    does not turn batching off for good).
+    
+    Raises:
+        TTSChunkError: if any chunk fails
+    """
+    if len(batch) == 1 or not client.batch_inputs_supported:
+        return [
+            await synthesize_chunk(client, chunk, i, total, sarvam_api_key, tts_url, language, speaker, abort=abort)
+            for i, chunk in batch
+        ]
+
+    results: Dict[int, bytes] = {}
+    misses: List[Tuple[int, str, Optional[str]]] = []
+
+    for i, chunk in batch:
+        cache_key = None
+        if settings.TTS_CACHE_ENABLED:
+            lookup_started = time.perf_counter()
+            cache_key = tts_chunk_cache.make_key(build_tts_payload(chunk, language, speaker))
+            cached = await tts_chunk_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Chunk {i}/{total} served from TTS cache ({len(cached)} bytes)")
+                record_tts_chunk(language, len(chunk), len(cached), time.perf_counter() - lookup_started, "cache")
+                results[i] = cached
+                continue
+        misses.append((i, chunk, cache_key))
+
+    started = time.perf_counter()
+    if len(misses) == 1:
+        i, chunk, cache_key = misses[0]
+        logger.info(f"Processing chunk {i}/{total} ({len(chunk)} chars)")
+        payload = build_tts_payload(chunk, language, speaker)
+        results[i] = (await request_tts_audio(
+            client, payload, f"chunk {i}", sarvam_api_key, tts_url, abort=abort
+        ))[0]
+        record_tts_chunk(language, len(chunk), len(results[i]), time.perf_counter() - started, "api")
+        if cache_key:
+            await tts_chunk_cache.put(cache_key, results[i])
+
+    elif misses:
+        first, last = misses[0][0], misses[-1][0]
+        label = f"chunks {first}-{last}"
+        payload = build_tts_payload(misses[0][1], language, speaker)
+        payload["inputs"] = [chunk for _, chunk, _ in misses]
+
+        logger.info(
+            f"Processing {label}/{total} as one batched request "
+            f"({len(misses)} inputs, {sum(len(chunk) for _, chunk, _ in misses)} chars)"
+        )
+        try:
+            audios = await request_tts_audio(client, payload, label, sarvam_api_key, tts_url, abort=abort)
+            client.batched_requests += 1
+            # Every chunk of a batched request took the request's round-trip
+            batch_seconds = time.perf_counter() - started
+            for (i, chunk, cache_key), chunk_bytes in zip(misses, audios):
+                record_tts_chunk(language, len(chunk), len(chunk_bytes), batch_seconds, "api")
+                results[i] = chunk_bytes
+                if cache_key:
+                    await tts_chunk_cache.put(cache_key, chunk_bytes)
+        except TTSBatchRejectedError as e:
+            logger.warning(
+                f"{str(e)}; falling back to single-input requests "
+                f"(batching paused for {settings.SARVAM_TTS_BATCH_PAUSE_SECONDS:.0f}s)"
+            )
+            client.pause_batching(settings.SARVAM_TTS_BATCH_PAUSE_SECONDS)
+            # synthesize_chunk caches each chunk itself
+            for i, chunk, _ in misses:
+                results[i] = await synthesize_chunk(
+                    client, chunk, i, total, sarvam_api_key, tts_url, language, speaker, abort=abort
+                )
+
+    return [results[i] for i, _ in batch]
+
+
+async def iter_synthesized_chunks(
+    client: SarvamTTSClient,
+    chunks: List[str],
+    sarvam_api_key: str,
+    tts_url: str,
+    language: str,
+    speaker: str,
+    concurrent: Optional[bool] = None,
+    max_concurrency: Optional[int] = None,
+    batch_size: Optional[int] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Synthesize chunks and yield their WAV bytes IN CHUNK ORDER, each one
+    as soon as it and every chunk before it has returned.
+    
+    Consecutive chunks are packed into multi-input requests of up to
+    `batch_size` chunks (SARVAM_TTS_BATCH_SIZE; 1 disables batching).
+    
+    Sequential mode awaits each request in turn. Concurrent mode fans
+    requests out under a semaphore of `max_concurrency`. On the first
+    failure (or if the consumer stops iterating) requests not yet sent are
+    skipped, while requests already on the wire are allowed to finish so
+    their (paid-for) audio lands in the TTS cache for a later retry.
+    
+    Raises:
+        TTSChunkError: if any chunk fails
+    """
+    if concurrent is None:
+        concurrent = settings.SARVAM_TTS_CONCURRENT
+    if max_concurrency is None:
+        max_concurrency = settings.SARVAM_TTS_MAX_CONCURRENCY
+    if batch_size is None:
+        batch_size = settings.SARVAM_TTS_BATCH_SIZE
+
+    total = len(chunks)
+    batches = group_chunk_batches(chunks, max(1, batch_size), settings.SARVAM_TTS_BATCH_MAX_CHARS)
+
+    if not concurrent or len(batches) <= 1 or max_concurrency <= 1:
+        for batch in batches:
+            for chunk_bytes in await synthesize_batch(
+                client, batch, total, sarvam_api_key, tts_url, language, speaker
+            ):
+                yield chunk_bytes
+        return
+
+    logger.info(
+        f"Dispatching {total} chunks in {len(batches)} request(s) concurrently "
+        f"(max {max_concurrency} in flight)"
+    )
+    semaphore = asyncio.Semaphore(max_concurrency)
+    abort = asyncio.Event()
+
+    async def bounded(batch: List[Tuple[int, str]]) -> Optional[List[bytes]]:
+        async with semaphore:
+            if abort.is_set():
+                return None
+            return await synthesize_batch(
+                client, batch, total, sarvam_api_key, tts_url, language, speaker, abort=abort
+            )
+
+    tasks = [asyncio.create_task(bounded(batch)) for batch in batches]
+    try:
+        # Await in submission order so audio is emitted in chunk order
+        for task in tasks:
+            for chunk_bytes in await task:
+                yield chunk_bytes
+    finally:
+        abort.set()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def synthesize_chunks(
+    client: SarvamTTSClient,
+    chunks: List[str],
+    sarvam_api_key: str,
+    tts_url: str,
+    language: str,
+    speaker: str,
+    concurrent: Optional[bool] = None,
+    max_concurrency: Optional[int] = None,
+) -> List[bytes]:
+    """
+    Synthesize all chunks and return their WAV bytes IN CHUNK ORDER.
+    See iter_synthesized_chunks() for the dispatch modes.
+    
+    Raises:
+        TTSChunkError: if any chunk fails
+    """
+    return [
+        chunk_bytes
+        async for chunk_bytes in iter_synthesized_chunks(
+            client, chunks, sarvam_api_key, tts_url, language, speaker,
+            concurrent=concurrent, max_concurrency=max_concurrency
+        )
+    ]
+
+
+async def iter_synthesized_chunk_stream(
+    client: SarvamTTSClient,
+    chunk_source: AsyncIterator[str],
+    sarvam_api_key: str,
+    tts_url: str,
+    language: str,
+    speaker: str,
+    max_concurrency: Optional[int] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Like iter_synthesized_chunks(), but for chunks that are still being
+    produced (e.g. split from streaming agent output). Each chunk is
+    dispatched as soon as it arrives, up to `max_concurrency` in flight,
+    and WAV bytes are yielded IN CHUNK ORDER.
+    
+    Raises:
+        TTSChunkError: if any chunk fails
+    """
+    if max_concurrency is None:
+        max_concurrency = settings.SARVAM_TTS_MAX_CONCURRENCY
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    abort = asyncio.Event()
+    pending: asyncio.Queue = asyncio.Queue()
+    tasks: List[asyncio.Task] = []
+
+    async def bounded(i: int, chunk: str) -> Optional[bytes]:
+        async with semaphore:
+            if abort.is_set():
+                return None
+            return await synthesize_chunk(
+                client, chunk, i, 0, sarvam_api_key, tts_url, language, speaker, abort=abort
+            )
+
+    async def dispatch() -> None:
+        try:
+            async for i, chunk in _aenumerate(chunk_source, 1):
+                task = asyncio.create_task(bounded(i, chunk))
+                tasks.append(task)
+                await pending.put(task)
+        finally:
+            await pending.put(None)
+
+    dispatcher = asyncio.create_task(dispatch())
+    try:
+        while True:
+            task = await pending.get()
+            if task is None:
+                break
+            yield await task
+        # Surface errors raised by the chunk source itself
+        await dispatcher
+    finally:
+        abort.set()
+        dispatcher.cancel()
+        await asyncio.gather(dispatcher, *tasks, return_exceptions=True)
+
+
+def stream_media_type(output_format: str) -> str:
+    """Media type that stream_audio_from_script() will produce for a format."""
+    if output_format.lower() == "mp3" and FFmpegPipeEncoder.available():
+        return "audio/mpeg"
+    return "audio/wav"
+
+
+async def stream_audio_from_script(
+    script: str,
+    sarvam_api_key: str,
+    tts_url: str,
+    language: str = "hi",
+    speaker: Optional[str] = None,
+    output_format: str = "wav",
+    concurrent: Optional[bool] = None,
+    max_concurrency: Optional[int] = None,
+    sarvam_client: Optional[SarvamTTSClient] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Progressive version of generate_audio_from_script().
+    
+    Yields audio as soon as chunk 1 returns from Sarvam, then each following
+    chunk in order. Nothing is written to disk.
+    - "wav": a streaming WAV header followed by raw PCM per chunk
+    - "mp3": MP3 frames from a live ffmpeg pipe (falls back to WAV
+      if ffmpeg is not installed; see stream_media_type())
+    
+    Raises:
+        TTSChunkError: if any chunk fails
+    """
+    wav_stream = _stream_wav_from_script(
+        script, sarvam_api_key, tts_url, language, speaker,
+        concurrent=concurrent, max_concurrency=max_concurrency,
+        sarvam_client=sarvam_client
+    )
+
+    if stream_media_type(output_format) == "audio/mpeg":
+        async for data in stream_wav_as_mp3(wav_stream, bitrate="192k"):
+            yield data
+    else:
+        async for data in wav_stream:
+            yield data
+
+
+async def _stream_wav_from_script(
+    script: str,
+    sarvam_api_key: str,
+    tts_url: str,
+    language: str,
+    speaker: Optional[str],
+    concurrent: Optional[bool] = None,
+    max_concurrency: Optional[int] = None,
+    sarvam_client: Optional[SarvamTTSClient] = None,
+) -> AsyncIterator[bytes]:
+    target_speaker = speaker or "anushka"
+
+    from .script_splitting import split_script
+    script_chunks = split_script(script, max_length=500, language=language)
+    logger.info(f"🎙️ Streaming {len(script_chunks)} chunks → language: {language} | speaker: {target_speaker}")
+
+    stream_fmt = None
+    async with sarvam_client_scope(sarvam_client, sarvam_api_key, tts_url) as client:
+        async for i, chunk_bytes in _aenumerate(iter_synthesized_chunks(
+            client, script_chunks, sarvam_api_key, tts_url, language, target_speaker,
+            concurrent=concurrent, max_concurrency=max_concurrency
+        ), 1):
+            try:
+                fmt, offset, length = parse_wav(chunk_bytes)
+            except WavFormatError as e:
+                raise TTSChunkError(f"Chunk {i} is not valid WAV audio: {str(e)}")
+
+            if stream_fmt is None:
+                stream_fmt = fmt
+                yield build_wav_header(stream_fmt)
+
+            if same_format(stream_fmt, fmt):
+                yield chunk_bytes[offset:offset + length]
+            else:
+                logger.warning(f"Chunk {i} audio format differs from stream format; resampling")
+                yield await audio_executor.run(conform_wav_chunk, chunk_bytes, stream_fmt)
+
+
+async def _aenumerate(aiterable: AsyncIterator, start: int = 0):
+    index = start
+    async for item in aiterable:
+        yield index, item
+        index += 1
+
+
+def conform_wav_chunk(chunk: bytes, target_fmt: Dict[str, int]) -> bytes:
+    """
+    Resample/remix a WAV chunk to the target PCM format using pydub.
+    Only used for the rare chunk whose format differs from the first one.
+    Blocking: call through audio_executor from async code.
+    
+    Returns:
+        Raw PCM bytes (no header) in the target format
+    """
+    if not PYDUB_AVAILABLE:
+        raise WavFormatError("pydub not available to resample mismatched chunk")
+
+    segment = AudioSegment.from_wav(io.BytesIO(chunk))
+    segment = (
+        segment
+        .set_frame_rate(target_fmt["sample_rate"])
+        .set_channels(target_fmt["channels"])
+        .set_sample_width(target_fmt["bits_per_sample"] // 8)
+    )
+    return segment.raw_data
+
+
 async def combine_wav_chunks(chunks_bytes: List[bytes]) -> bytes:
     """
-    Properly combine multiple WAV audio chunks using pydub.
-    This ensures proper WAV header handling when combining chunks.
+    Combine multiple WAV audio chunks into a single WAV file.
+    
+    Parses each chunk's RIFF header once, checks that sample rate, width and
+    channels match, and copies the PCM payloads into one preallocated buffer
+    behind a single rewritten header, so cost is linear in audio length.
+    Chunks in a different format are resampled with pydub; chunks that are
+    not valid WAV are skipped. Runs on the audio executor, off the event loop.
     
     Args:
         chunks_bytes: List of WAV audio bytes to combine
@@ -35,30 +665,22 @@ async def combine_wav_chunks(chunks_bytes: List[bytes]) -> bytes:
     Returns:
         Combined WAV audio bytes
     """
-    if not PYDUB_AVAILABLE:
-        logger.warning("pydub not available. Returning first chunk only.")
+    valid_chunks = []
+    for idx, chunk in enumerate(chunks_bytes, 1):
+        try:
+            parse_wav(chunk)
+            valid_chunks.append(chunk)
+        except WavFormatError as e:
+            logger.error(f"Error processing chunk {idx}: {str(e)}")
+
+    if not valid_chunks:
+        logger.error("No audio chunks could be combined")
         return chunks_bytes[0] if chunks_bytes else b""
 
     try:
-        combined_audio = AudioSegment.empty()
-
-        for idx, chunk in enumerate(chunks_bytes, 1):
-            try:
-                audio_segment = AudioSegment.from_wav(io.BytesIO(chunk))
-                combined_audio += audio_segment
-                logger.debug(f"Combined chunk {idx} ({len(audio_segment)} ms audio)")
-            except Exception as e:
-                logger.error(f"Error processing chunk {idx}: {str(e)}")
-                continue
-
-        if not combined_audio:
-            logger.error("No audio chunks could be combined")
-            return chunks_bytes[0] if chunks_bytes else b""
-
-        # Export combined audio back to WAV
-        wav_buffer = io.BytesIO()
-        combined_audio.export(wav_buffer, format="wav")
-        return wav_buffer.getvalue()
+        combined = await audio_executor.run(concat_wav, valid_chunks, conform_wav_chunk)
+        logger.debug(f"Combined {len(valid_chunks)} chunks ({len(combined)} bytes)")
+        return combined
 
     except Exception as e:
         logger.error(f"Failed to combine WAV chunks: {str(e)}")
@@ -68,6 +690,8 @@ async def combine_wav_chunks(chunks_bytes: List[bytes]) -> bytes:
 async def convert_to_mp3(audio_bytes: bytes) -> bytes:
     """
     Convert audio bytes from WAV to MP3 format.
+    Uses the non-blocking ffmpeg pipe encoder when ffmpeg is available,
+    falling back to pydub on the audio executor otherwise.
     
     Args:
         audio_bytes: WAV audio bytes
@@ -75,28 +699,233 @@ async def convert_to_mp3(audio_bytes: bytes) -> bytes:
     Returns:
         MP3 audio bytes
     """
+    if FFmpegPipeEncoder.available():
+        try:
+            return await encode_wav_to_mp3(audio_bytes, bitrate="192k")
+        except Exception as e:
+            logger.warning(f"ffmpeg pipe encoding failed: {str(e)} — falling back to pydub")
+
     if not PYDUB_AVAILABLE:
         logger.warning("pydub not available. Returning original WAV format.")
         return audio_bytes
 
     try:
-        audio = AudioSegment.from_wav(io.BytesIO(audio_bytes))
-
-        mp3_buffer = io.BytesIO()
-        audio.export(
-            mp3_buffer,
-            format="mp3",
-            bitrate="192k",
-            parameters=["-q:a", "2"]
-        )
-
-        return mp3_buffer.getvalue()
+        return await audio_executor.run(export_mp3_with_pydub, audio_bytes)
 
     except Exception as e:
         logger.error(f"MP3 conversion failed: {str(e)}")
         return audio_bytes
 
 
+def export_mp3_with_pydub(audio_bytes: bytes) -> bytes:
+    """Blocking pydub WAV → MP3 export. Call through audio_executor only."""
+    audio = AudioSegment.from_wav(io.BytesIO(audio_bytes))
+
+    mp3_buffer = io.BytesIO()
+    audio.export(
+        mp3_buffer,
+        format="mp3",
+        bitrate="192k",
+        parameters=["-q:a", "2"]
+    )
+
+    return mp3_buffer.getvalue()
+
+
+async def encode_chunks_to_mp3(chunk_stream: AsyncIterator[bytes]) -> bytes:
+    """
+    Pipe each chunk's PCM into one ffmpeg process as soon as it arrives.
+    The first chunk defines the PCM format; later chunks in a different
+    format are resampled.
+    
+    Returns:
+        MP3 bytes for the whole episode
+    
+    Raises:
+        TTSChunkError: if a chunk is not valid WAV audio
+        EncoderError: if ffmpeg fails
+    """
+    encoder = None
+    target_fmt = None
+    try:
+        async for i, chunk_bytes in _aenumerate(chunk_stream, 1):
+            try:
+                fmt, offset, length = parse_wav(chunk_bytes)
+            except WavFormatError as e:
+                raise TTSChunkError(f"Chunk {i} is not valid WAV audio: {str(e)}")
+
+            if encoder is None:
+                target_fmt = fmt
+                encoder = FFmpegPipeEncoder(target_fmt, bitrate="192k")
+                await encoder.start(collect=True)
+
+            if same_format(target_fmt, fmt):
+                await encoder.write(memoryview(chunk_bytes)[offset:offset + length])
+            else:
+                await encoder.write(await audio_executor.run(conform_wav_chunk, chunk_bytes, target_fmt))
+
+        if encoder is None:
+            return b""
+        return await encoder.finish()
+
+    except BaseException:
+        if encoder is not None:
+            await encoder.abort()
+        raise
+
+
+async def _timed_chunk_stream(
+    chunk_stream: AsyncIterator[bytes],
+    language: str,
+    timing: Dict[str, float],
+) -> AsyncIterator[bytes]:
+    """Pass chunks through, recording the wall time until the last one as the "tts" stage"""
+    started = time.perf_counter()
+    try:
+        async for chunk_bytes in chunk_stream:
+            yield chunk_bytes
+    finally:
+        timing["tts"] = time.perf_counter() - started
+        observe_stage("tts", timing["tts"], language)
+
+
+async def save_chunk_audio(
+    chunk_stream: AsyncIterator[bytes],
+    language: str,
+    output_format: str,
+    audio_storage_path: str,
+) -> Optional[str]:
+    """
+    Assemble ordered WAV chunk bytes into one audio file and save it.
+    
+    MP3 with ffmpeg available: chunks are piped into the encoder as they
+    arrive, so encoding overlaps synthesis. Otherwise chunks are collected,
+    concatenated and (optionally) converted once complete.
+    
+    Returns:
+        "/audio/<filename>" path, or None if no audio was produced
+    
+    Raises:
+        TTSChunkError: if a chunk fails
+    """
+    timing: Dict[str, float] = {}
+    chunk_stream = _timed_chunk_stream(chunk_stream, language, timing)
+
+    if output_format.lower() == "mp3" and FFmpegPipeEncoder.available():
+        # Encode each chunk as it arrives so MP3 encoding overlaps synthesis
+        logger.info("Encoding chunks to MP3 through ffmpeg pipe as they arrive...")
+        started = time.perf_counter()
+        audio_bytes = await encode_chunks_to_mp3(chunk_stream)
+        # Only the encoder tail after the last chunk is not hidden behind synthesis
+        observe_stage("mp3_encode", time.perf_counter() - started - timing.get("tts", 0.0), language)
+        file_extension = "mp3"
+    else:
+        all_audio_chunks = [chunk_bytes async for chunk_bytes in chunk_stream]
+        file_extension = "wav"
+
+        # Combine all audio chunks
+        if not all_audio_chunks:
+            logger.error("No audio chunks received")
+            return None
+
+        if len(all_audio_chunks) == 1:
+            logger.info("Single audio chunk - no combining needed")
+            audio_bytes = all_audio_chunks[0]
+        else:
+            logger.info(f"Combining {len(all_audio_chunks)} audio chunks into one file...")
+            with stage_timer("wav_combine", language):
+                audio_bytes = await combine_wav_chunks(all_audio_chunks)
+
+        if not audio_bytes:
+            logger.error("Failed to combine audio chunks")
+            return None
+
+        # Optional MP3 conversion
+        if output_format.lower() == "mp3":
+            logger.info("Converting WAV to MP3...")
+            with stage_timer("mp3_encode", language):
+                audio_bytes = await convert_to_mp3(audio_bytes)
+            file_extension = "mp3"
+
+    if not audio_bytes:
+        logger.error("No audio produced")
+        return None
+
+    # Save file
+    # Suffix keeps concurrent renders of the same language from colliding
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    filename = f"podcast_{language}_{timestamp}_{uuid.uuid4().hex[:6]}.{file_extension}"
+    filepath = os.path.join(audio_storage_path, filename)
+
+    # Written off the event loop to a temp file then renamed (or uploaded),
+    # so /audio never serves a half-written file
+    with stage_timer("save", language):
+        location = await storage_backend.write(
+            filepath, audio_bytes, content_type="audio/mpeg" if file_extension == "mp3" else "audio/wav"
+        )
+
+    size_mb = len(audio_bytes) / (1024 * 1024)
+    logger.info(f"✓ Audio saved → {location} ({size_mb:.2f} MB)")
+
+    return f"/audio/{filename}"
+
+
+async def generate_audio_from_chunk_stream(
+    chunk_source: AsyncIterator[str],
+    sarvam_api_key: str,
+    tts_url: str,
+    language: str = "hi",
+    output_format: str = "mp3",
+    speaker: Optional[str] = None,
+    audio_storage_path: str = settings.AUDIO_STORAGE_PATH,
+    max_concurrency: Optional[int] = None,
+    sarvam_client: Optional[SarvamTTSClient] = None,
+) -> Optional[str]:
+    """
+    Generate audio from script chunks that are still arriving (streaming
+    agent output). Synthesis of early chunks overlaps generation of later
+    ones; the file is saved once the chunk source is exhausted.
+    
+    Args:
+        chunk_source: Async iterator of ready-to-send chunks (<= 500 chars each)
+        (other args as in generate_audio_from_script)
+    
+    Returns:
+        Path to generated audio file, or None if failed
+    """
+    if not HTTPX_AVAILABLE:
+        logger.error("httpx is not installed. Cannot generate audio.")
+        return None
+
+    if not sarvam_api_key:
+        logger.warning("Sarvam API key not provided. Cannot generate audio.")
+        return None
+
+    target_speaker = speaker or "anushka"
+    logger.info(f"🎙️ Generating audio from streamed chunks → language: {language} | speaker: {target_speaker} | format: {output_format}")
+
+    try:
+        async with sarvam_client_scope(sarvam_client, sarvam_api_key, tts_url) as client:
+            chunk_stream = iter_synthesized_chunk_stream(
+                client=client,
+                chunk_source=chunk_source,
+                sarvam_api_key=sarvam_api_key,
+                tts_url=tts_url,
+                language=language,
+                speaker=target_speaker,
+                max_concurrency=max_concurrency
+            )
+            return await save_chunk_audio(chunk_stream, language, output_format, audio_storage_path)
+
+    except TTSChunkError as e:
+        logger.error(str(e))
+        return None
+
+    except Exception as e:
+        logger.exception(f"Audio generation failed: {str(e)}")
+        return None
+
+
 async def generate_audio_from_script(
     script: str,
     sarvam_api_key: str,
@@ -105,12 +934,20 @@ async def generate_audio_from_script(
     output_format: str = "mp3",
     speaker: Optional[str] = None,
     audio_storage_path: str = settings.AUDIO_STORAGE_PATH,
+    concurrent: Optional[bool] = None,
+    max_concurrency: Optional[int] = None,
+    sarvam_client: Optional[SarvamTTSClient] = None,
+    chunks: Optional[List[str]] = None,
 ) -> Optional[str]:
     """
     Generate audio from a SINGLE script using Sarvam TTS.
     Splits script into chunks (max 500 chars) and processes each separately.
     Combines all audio chunks into one file.
     
+    In concurrent mode the chunk requests are fanned out under a semaphore
+    and reassembled in chunk order, so wall-clock TTS time is roughly the
+    slowest chunk rather than the sum of all chunks.
+    
     Args:
         script: Text script to convert to audio
         sarvam_api_key: Sarvam API authentication key
@@ -119,6 +956,11 @@ async def generate_audio_from_script(
         output_format: Output audio format ("mp3" or "wav")
         speaker: Speaker name (default: "anushka")
         audio_storage_path: Path to save audio files
+        concurrent: Dispatch chunks in parallel (default: settings.SARVAM_TTS_CONCURRENT)
+        max_concurrency: Max in-flight chunk requests (default: settings.SARVAM_TTS_MAX_CONCURRENCY)
+        sarvam_client: Shared pooled Sarvam client (a temporary one is used if omitted)
+        chunks: Chunks the script was voiced with before (e.g. by the streaming
+                 pipeline); used instead of re-splitting so TTS cache keys match
     
     Returns:
         Path to generated audio file, or None if failed
@@ -137,93 +979,150 @@ async def generate_audio_from_script(
     try:
         # Split script into SEPARATE chunks (max 500 chars each)
         from .script_splitting import split_script
-        script_chunks = split_script(script, max_length=500, language=language)
-        
-        logger.info(f"Script split into {len(script_chunks)} SEPARATE chunks for Sarvam TTS")
-        all_audio_chunks: List[bytes] = []
-
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            for i, chunk in enumerate(script_chunks, 1):
-                logger.info(f"Processing chunk {i}/{len(script_chunks)} ({len(chunk)} chars)")
-
-                # Map language code
-                lang_code = "hi-IN" if language == "hi" else "en-IN"
-
-                payload = {
-                    "inputs": [chunk],
-                    "target_language_code": lang_code,
-                    "speaker": target_speaker,
-                    "pitch": 1.0,
-                    "pace": 1.0,
-                    "loudness": 1.5
-                }
-
-                headers = {
-                    "Authorization": f"Bearer {sarvam_api_key}",
-                    "Content-Type": "application/json"
-                }
-
-                resp = await client.post(
-                    tts_url,
-                    json=payload,
-                    headers=headers,
-                    timeout=60.0
-                )
+        if chunks:
+            script_chunks = list(chunks)
+            logger.info(f"Reusing {len(script_chunks)} stored chunks for Sarvam TTS")
+        else:
+            script_chunks = split_script(script, max_length=500, language=language)
+            logger.info(f"Script split into {len(script_chunks)} SEPARATE chunks for Sarvam TTS")
 
-                if resp.status_code != 200:
-                    logger.error(f"Sarvam TTS failed for chunk {i}: {resp.status_code} → {resp.text[:300]}")
-                    return None
+        async with sarvam_client_scope(sarvam_client, sarvam_api_key, tts_url) as client:
+            chunk_stream = iter_synthesized_chunks(
+                client=client,
+                chunks=script_chunks,
+                sarvam_api_key=sarvam_api_key,
+                tts_url=tts_url,
+                language=language,
+                speaker=target_speaker,
+                concurrent=concurrent,
+                max_concurrency=max_concurrency
+            )
+            return await save_chunk_audio(chunk_stream, language, output_format, audio_storage_path)
 
-                data = resp.json()
-                if "audios" not in data or not data["audios"]:
-                    logger.error(f"No audio returned for chunk {i}")
-                    return None
+    except TTSChunkError as e:
+        logger.error(str(e))
+        return None
 
-                chunk_bytes = base64.b64decode(data["audios"][0])
-                all_audio_chunks.append(chunk_bytes)
-                logger.debug(f"✓ Chunk {i} audio received ({len(chunk_bytes)} bytes)")
+    except Exception as e:
+        logger.exception(f"Audio generation failed: {str(e)}")
+        return None
 
-        # Combine all audio chunks
-        if not all_audio_chunks:
-            logger.error("No audio chunks received")
-            return None
 
-        if len(all_audio_chunks) == 1:
-            logger.info("Single audio chunk - no combining needed")
-            audio_bytes = all_audio_chunks[0]
-        else:
-            logger.info(f"Combining {len(all_audio_chunks)} audio chunks into one file...")
-            audio_bytes = await combine_wav_chunks(all_audio_chunks)
+async def generate_branded_audio(
+    segments: List[Dict[str, Any]],
+    brands: List[Dict[str, str]],
+    sarvam_api_key: str,
+    tts_url: str,
+    language: str = "hi",
+    output_format: str = "mp3",
+    audio_storage_path: str = settings.AUDIO_STORAGE_PATH,
+    max_concurrency: Optional[int] = None,
+    sarvam_client: Optional[SarvamTTSClient] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Render ONE templated script for many podcast names (batch generation).
 
-        if not audio_bytes:
-            logger.error("Failed to combine audio chunks")
-            return None
+    Shared chunks are synthesized once per speaker; each name only pays
+    for its branded chunks (the intro). Every file is then spliced from
+    the shared chunk audio and that name's branded chunk audio in script
+    order, so N names cost about one episode plus N intros.
 
-        # Optional MP3 conversion
-        file_extension = "wav"
-        if output_format.lower() == "mp3":
-            logger.info("Converting WAV to MP3...")
-            audio_bytes = await convert_to_mp3(audio_bytes)
-            file_extension = "mp3"
+    Args:
+        segments: Output of branding.split_branded_template() for `language`
+        brands: [{"name": "Nippon India Financial", "speaker": "sachit"}, ...]
+        max_concurrency: Max in-flight requests per synthesis, and max
+                 names assembled at once (default: settings.SARVAM_TTS_MAX_CONCURRENCY)
+        (other args as in generate_audio_from_script)
 
-        # Save file
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"podcast_{language}_{timestamp}.{file_extension}"
-        filepath = os.path.join(audio_storage_path, filename)
+    Returns:
+        One entry per brand, in order:
+        [{"name": "...", "speaker": "sachit", "audio": "/audio/...", "chunks": {"shared": 9, "branded": 1}, "error": None}, ...]
+    """
+    from .branding import branded_chunks
+
+    def failed(brand: Dict[str, str], error: str) -> Dict[str, Any]:
+        return {"name": brand["name"], "speaker": brand["speaker"], "audio": None, "chunks": None, "error": error}
 
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    if not HTTPX_AVAILABLE:
+        logger.error("httpx is not installed. Cannot generate audio.")
+        return [failed(brand, "httpx is not installed") for brand in brands]
 
-        with open(filepath, "wb") as f:
-            f.write(audio_bytes)
+    if not sarvam_api_key:
+        logger.warning("Sarvam API key not provided. Cannot generate audio.")
+        return [failed(brand, "Sarvam API key not provided") for brand in brands]
 
-        size_mb = len(audio_bytes) / (1024 * 1024)
-        logger.info(f"✓ Audio saved → {filepath} ({size_mb:.2f} MB)")
+    if max_concurrency is None:
+        max_concurrency = settings.SARVAM_TTS_MAX_CONCURRENCY
 
-        return f"/audio/{filename}"
+    shared_texts = [segment["text"] for segment in segments if not segment["branded"]]
+    speakers = sorted({brand["speaker"] for brand in brands})
+    logger.info(
+        f"🎙️ Generating branded audio → language: {language} | {len(brands)} name(s) | "
+        f"speakers: {', '.join(speakers)} | {len(shared_texts)} shared chunks"
+    )
 
-    except Exception as e:
-        logger.exception(f"Audio generation failed: {str(e)}")
-        return None
+    async with sarvam_client_scope(sarvam_client, sarvam_api_key, tts_url) as client:
+        # One synthesis of the shared body per speaker, awaited by every name using that speaker
+        shared_tasks = {
+            speaker: asyncio.create_task(
+                synthesize_chunks(
+                    client, shared_texts, sarvam_api_key, tts_url, language, speaker,
+                    max_concurrency=max_concurrency
+                )
+            )
+            for speaker in speakers
+        }
+        assembling = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def render(brand: Dict[str, str]) -> Dict[str, Any]:
+            name, speaker = brand["name"], brand["speaker"]
+            filled = [
+                branded_chunks(segment["text"], name, language) if segment["branded"] else None
+                for segment in segments
+            ]
+            brand_texts = [chunk for chunks in filled if chunks for chunk in chunks]
+
+            async with assembling:
+                brand_audio = await synthesize_chunks(
+                    client, brand_texts, sarvam_api_key, tts_url, language, speaker,
+                    max_concurrency=max_concurrency
+                )
+                shared_audio = await shared_tasks[speaker]
+
+                async def spliced() -> AsyncIterator[bytes]:
+                    shared_iter, brand_iter = iter(shared_audio), iter(brand_audio)
+                    for chunks in filled:
+                        if chunks is None:
+                            yield next(shared_iter)
+                        else:
+                            for _ in chunks:
+                                yield next(brand_iter)
+
+                audio_path = await save_chunk_audio(spliced(), language, output_format, audio_storage_path)
+
+            return {
+                "name": name,
+                "speaker": speaker,
+                "audio": audio_path,
+                "chunks": {"shared": len(shared_texts), "branded": len(brand_texts)},
+                "error": None if audio_path else f"Failed to generate {language} audio for {name}"
+            }
+
+        try:
+            results = await asyncio.gather(*(render(brand) for brand in brands), return_exceptions=True)
+        finally:
+            for task in shared_tasks.values():
+                task.cancel()
+            await asyncio.gather(*shared_tasks.values(), return_exceptions=True)
+
+    for i, result in enumerate(results):
+        if isinstance(result, Exception):
+            logger.error(f"Branded {language} audio for {brands[i]['name']} failed: {str(result)}")
+            results[i] = failed(brands[i], str(result))
+
+    succeeded = sum(1 for result in results if result["audio"])
+    logger.info(f"✓ Branded {language} audio: {succeeded}/{len(brands)} file(s) generated")
+    return results
 
 
 async def generate_podcast_audio(
@@ -235,7 +1134,11 @@ async def generate_podcast_audio(
     eng_speaker: Optional[str] = None,
     hin_speaker: Optional[str] = None,
     audio_storage_path: str = settings.AUDIO_STORAGE_PATH,
-) -> Optional[Dict[str, str]]:
+    parallel: Optional[bool] = None,
+    sarvam_client: Optional[SarvamTTSClient] = None,
+    eng_chunks: Optional[List[str]] = None,
+    hin_chunks: Optional[List[str]] = None,
+) -> Optional[Dict[str, Any]]:
     """
     Generate AUDIO for TWO separate podcast scripts (English and Hindi).
     Each script is split into chunks and processed separately with Sarvam TTS.
@@ -244,6 +1147,9 @@ async def generate_podcast_audio(
     - English script chunks → English audio file
     - Hindi script chunks → Hindi audio file
     
+    In parallel mode both pipelines run at the same time; if one language
+    fails the other is cancelled and None is returned.
+    
     Args:
         eng_script: English podcast script
         hin_script: Hindi podcast script
@@ -253,13 +1159,20 @@ async def generate_podcast_audio(
         eng_speaker: English speaker name (e.g., "sachit")
         hin_speaker: Hindi speaker name (e.g., "anushka")
         audio_storage_path: Path to save audio files
+        parallel: Run both languages concurrently (default: settings.PODCAST_PARALLEL_LANGUAGES)
+        sarvam_client: Shared pooled Sarvam client used by both languages
+        eng_chunks: Stored English chunks to reuse instead of re-splitting
+        hin_chunks: Stored Hindi chunks to reuse instead of re-splitting
     
     Returns:
-        Dictionary with audio file paths:
+        Dictionary with audio file paths and per-language timings (seconds):
         {
             "eng_pod_audio": "/audio/podcast_en_20260226_120000.mp3",
             "hin_pod_audio": "/audio/podcast_hi_20260226_120000.mp3",
-            "success": True
+            "success": True,
+            "format": "mp3",
+            "parallel": True,
+            "timings": {"en": 41.2, "hi": 44.8, "total": 44.9}
         }
         Or None if generation fails
     
@@ -291,57 +1204,84 @@ async def generate_podcast_audio(
     eng_speaker = eng_speaker or "sachit"
     hin_speaker = hin_speaker or "anushka"
 
-    try:
-        # Generate English audio
-        logger.info("\n[1/2] GENERATING ENGLISH PODCAST AUDIO (eng_pod)")
-        logger.info("-" * 70)
-        eng_audio_path = await generate_audio_from_script(
-            script=eng_script,
-            sarvam_api_key=sarvam_api_key,
-            tts_url=tts_url,
-            language="en",
-            output_format=output_format,
-            speaker=eng_speaker,
-            audio_storage_path=audio_storage_path
-        )
+    if parallel is None:
+        parallel = settings.PODCAST_PARALLEL_LANGUAGES
 
-        if not eng_audio_path:
-            logger.error("Failed to generate English audio")
-            return None
+    timings: Dict[str, float] = {}
 
-        # Generate Hindi audio
-        logger.info("\n[2/2] GENERATING HINDI PODCAST AUDIO (hin_pod)")
-        logger.info("-" * 70)
-        hin_audio_path = await generate_audio_from_script(
-            script=hin_script,
+    async def render(label: str, script: str, language: str, speaker: str, chunks: Optional[List[str]]) -> str:
+        started = time.perf_counter()
+        audio_path = await generate_audio_from_script(
+            script=script,
             sarvam_api_key=sarvam_api_key,
             tts_url=tts_url,
-            language="hi",
+            language=language,
             output_format=output_format,
-            speaker=hin_speaker,
-            audio_storage_path=audio_storage_path
+            speaker=speaker,
+            audio_storage_path=audio_storage_path,
+            sarvam_client=sarvam_client,
+            chunks=chunks
         )
+        timings[language] = round(time.perf_counter() - started, 3)
 
-        if not hin_audio_path:
-            logger.error("Failed to generate Hindi audio")
-            return None
+        if not audio_path:
+            raise TTSChunkError(f"Failed to generate {label} audio")
+        return audio_path
+
+    started = time.perf_counter()
+
+    try:
+        if parallel:
+            logger.info("\n[1-2/2] GENERATING ENGLISH AND HINDI PODCAST AUDIO IN PARALLEL")
+            logger.info("-" * 70)
+            tasks = [
+                asyncio.create_task(render("English", eng_script, "en", eng_speaker, eng_chunks)),
+                asyncio.create_task(render("Hindi", hin_script, "hi", hin_speaker, hin_chunks)),
+            ]
+            try:
+                eng_audio_path, hin_audio_path = await asyncio.gather(*tasks)
+            except BaseException:
+                # Cancel the sibling so a failed language doesn't keep spending TTS quota
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+        else:
+            # Generate English audio
+            logger.info("\n[1/2] GENERATING ENGLISH PODCAST AUDIO (eng_pod)")
+            logger.info("-" * 70)
+            eng_audio_path = await render("English", eng_script, "en", eng_speaker, eng_chunks)
+
+            # Generate Hindi audio
+            logger.info("\n[2/2] GENERATING HINDI PODCAST AUDIO (hin_pod)")
+            logger.info("-" * 70)
+            hin_audio_path = await render("Hindi", hin_script, "hi", hin_speaker, hin_chunks)
+
+        timings["total"] = round(time.perf_counter() - started, 3)
 
         result = {
             "eng_pod_audio": eng_audio_path,
             "hin_pod_audio": hin_audio_path,
             "success": True,
-            "format": output_format
+            "format": output_format,
+            "parallel": parallel,
+            "timings": timings
         }
 
         logger.info("\n" + "=" * 70)
         logger.info("✓ PODCAST AUDIO GENERATION COMPLETE")
         logger.info("=" * 70)
-        logger.info(f"English audio: {eng_audio_path}")
-        logger.info(f"Hindi audio: {hin_audio_path}")
+        logger.info(f"English audio: {eng_audio_path} ({timings['en']:.2f}s)")
+        logger.info(f"Hindi audio: {hin_audio_path} ({timings['hi']:.2f}s)")
+        logger.info(f"Total audio time: {timings['total']:.2f}s ({'parallel' if parallel else 'sequential'})")
         logger.info("=" * 70 + "\n")
 
         return result
 
+    except TTSChunkError as e:
+        logger.error(str(e))
+        return None
+
     except Exception as e:
         logger.exception(f"Podcast audio generation failed: {str(e)}")
         return None
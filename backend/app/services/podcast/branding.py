@@ -0,0 +1,65 @@
+# services/podcast/branding.py
+from typing import Any, Dict, List
+
+from app.core.logger import logger
+from app.services.unified_agent.prompt_builder import BRAND_PLACEHOLDER, opening_line
+
+from .script_splitting import SENTENCE_PATTERNS, split_script
+
+
+def ensure_brand_placeholder(template: str, language: str, target_date: str) -> str:
+    """
+    Make sure a batch template mentions BRAND_PLACEHOLDER.
+    If the agent dropped it, the standard opening line is prepended so every
+    podcast name is still spoken once.
+    """
+    if BRAND_PLACEHOLDER in template:
+        return template
+    logger.warning(f"{language} batch template has no {BRAND_PLACEHOLDER} placeholder — prepending the opening line")
+    return f"{opening_line(language, target_date, BRAND_PLACEHOLDER)}\n\n{template}"
+
+
+def fill_brand(template: str, name: str) -> str:
+    """Substitute a podcast name into a template"""
+    return template.replace(BRAND_PLACEHOLDER, name)
+
+
+def split_branded_template(template: str, language: str, max_length: int = 500) -> List[Dict[str, Any]]:
+    """
+    Split a batch template into ordered segments for TTS.
+
+    Sentences mentioning BRAND_PLACEHOLDER become "branded" segments (kept
+    as template text, filled and chunked per podcast name); every other run
+    of sentences is chunked once and shared by all names. Isolating the
+    branded sentences keeps the per-name TTS cost to the intro instead of
+    the whole 500-char chunk around it.
+
+    Returns:
+        [{"text": "...", "branded": False}, {"text": "Welcome to the {BRAND} ...", "branded": True}, ...]
+        where each shared entry is a ready-to-send chunk
+    """
+    sentence_pattern = SENTENCE_PATTERNS["hi" if language == "hi" else "en"]
+    sentences = [s.strip() for s in sentence_pattern.split(template) if s.strip()]
+
+    # Group consecutive sentences into runs that are all branded or all shared
+    runs: List[List[Any]] = []
+    for sentence in sentences:
+        branded = BRAND_PLACEHOLDER in sentence
+        if runs and runs[-1][0] == branded:
+            runs[-1][1].append(sentence)
+        else:
+            runs.append([branded, [sentence]])
+
+    segments = []
+    for branded, run in runs:
+        text = " ".join(run)
+        if branded:
+            segments.append({"text": text, "branded": True})
+        else:
+            segments.extend({"text": chunk, "branded": False} for chunk in split_script(text, max_length, language))
+    return segments
+
+
+def branded_chunks(segment_text: str, name: str, language: str, max_length: int = 500) -> List[str]:
+    """Fill a branded segment with a podcast name and chunk it for TTS"""
+    return split_script(fill_brand(segment_text, name), max_length, language)
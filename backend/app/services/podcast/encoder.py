@@ -0,0 +1,188 @@
+# services/podcast/encoder.py
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional
+
+from app.core.logger import logger
+
+from .ffmpeg_check import get_ffmpeg_path
+from .wav_utils import parse_wav
+
+# ffmpeg raw PCM input formats by WAV bits-per-sample
+PCM_CODECS = {8: "u8", 16: "s16le", 24: "s24le", 32: "s32le"}
+
+READ_SIZE = 64 * 1024
+
+
+class EncoderError(RuntimeError):
+    """Raised when the ffmpeg encoder process fails."""
+
+
+class FFmpegPipeEncoder:
+    """
+    Encode raw PCM to MP3 with a single long-lived ffmpeg process.
+    
+    PCM is written to ffmpeg's stdin as it becomes available and MP3 frames
+    are read from stdout concurrently, all through asyncio subprocess pipes,
+    so encoding overlaps with synthesis and never blocks the event loop.
+    
+    Usage (collect):
+        encoder = FFmpegPipeEncoder(fmt)
+        await encoder.start(collect=True)
+        await encoder.write(pcm_chunk)   # repeat as chunks arrive
+        mp3_bytes = await encoder.finish()
+    
+    Usage (stream): start(collect=False), write() from one task and
+    iterate read_output() from another.
+    """
+
+    def __init__(self, fmt: Dict[str, int], bitrate: str = "192k", quality: str = "2"):
+        self.fmt = fmt
+        self.bitrate = bitrate
+        self.quality = quality
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._collector: Optional[asyncio.Task] = None
+        self._output: List[bytes] = []
+
+    @staticmethod
+    def available() -> bool:
+        return get_ffmpeg_path() is not None
+
+    async def start(self, collect: bool = True) -> None:
+        ffmpeg_path = get_ffmpeg_path()
+        if not ffmpeg_path:
+            raise EncoderError("ffmpeg not available")
+
+        codec = PCM_CODECS.get(self.fmt["bits_per_sample"])
+        if codec is None or self.fmt.get("audio_format", 1) != 1:
+            raise EncoderError(f"Unsupported PCM format for ffmpeg pipe: {self.fmt}")
+
+        self._proc = await asyncio.create_subprocess_exec(
+            ffmpeg_path,
+            "-hide_banner", "-loglevel", "error",
+            "-f", codec,
+            "-ar", str(self.fmt["sample_rate"]),
+            "-ac", str(self.fmt["channels"]),
+            "-i", "pipe:0",
+            "-f", "mp3",
+            "-b:a", self.bitrate,
+            "-q:a", self.quality,
+            "pipe:1",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+        if collect:
+            self._collector = asyncio.create_task(self._collect())
+
+    async def write(self, pcm: bytes) -> None:
+        """Feed raw PCM (no header) to the encoder."""
+        if not pcm:
+            return
+        try:
+            self._proc.stdin.write(pcm)
+            await self._proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            raise EncoderError(f"ffmpeg closed its input: {await self._stderr()}") from e
+
+    async def close_input(self) -> None:
+        """Signal end of PCM input."""
+        if self._proc and self._proc.stdin and not self._proc.stdin.is_closing():
+            self._proc.stdin.close()
+            try:
+                await self._proc.stdin.wait_closed()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+    async def read_output(self) -> AsyncIterator[bytes]:
+        """Yield encoded MP3 bytes as ffmpeg produces them (stream mode)."""
+        while True:
+            data = await self._proc.stdout.read(READ_SIZE)
+            if not data:
+                break
+            yield data
+        await self._check_exit()
+
+    async def finish(self) -> bytes:
+        """Close input, wait for ffmpeg to flush, and return all MP3 bytes (collect mode)."""
+        await self.close_input()
+        await self._collector
+        await self._check_exit()
+        return b"".join(self._output)
+
+    async def abort(self) -> None:
+        """Kill the encoder process (e.g. when the client disconnects)."""
+        if self._collector and not self._collector.done():
+            self._collector.cancel()
+        if self._proc and self._proc.returncode is None:
+            try:
+                self._proc.kill()
+            except ProcessLookupError:
+                pass
+            await self._proc.wait()
+
+    async def _collect(self) -> None:
+        while True:
+            data = await self._proc.stdout.read(READ_SIZE)
+            if not data:
+                break
+            self._output.append(data)
+
+    async def _check_exit(self) -> None:
+        returncode = await self._proc.wait()
+        if returncode != 0:
+            raise EncoderError(f"ffmpeg exited with code {returncode}: {await self._stderr()}")
+
+    async def _stderr(self) -> str:
+        try:
+            err = await asyncio.wait_for(self._proc.stderr.read(), timeout=1.0)
+        except Exception:
+            return ""
+        return err.decode(errors="replace").strip()[:300]
+
+
+async def encode_wav_to_mp3(wav_bytes: bytes, bitrate: str = "192k") -> bytes:
+    """Encode a complete WAV file to MP3 through the ffmpeg pipe."""
+    fmt, offset, length = parse_wav(wav_bytes)
+    encoder = FFmpegPipeEncoder(fmt, bitrate=bitrate)
+    await encoder.start(collect=True)
+    try:
+        await encoder.write(memoryview(wav_bytes)[offset:offset + length])
+        return await encoder.finish()
+    except BaseException:
+        await encoder.abort()
+        raise
+
+
+async def stream_wav_as_mp3(wav_stream: AsyncIterator[bytes], bitrate: str = "192k") -> AsyncIterator[bytes]:
+    """
+    Re-encode a progressive WAV stream (header first, then raw PCM pieces)
+    into a progressive MP3 stream. PCM is fed from a background task while
+    MP3 frames are yielded as soon as ffmpeg emits them.
+    """
+    header = await wav_stream.__anext__()
+    fmt, _, _ = parse_wav(header)
+
+    encoder = FFmpegPipeEncoder(fmt, bitrate=bitrate)
+    await encoder.start(collect=False)
+
+    async def feed() -> None:
+        try:
+            async for pcm in wav_stream:
+                await encoder.write(pcm)
+        finally:
+            await encoder.close_input()
+            await wav_stream.aclose()
+
+    feeder = asyncio.create_task(feed())
+    try:
+        async for data in encoder.read_output():
+            yield data
+        # Surface TTS/encoding errors from the feeder
+        await feeder
+    finally:
+        if not feeder.done():
+            feeder.cancel()
+            await asyncio.gather(feeder, return_exceptions=True)
+        await encoder.abort()
+        logger.debug("MP3 stream encoder closed")
@@ -0,0 +1,110 @@
+# services/podcast/executor.py
+import time
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import settings
+from app.core.logger import logger
+
+
+class AudioExecutor:
+    """
+    Execution layer for CPU-bound audio DSP (WAV concatenation, resampling,
+    pydub MP3 export) so that work never runs on the uvicorn event loop.
+    
+    - kind "thread": ThreadPoolExecutor (low overhead, shares memory)
+    - kind "process": ProcessPoolExecutor (true parallelism; functions and
+      arguments must be picklable, i.e. module-level functions)
+    
+    At most `max_inflight` jobs are submitted to the pool at once; callers
+    beyond that wait in a queue whose depth is reported by stats().
+    """
+
+    def __init__(self, kind: str, max_workers: int, max_inflight: int):
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_inflight = max_inflight
+
+        self._executor: Optional[Executor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        self.queued = 0
+        self.running = 0
+        self.max_queue_depth = 0
+        self.completed = 0
+        self.failed = 0
+        self.total_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                if self.kind != "thread":
+                    logger.warning(f"Unknown AUDIO_EXECUTOR_KIND '{self.kind}', using threads")
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="audio-dsp"
+                )
+            logger.info(f"✓ Audio executor started ({self.kind}, {self.max_workers} workers)")
+        return self._executor
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run fn(*args) in the pool and await its result."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_inflight)
+
+        queued_at = time.perf_counter()
+        self.queued += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queued)
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.queued -= 1
+
+        started = time.perf_counter()
+        self.total_wait_seconds += started - queued_at
+        self.running += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._get_executor(), fn, *args)
+            self.completed += 1
+            return result
+        except BaseException:
+            self.failed += 1
+            raise
+        finally:
+            self.running -= 1
+            self.total_run_seconds += time.perf_counter() - started
+            self._semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        finished = self.completed + self.failed
+        return {
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "max_inflight": self.max_inflight,
+            "queue_depth": self.queued,
+            "max_queue_depth": self.max_queue_depth,
+            "running": self.running,
+            "completed": self.completed,
+            "failed": self.failed,
+            "avg_wait_seconds": round(self.total_wait_seconds / finished, 4) if finished else 0.0,
+            "avg_run_seconds": round(self.total_run_seconds / finished, 4) if finished else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            logger.info("Audio executor stopped")
+
+
+# Global instance
+audio_executor = AudioExecutor(
+    kind=settings.AUDIO_EXECUTOR_KIND,
+    max_workers=settings.AUDIO_EXECUTOR_WORKERS,
+    max_inflight=settings.AUDIO_EXECUTOR_MAX_INFLIGHT,
+)
@@ -1,5 +1,7 @@
 import os
+import shutil
 import subprocess
+from functools import lru_cache
 from typing import Optional
 
 from app.core.logger import logger
@@ -45,4 +47,22 @@ def check_ffmpeg() -> Optional[str]:
             return None
     else:
         logger.warning("⚠️ ffmpeg not found. MP3 conversion will be skipped. Install with: sudo apt-get install ffmpeg")
-        return None
\ No newline at end of file
+        return None
+
+
+@lru_cache(maxsize=1)
+def get_ffmpeg_path() -> Optional[str]:
+    """
+    Locate the ffmpeg binary for direct subprocess use (no pydub required).
+    The result is cached for the lifetime of the process.
+    """
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path:
+        return ffmpeg_path
+
+    for path in ['/usr/bin/ffmpeg', '/usr/local/bin/ffmpeg', '/opt/homebrew/bin/ffmpeg']:
+        if os.path.exists(path):
+            return path
+
+    logger.warning("⚠️ ffmpeg not found. Falling back to pydub for MP3 conversion.")
+    return None
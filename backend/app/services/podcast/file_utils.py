@@ -4,10 +4,11 @@ from typing import Optional
 
 from app.core.config import settings
 from app.core.logger import logger
+from app.services.storage.backends import storage_backend
 
 
 async def save_script(script: str, topic: str = "podcast") -> Optional[str]:
-    """Saves the generated script to a .txt file."""
+    """Saves the generated script to a .txt file (through the storage backend). Returns its location."""
     try:
         clean_topic = "".join([c if c.isalnum() else "_" for c in topic]).strip("_")
         if not clean_topic:
@@ -16,13 +17,10 @@ async def save_script(script: str, topic: str = "podcast") -> Optional[str]:
         filename = f"{clean_topic}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
         filepath = os.path.join(settings.RAW_DATA_STORAGE_PATH, filename)
 
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        location = await storage_backend.write_text(filepath, script)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(script)
-
-        logger.info(f"✓ Podcast script saved: {filepath}")
-        return filepath
+        logger.info(f"✓ Podcast script saved: {location}")
+        return location
 
     except Exception as e:
         logger.error(f"Failed to save podcast script: {str(e)}")
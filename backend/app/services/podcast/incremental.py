@@ -0,0 +1,234 @@
+# services/podcast/incremental.py
+import re
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.logger import logger
+
+from .audio import (
+    HTTPX_AVAILABLE,
+    TTSChunkError,
+    conform_wav_chunk,
+    sarvam_client_scope,
+    save_chunk_audio,
+    synthesize_chunks,
+)
+from .executor import audio_executor
+from .sarvam_client import SarvamTTSClient
+from .script_splitting import split_script
+from .wav_utils import build_wav_header, parse_wav, same_format
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def _normalize(text: str) -> str:
+    # split_script joins sentences with single spaces, so chunk texts are
+    # only found verbatim in a script with its whitespace collapsed
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def align_chunks(
+    old_chunks: List[str],
+    new_script: str,
+    language: str,
+    max_length: int = 500
+) -> List[Tuple[Optional[int], str]]:
+    """
+    Plan the chunks of an edited script against the chunks of its last render.
+
+    Old chunks found verbatim (in order) in the new script are kept as they
+    are; only the text between them — the edited sentences — is split into
+    new chunks. Re-splitting the whole script instead would shift chunk
+    boundaries after any edit and invalidate every chunk's audio.
+
+    Returns:
+        [(old_chunk_index, text), ...] in script order; old_chunk_index is
+        None for chunks that must be synthesized
+    """
+    text = _normalize(new_script)
+    plan: List[Tuple[Optional[int], str]] = []
+    pos = 0
+
+    def add_gap(end: int):
+        gap = text[pos:end].strip()
+        if gap:
+            plan.extend((None, chunk) for chunk in split_script(gap, max_length, language))
+
+    for index, chunk in enumerate(old_chunks):
+        needle = _normalize(chunk)
+        found = text.find(needle, pos) if needle else -1
+        if found < 0:
+            continue
+        add_gap(found)
+        plan.append((index, chunk))
+        pos = found + len(needle)
+    add_gap(len(text))
+
+    return plan
+
+
+def assemble_master(
+    plan: List[Tuple[Optional[int], str]],
+    new_audio: List[bytes],
+    previous: Optional[Dict[str, Any]] = None,
+    previous_master: Optional[bytes] = None
+) -> Tuple[bytes, Dict[str, Any]]:
+    """
+    Build the master WAV of a render and its chunk manifest.
+    Kept chunks are sliced out of the previous master's PCM by their stored
+    offsets; new chunks are appended from their synthesized WAV bytes.
+    Blocking: call through audio_executor from async code.
+
+    Returns:
+        (master WAV bytes, {"format": {...}, "chunks": [{"text", "offset", "length"}, ...], "pcm_bytes": n})
+    """
+    if previous is not None:
+        target_fmt = previous["format"]
+        _, previous_offset, _ = parse_wav(previous_master)
+    else:
+        target_fmt = parse_wav(new_audio[0])[0]
+        previous_offset = 0
+
+    parts: List[memoryview] = []
+    chunks: List[Dict[str, Any]] = []
+    new_iter = iter(new_audio)
+    position = 0
+
+    for old_index, text in plan:
+        if old_index is not None:
+            entry = previous["chunks"][old_index]
+            start = previous_offset + entry["offset"]
+            part = memoryview(previous_master)[start:start + entry["length"]]
+        else:
+            chunk_bytes = next(new_iter)
+            fmt, offset, length = parse_wav(chunk_bytes)
+            if same_format(target_fmt, fmt):
+                part = memoryview(chunk_bytes)[offset:offset + length]
+            else:
+                part = memoryview(conform_wav_chunk(chunk_bytes, target_fmt))
+
+        parts.append(part)
+        chunks.append({"text": text, "offset": position, "length": len(part)})
+        position += len(part)
+
+    header = build_wav_header(target_fmt, position)
+    master = bytearray(len(header) + position)
+    master[:len(header)] = header
+    cursor = len(header)
+    for part in parts:
+        master[cursor:cursor + len(part)] = part
+        cursor += len(part)
+
+    fmt_keys = ("audio_format", "channels", "sample_rate", "byte_rate", "block_align", "bits_per_sample")
+    manifest = {
+        "format": {key: target_fmt[key] for key in fmt_keys if key in target_fmt},
+        "chunks": chunks,
+        "pcm_bytes": position,
+    }
+    return bytes(master), manifest
+
+
+async def render_script_incremental(
+    script: str,
+    sarvam_api_key: str,
+    tts_url: str,
+    language: str = "hi",
+    speaker: Optional[str] = None,
+    output_format: Optional[str] = "mp3",
+    previous: Optional[Dict[str, Any]] = None,
+    previous_master: Optional[bytes] = None,
+    audio_storage_path: str = settings.AUDIO_STORAGE_PATH,
+    max_concurrency: Optional[int] = None,
+    sarvam_client: Optional[SarvamTTSClient] = None,
+    chunks: Optional[List[str]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Render a script and return the render's manifest and master WAV.
+
+    With a previous render (manifest + master WAV of an earlier version of
+    the script), only chunks whose text changed are sent to TTS; the rest
+    of the audio is spliced from the previous master's PCM. A one-number
+    correction then costs one chunk's TTS instead of the whole episode's.
+
+    Args:
+        script: Script text to render
+        output_format: "mp3" or "wav" audio file to publish, or None to only
+                 build the master (e.g. a baseline for a later re-render)
+        previous: Manifest of the previous render (RenderStore record)
+        previous_master: Master WAV bytes of the previous render
+        chunks: Chunks the script was voiced with before, used instead of
+                 split_script when there is no previous render (so the
+                 baseline of a streamed episode hits the TTS cache)
+        (other args as in generate_audio_from_script)
+
+    Returns:
+        {
+            "audio": "/audio/podcast_en_....mp3" (None if output_format is None),
+            "master": <master WAV bytes>,
+            "manifest": {"format": {...}, "chunks": [...], "pcm_bytes": ...},
+            "reused": 11,
+            "synthesized": 1
+        }
+        or None if failed
+    """
+    if not HTTPX_AVAILABLE:
+        logger.error("httpx is not installed. Cannot generate audio.")
+        return None
+
+    if not sarvam_api_key:
+        logger.warning("Sarvam API key not provided. Cannot generate audio.")
+        return None
+
+    target_speaker = speaker or "anushka"
+
+    if previous is not None and previous_master is not None:
+        plan = align_chunks([entry["text"] for entry in previous["chunks"]], script, language)
+    else:
+        previous, previous_master = None, None
+        plan = [(None, chunk) for chunk in (chunks or split_script(script, max_length=500, language=language))]
+
+    new_texts = [text for old_index, text in plan if old_index is None]
+    reused = len(plan) - len(new_texts)
+    logger.info(
+        f"🎙️ Incremental render → language: {language} | speaker: {target_speaker} | "
+        f"{reused} chunk(s) reused, {len(new_texts)} to synthesize"
+    )
+
+    if not plan:
+        logger.error("Script is empty — nothing to render")
+        return None
+
+    try:
+        async with sarvam_client_scope(sarvam_client, sarvam_api_key, tts_url) as client:
+            new_audio = await synthesize_chunks(
+                client, new_texts, sarvam_api_key, tts_url, language, target_speaker,
+                max_concurrency=max_concurrency
+            )
+
+        master, manifest = await audio_executor.run(assemble_master, plan, new_audio, previous, previous_master)
+
+        audio_path = None
+        if output_format:
+            async def master_stream() -> AsyncIterator[bytes]:
+                yield master
+
+            audio_path = await save_chunk_audio(master_stream(), language, output_format, audio_storage_path)
+            if not audio_path:
+                return None
+
+        logger.info(f"✓ Incremental render complete ({len(manifest['chunks'])} chunks, {len(new_texts)} synthesized)")
+        return {
+            "audio": audio_path,
+            "master": master,
+            "manifest": manifest,
+            "reused": reused,
+            "synthesized": len(new_texts),
+        }
+
+    except TTSChunkError as e:
+        logger.error(str(e))
+        return None
+
+    except Exception as e:
+        logger.exception(f"Incremental render failed: {str(e)}")
+        return None
@@ -0,0 +1,47 @@
+# services/podcast/rate_limit.py
+import asyncio
+import hashlib
+from typing import Dict
+
+from app.core.config import settings
+
+
+class AsyncRateLimiter:
+    """
+    Spaces out request starts so that at most `rate_per_second` calls
+    begin per second. A rate of 0 (or less) disables limiting.
+    """
+
+    def __init__(self, rate_per_second: float):
+        self.interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        """Wait until the next request slot is available."""
+        if self.interval <= 0:
+            return
+
+        now = asyncio.get_running_loop().time()
+        wait = self._next_slot - now
+        self._next_slot = max(now, self._next_slot) + self.interval
+
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+_limiters: Dict[str, AsyncRateLimiter] = {}
+
+
+def api_key_id(api_key: str) -> str:
+    """Short hash of an API key, so raw credentials are never kept as dict keys."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+def get_rate_limiter(api_key: str) -> AsyncRateLimiter:
+    """Return the shared rate limiter for an API key."""
+    key_id = api_key_id(api_key)
+    limiter = _limiters.get(key_id)
+    if limiter is None:
+        limiter = AsyncRateLimiter(settings.SARVAM_TTS_RATE_LIMIT_PER_SECOND)
+        _limiters[key_id] = limiter
+    return limiter
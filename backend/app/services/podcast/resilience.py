@@ -0,0 +1,136 @@
+# services/podcast/resilience.py
+import time
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.core.logger import logger
+
+# Upstream statuses worth retrying; other 4xx responses are permanent
+RETRYABLE_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(
+    attempt: int,
+    base: Optional[float] = None,
+    cap: Optional[float] = None,
+    retry_after: Optional[float] = None,
+) -> float:
+    """
+    Exponential backoff with full jitter for the given retry attempt (1-based).
+    A server-provided Retry-After is honoured as a lower bound.
+    """
+    base = settings.SARVAM_TTS_RETRY_BASE_SECONDS if base is None else base
+    cap = settings.SARVAM_TTS_RETRY_MAX_SECONDS if cap is None else cap
+    delay = random.uniform(0, min(cap, base * (2 ** (attempt - 1))))
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, cap))
+    return delay
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker around an upstream endpoint.
+    
+    - closed: calls flow; `failure_threshold` consecutive failures open it
+    - open: calls are rejected for `reset_timeout` seconds
+    - half_open: one trial call is let through; success closes the
+      circuit, failure re-opens it
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+
+        self.rejected = 0
+        self.times_opened = 0
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError if the call must not be attempted."""
+        if self.state == "open":
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                self.rejected += 1
+                raise CircuitOpenError(f"{self.name} circuit is open")
+            self.state = "half_open"
+            self._trial_in_flight = False
+
+        if self.state == "half_open":
+            if self._trial_in_flight:
+                self.rejected += 1
+                raise CircuitOpenError(f"{self.name} circuit is half-open (trial in progress)")
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        if self.state != "closed":
+            logger.info(f"✓ {self.name} circuit closed")
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """
+        Free the half-open trial slot of a call that ended without an outcome
+        (cancelled, or failed before a response could be judged), so the
+        next call can make the trial instead of being rejected forever.
+        """
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        self._trial_in_flight = False
+        if self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+            if self.state != "open":
+                self.times_opened += 1
+                logger.warning(
+                    f"⚠️ {self.name} circuit opened after {self.consecutive_failures} consecutive failures"
+                )
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "reset_timeout": self.reset_timeout,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+        }
+
+
+# Global instance guarding the Sarvam TTS endpoint
+sarvam_circuit_breaker = CircuitBreaker(
+    name="Sarvam TTS",
+    failure_threshold=settings.SARVAM_TTS_CIRCUIT_FAILURE_THRESHOLD,
+    reset_timeout=settings.SARVAM_TTS_CIRCUIT_RESET_SECONDS,
+)
@@ -0,0 +1,176 @@
+# services/podcast/sarvam_client.py
+import time
+from typing import Any, Dict, Optional
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2 support)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+from app.core.config import settings
+from app.core.logger import logger
+
+from .rate_limit import api_key_id
+
+
+class SarvamTTSClient:
+    """
+    App-lifetime pooled HTTP client for the Sarvam TTS endpoint.
+    
+    One httpx.AsyncClient (keep-alive, connection-pool limits, HTTP/2 when
+    the `h2` package is installed) is shared by every episode and language,
+    so chunks reuse warm TCP+TLS connections instead of paying a new
+    handshake per call. Auth headers are built once per API key.
+    
+    Opened/closed by PodcastService in the FastAPI lifespan.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str],
+        tts_url: str,
+        max_connections: int = settings.SARVAM_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections: int = settings.SARVAM_HTTP_MAX_KEEPALIVE,
+        http2: bool = settings.SARVAM_HTTP2,
+        timeout: float = settings.SARVAM_HTTP_TIMEOUT,
+    ):
+        self.api_key = api_key
+        self.tts_url = tts_url
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.timeout = timeout
+
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._headers: Dict[str, Dict[str, str]] = {}
+
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.batched_requests = 0
+        self.batch_rejections = 0
+        # Batching pauses for a while after Sarvam refuses a multi-input request
+        self._batching_paused_until = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.http_versions: Dict[str, int] = {}
+
+        if http2 and not HTTP2_AVAILABLE:
+            logger.warning("h2 not installed; Sarvam client will use HTTP/1.1. Install with: pip install 'httpx[http2]'")
+
+    @property
+    def batch_inputs_supported(self) -> bool:
+        return time.monotonic() >= self._batching_paused_until
+
+    def pause_batching(self, seconds: float) -> None:
+        """Send single-input requests for `seconds` after a batched request was refused."""
+        self.batch_rejections += 1
+        self._batching_paused_until = max(self._batching_paused_until, time.monotonic() + seconds)
+
+    @property
+    def is_open(self) -> bool:
+        return self._client is not None and not self._client.is_closed
+
+    async def start(self) -> None:
+        """Open the pooled client (idempotent)."""
+        if self.is_open:
+            return
+        if not HTTPX_AVAILABLE:
+            logger.error("httpx is not installed. Sarvam client unavailable.")
+            return
+
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+            ),
+        )
+        logger.info(
+            f"✓ Sarvam client opened (http2: {self.http2}, max connections: {self.max_connections})"
+        )
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.info("Sarvam client closed")
+
+    async def __aenter__(self) -> "SarvamTTSClient":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _headers_for(self, api_key: str) -> Dict[str, str]:
+        key_id = api_key_id(api_key)
+        headers = self._headers.get(key_id)
+        if headers is None:
+            headers = {
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json"
+            }
+            self._headers[key_id] = headers
+        return headers
+
+    async def post_tts(
+        self,
+        payload: Dict[str, Any],
+        api_key: Optional[str] = None,
+        tts_url: Optional[str] = None,
+    ) -> "httpx.Response":
+        """POST one TTS payload over the pooled connection."""
+        if not self.is_open:
+            await self.start()
+
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            resp = await self._client.post(
+                tts_url or self.tts_url,
+                json=payload,
+                headers=self._headers_for(api_key or self.api_key),
+            )
+            self.http_versions[resp.http_version] = self.http_versions.get(resp.http_version, 0) + 1
+            if resp.status_code != 200:
+                self.errors += 1
+            return resp
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            self.in_flight -= 1
+
+    def _open_connections(self) -> int:
+        # httpx does not expose pool state publicly; read it defensively
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        return len(getattr(pool, "connections", []) or [])
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "open": self.is_open,
+            "http2": self.http2,
+            "max_connections": self.max_connections,
+            "max_keepalive_connections": self.max_keepalive_connections,
+            "open_connections": self._open_connections() if self.is_open else 0,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "pool_utilization": round(self.in_flight / self.max_connections, 4) if self.max_connections else 0.0,
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "batched_requests": self.batched_requests,
+            "batch_inputs_supported": self.batch_inputs_supported,
+            "batch_rejections": self.batch_rejections,
+            "http_versions": dict(self.http_versions),
+        }
@@ -1,10 +1,28 @@
 import re
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
+from app.core.config import settings
 from app.core.logger import logger
 
 
-def split_script(script: str, max_length: int = 500, language: str = "en") -> List[str]:
+# Sentence delimiters: Devanagari Danda (।) and Double Danda (॥) for Hindi
+SENTENCE_PATTERNS = {
+    "en": re.compile(r'(?<=[.!?])\s+'),
+    "hi": re.compile(r'(?<=[.!?।॥])\s+'),
+}
+
+# Clause boundaries used when a single sentence exceeds max_length
+CLAUSE_PATTERN = re.compile(r'(?<=[,;:—–])\s+')
+
+SPLIT_STRATEGIES = ("balanced", "greedy")
+
+
+def split_script(
+    script: str,
+    max_length: int = 500,
+    language: str = "en",
+    strategy: Optional[str] = None
+) -> List[str]:
     """
     Split long script into chunks of max_length characters.
     Splits at sentence boundaries to keep sentences intact.
@@ -14,62 +32,206 @@ def split_script(script: str, max_length: int = 500, language: str = "en") -> Li
     Each chunk will be sent separately to TTS API (max 500 characters per chunk).
     Do NOT combine or merge chunks.
     
+    Strategies:
+    - "balanced" (default): sentences longer than max_length are broken at
+      clause boundaries (then words), so no chunk exceeds the cap. Chunks
+      are packed into the minimum possible count, and sizes are then
+      evened out (smallest cap that keeps that count) for steadier TTS latency.
+    - "greedy": legacy packing; appends sentences until the next one would
+      overflow. Oversized sentences pass through unchanged.
+    
     Args:
         script: Script text to split
         max_length: Maximum characters per chunk (default 500)
         language: 'en' for English or 'hi' for Hindi
+        strategy: "balanced" or "greedy" (default: settings.SCRIPT_SPLIT_STRATEGY)
     
     Returns:
         List of SEPARATE script chunks (each <= max_length characters)
     """
+    strategy = strategy or settings.SCRIPT_SPLIT_STRATEGY
+    if strategy not in SPLIT_STRATEGIES:
+        logger.warning(f"Unknown split strategy '{strategy}', using 'balanced'")
+        strategy = "balanced"
+
     if len(script) <= max_length:
         logger.info(f"Script length: {len(script)} chars (within limit)")
         return [script]
 
-    logger.info(f"Script length: {len(script)} chars - splitting into chunks of max {max_length} chars (language: {language})")
+    logger.info(
+        f"Script length: {len(script)} chars - splitting into chunks of max {max_length} chars "
+        f"(language: {language}, strategy: {strategy})"
+    )
 
-    chunks = []
-    current_chunk = ""
+    # Split by sentence delimiters, keeping the delimiter
+    sentence_pattern = SENTENCE_PATTERNS["hi" if language == "hi" else "en"]
+    sentences = [s.strip() for s in sentence_pattern.split(script) if s.strip()]
 
-    # Use different sentence delimiters based on language
-    if language == "hi":
-        # Hindi sentence delimiters: Devanagari Danda (।) and Double Danda (॥)
-        sentence_pattern = r'(?<=[.!?।॥])\s+'
+    if strategy == "greedy":
+        chunks = _pack_greedy(sentences, max_length)
     else:
-        # English sentence delimiters: Period, Exclamation, Question
-        sentence_pattern = r'(?<=[.!?])\s+'
+        units = []
+        for sentence in sentences:
+            units.extend(_split_long_unit(sentence, max_length))
+        chunks = _pack_balanced(units, max_length)
 
-    # Split by sentence delimiters, keeping the delimiter
-    sentences = re.split(sentence_pattern, script)
+    logger.info(f"✅ Split into {len(chunks)} SEPARATE chunks (for Sarvam TTS processing):")
+    for idx, chunk in enumerate(chunks, 1):
+        logger.info(f"   Chunk {idx}: {len(chunk)} characters (ready for TTS)")
+
+    return chunks
 
-    for sentence in sentences:
-        sentence = sentence.strip()
-        if not sentence:
-            continue
 
-        if current_chunk and len(current_chunk) + len(sentence) + 1 > max_length:
+def _pack_greedy(units: List[str], max_length: int) -> List[str]:
+    """Append units to the current chunk until the next one would overflow."""
+    chunks = []
+    current_chunk = ""
+
+    for unit in units:
+        if current_chunk and len(current_chunk) + len(unit) + 1 > max_length:
             chunks.append(current_chunk.strip())
-            current_chunk = sentence
+            current_chunk = unit
         else:
             if current_chunk:
-                current_chunk += " " + sentence
+                current_chunk += " " + unit
             else:
-                current_chunk = sentence
+                current_chunk = unit
 
     if current_chunk:
         chunks.append(current_chunk.strip())
 
-    logger.info(f"✅ Split into {len(chunks)} SEPARATE chunks (for Sarvam TTS processing):")
-    for idx, chunk in enumerate(chunks, 1):
-        logger.info(f"   Chunk {idx}: {len(chunk)} characters (ready for TTS)")
-
     return chunks
 
 
+def _count_greedy(lengths: List[int], cap: int) -> int:
+    """Number of chunks _pack_greedy would produce for units of these lengths."""
+    count = 0
+    current = -1
+    for length in lengths:
+        if current >= 0 and current + length + 1 > cap:
+            count += 1
+            current = length
+        else:
+            current = length if current < 0 else current + length + 1
+    return count + (1 if current >= 0 else 0)
+
+
+def _pack_balanced(units: List[str], max_length: int) -> List[str]:
+    """
+    Linear partition of units (each <= max_length) into contiguous chunks.
+    
+    Greedy packing already yields the minimum chunk count K for a cap;
+    binary search then finds the smallest cap that still fits in K chunks,
+    which minimizes the largest chunk and evens out the tail.
+    """
+    if not units:
+        return []
+
+    lengths = [len(unit) for unit in units]
+    target_count = _count_greedy(lengths, max_length)
+
+    total = sum(lengths) + len(lengths) - 1
+    low = max(max(lengths), -(-total // target_count) - 1)
+    high = max_length
+    while low < high:
+        mid = (low + high) // 2
+        if _count_greedy(lengths, mid) <= target_count:
+            high = mid
+        else:
+            low = mid + 1
+
+    return _pack_greedy(units, low)
+
+
+def _split_long_unit(sentence: str, max_length: int) -> List[str]:
+    """
+    Break a sentence longer than max_length into packing units at clause
+    boundaries (, ; : dashes), then at word boundaries, then by hard
+    slicing. The units are re-joined by the packer.
+    """
+    if len(sentence) <= max_length:
+        return [sentence]
+
+    pieces = []
+    for clause in CLAUSE_PATTERN.split(sentence):
+        if len(clause) <= max_length:
+            pieces.append(clause)
+            continue
+        for word in clause.split():
+            if len(word) <= max_length:
+                pieces.append(word)
+            else:
+                pieces.extend(word[i:i + max_length] for i in range(0, len(word), max_length))
+
+    return pieces
+
+
+class IncrementalScriptSplitter:
+    """
+    Split a script into TTS chunks while it is still being generated.
+
+    feed() takes the next piece of (cleaned) script text and returns the
+    chunks that can no longer change; close() returns the rest. Only
+    completed sentences are packed; text after the last sentence boundary
+    is held back until more arrives.
+
+    Chunks are packed greedily (a chunk is emitted as soon as the next
+    sentence would overflow it), since balanced packing needs the whole
+    script. Long sentences are still broken at clause/word boundaries, so
+    no chunk exceeds max_length.
+    """
+
+    def __init__(self, max_length: int = 500, language: str = "en"):
+        self.max_length = max_length
+        self.language = language
+        self._pattern = SENTENCE_PATTERNS["hi" if language == "hi" else "en"]
+        self._buffer = ""
+        self._current = ""
+
+    def feed(self, text: str) -> List[str]:
+        """Add script text; return newly completed chunks (may be empty)."""
+        self._buffer += text
+
+        last_end = 0
+        for match in self._pattern.finditer(self._buffer):
+            last_end = match.end()
+        if not last_end:
+            return []
+
+        complete, self._buffer = self._buffer[:last_end], self._buffer[last_end:]
+        return self._pack(complete)
+
+    def close(self) -> List[str]:
+        """Flush the held-back text and return the final chunks."""
+        chunks = self._pack(self._buffer)
+        self._buffer = ""
+        if self._current:
+            chunks.append(self._current)
+            self._current = ""
+        return chunks
+
+    def _pack(self, text: str) -> List[str]:
+        chunks = []
+        for sentence in self._pattern.split(text):
+            sentence = sentence.strip()
+            if not sentence:
+                continue
+            for unit in _split_long_unit(sentence, self.max_length):
+                if self._current and len(self._current) + len(unit) + 1 > self.max_length:
+                    chunks.append(self._current)
+                    self._current = unit
+                elif self._current:
+                    self._current += " " + unit
+                else:
+                    self._current = unit
+        return chunks
+
+
 def split_podcast_scripts(
-    eng_script: str,
-    hin_script: str,
-    max_length: int = 500
+    eng_script: Optional[str],
+    hin_script: Optional[str],
+    max_length: int = 500,
+    strategy: Optional[str] = None
 ) -> Dict[str, any]:
     """
     Split both English and Hindi podcast scripts into SEPARATE chunks.
@@ -79,9 +241,10 @@ def split_podcast_scripts(
     separately to Sarvam TTS API with maximum 500 characters per API call.
     
     Args:
-        eng_script: English podcast script
-        hin_script: Hindi podcast script (Devanagari)
+        eng_script: English podcast script (None if not generated: no chunks)
+        hin_script: Hindi podcast script (Devanagari; None if not generated)
         max_length: Maximum characters per chunk (default 500 - Sarvam TTS limit)
+        strategy: Packing strategy passed to split_script ("balanced" or "greedy")
     
     Returns:
         Dictionary containing:
@@ -111,12 +274,14 @@ def split_podcast_scripts(
     # Split English script
     logger.info("\n[1/2] SPLITTING ENGLISH PODCAST SCRIPT (eng_pod)")
     logger.info("-" * 70)
-    eng_chunks = split_script(eng_script, max_length, language="en")
+    eng_script = eng_script or ""
+    eng_chunks = split_script(eng_script, max_length, language="en", strategy=strategy) if eng_script else []
     
     # Split Hindi script
     logger.info("\n[2/2] SPLITTING HINDI PODCAST SCRIPT (hin_pod)")
     logger.info("-" * 70)
-    hin_chunks = split_script(hin_script, max_length, language="hi")
+    hin_script = hin_script or ""
+    hin_chunks = split_script(hin_script, max_length, language="hi", strategy=strategy) if hin_script else []
     
     # Compile results
     result = {
@@ -197,9 +362,13 @@ def get_script_chunk(
     return chunk
 
 
-def validate_script_chunks(scripts_dict: Dict[str, any]) -> bool:
+def validate_script_chunks(
+    scripts_dict: Dict[str, any],
+    languages: Tuple[str, ...] = ("en", "hi")
+) -> bool:
     """
     Validate that both English and Hindi scripts are properly split into SEPARATE chunks.
+    Only the languages listed in `languages` must have chunks.
     Checks:
     - All required keys present
     - Chunks exist and are non-empty
@@ -208,6 +377,7 @@ def validate_script_chunks(scripts_dict: Dict[str, any]) -> bool:
     
     Args:
         scripts_dict: Dictionary returned from split_podcast_scripts()
+        languages: Languages whose chunks are required ("en", "hi")
     
     Returns:
         True if valid, False otherwise
@@ -238,7 +408,7 @@ def validate_script_chunks(scripts_dict: Dict[str, any]) -> bool:
         eng_chunks = scripts_dict.get("eng_pod_chunks", [])
         eng_count = scripts_dict.get("eng_pod_count", 0)
         
-        if not eng_chunks:
+        if not eng_chunks and "en" in languages:
             logger.error("✗ No English chunks found")
             return False
         
@@ -262,7 +432,7 @@ def validate_script_chunks(scripts_dict: Dict[str, any]) -> bool:
         hin_chunks = scripts_dict.get("hin_pod_chunks", [])
         hin_count = scripts_dict.get("hin_pod_count", 0)
         
-        if not hin_chunks:
+        if not hin_chunks and "hi" in languages:
             logger.error("✗ No Hindi chunks found")
             return False
         
@@ -6,7 +6,19 @@ from app.core.config import settings
 from app.core.logger import logger
 
 from .file_utils import save_script
-from .audio import generate_audio_from_script, generate_podcast_audio
+from .audio import (
+    generate_audio_from_chunk_stream,
+    generate_branded_audio,
+    generate_audio_from_script,
+    generate_podcast_audio,
+    stream_audio_from_script,
+    stream_media_type,
+)
+from .executor import audio_executor
+from .incremental import render_script_incremental
+from .resilience import sarvam_circuit_breaker
+from .sarvam_client import SarvamTTSClient
+from .tts_cache import tts_chunk_cache
 
 
 class PodcastService:
@@ -21,17 +33,73 @@ class PodcastService:
     """
     
     def __init__(self):
-        self.tts_url = "https://api.sarvam.ai/text-to-speech"
+        self.tts_url = settings.SARVAM_TTS_URL
         self.sarvam_api_key = getattr(settings, 'SARVAM_API_KEY', None)
+        # App-lifetime pooled client shared by every episode and language
+        self.sarvam_client = SarvamTTSClient(api_key=self.sarvam_api_key, tts_url=self.tts_url)
+
+    async def startup(self):
+        """Open pooled resources (called from the app lifespan)"""
+        await self.sarvam_client.start()
+        await tts_chunk_cache.migrate_legacy_dir()
+
+    async def shutdown(self):
+        """Release pooled resources (called from the app lifespan)"""
+        await self.sarvam_client.close()
+        audio_executor.shutdown()
 
     async def generate_audio_from_script(self, *args, **kwargs):
         """Delegate to standalone audio generation function"""
+        kwargs.setdefault("sarvam_client", self.sarvam_client)
         return await generate_audio_from_script(*args, **kwargs)
 
+    async def generate_audio_from_chunk_stream(self, *args, **kwargs):
+        """Delegate to standalone streamed-chunk audio generation function"""
+        kwargs.setdefault("sarvam_client", self.sarvam_client)
+        return await generate_audio_from_chunk_stream(*args, **kwargs)
+
+    async def generate_branded_audio(self, *args, **kwargs):
+        """Delegate to standalone batch (shared body + branded intro) audio generation"""
+        kwargs.setdefault("sarvam_client", self.sarvam_client)
+        return await generate_branded_audio(*args, **kwargs)
+
+    async def render_script_incremental(self, *args, **kwargs):
+        """Delegate to standalone diff-aware render (reuses unchanged chunks of a previous render)"""
+        kwargs.setdefault("sarvam_client", self.sarvam_client)
+        return await render_script_incremental(*args, **kwargs)
+
     async def generate_podcast_audio(self, *args, **kwargs):
         """Delegate to standalone podcast audio generation function"""
+        kwargs.setdefault("sarvam_client", self.sarvam_client)
         return await generate_podcast_audio(*args, **kwargs)
 
+    def stream_audio_from_script(self, *args, **kwargs):
+        """Delegate to standalone progressive audio generator"""
+        kwargs.setdefault("sarvam_client", self.sarvam_client)
+        return stream_audio_from_script(*args, **kwargs)
+
+    def stream_media_type(self, output_format: str) -> str:
+        """Media type produced by stream_audio_from_script() for a format"""
+        return stream_media_type(output_format)
+
+    def get_tts_cache_stats(self) -> Dict:
+        """Hit/miss counters and sizes of the TTS chunk cache"""
+        return {
+            "enabled": settings.TTS_CACHE_ENABLED,
+            **tts_chunk_cache.stats()
+        }
+
+    def get_audio_executor_stats(self) -> Dict:
+        """Queue depth and throughput of the audio DSP executor"""
+        return audio_executor.stats()
+
+    def get_sarvam_client_stats(self) -> Dict:
+        """Connection pool utilization of the shared Sarvam client"""
+        return {
+            **self.sarvam_client.stats(),
+            "circuit_breaker": sarvam_circuit_breaker.stats()
+        }
+
     async def generate_full_podcast(
         self,
         eng_script: str,
@@ -152,7 +220,8 @@ class PodcastService:
                 tts_url=self.tts_url,
                 output_format=output_format,
                 eng_speaker=eng_speaker,
-                hin_speaker=hin_speaker
+                hin_speaker=hin_speaker,
+                sarvam_client=self.sarvam_client
             )
             
             if not audio_result or not audio_result.get("success"):
@@ -321,7 +390,8 @@ class PodcastService:
             tts_url=self.tts_url,
             language=language,
             output_format=output_format,
-            speaker=speaker
+            speaker=speaker,
+            sarvam_client=self.sarvam_client
         )
         
         if not audio_path:
@@ -0,0 +1,225 @@
+# services/podcast/tts_cache.py
+import os
+import json
+import asyncio
+import shutil
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+from app.core.config import settings
+from app.core.logger import logger
+
+
+class TTSChunkCache:
+    """
+    Content-addressed cache for decoded Sarvam TTS chunk audio (WAV bytes).
+    
+    Keys are a SHA-256 of the exact TTS payload (text, language, speaker,
+    pitch, pace, loudness), so any change to the request produces a new key.
+    
+    Two tiers:
+    - In-memory LRU (bounded by max_memory_bytes) for hot chunks
+    - On-disk store (bounded by max_disk_bytes, oldest-first eviction)
+    """
+
+    def __init__(self, cache_dir: str, max_disk_bytes: int, max_memory_bytes: int, legacy_dir: Optional[str] = None):
+        self.cache_dir = cache_dir
+        self.legacy_dir = legacy_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.max_memory_bytes = max_memory_bytes
+
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes: Optional[int] = None
+        self._disk_lock = threading.Lock()
+
+        self.hits = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(payload: Dict[str, Any]) -> str:
+        """Hash the exact TTS payload into a stable cache key."""
+        canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Return cached WAV bytes for key, or None on miss."""
+        data = self._memory.get(key)
+        if data is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            self.memory_hits += 1
+            return data
+
+        data = await asyncio.to_thread(self._read_disk, key)
+        if data is not None:
+            self._remember(key, data)
+            self.hits += 1
+            self.disk_hits += 1
+            return data
+
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, data: bytes) -> None:
+        """Store WAV bytes under key in both tiers."""
+        if not data:
+            return
+        self._remember(key, data)
+        try:
+            await asyncio.to_thread(self._write_disk, key, data)
+        except Exception as e:
+            logger.warning(f"TTS cache write failed for {key[:12]}: {str(e)}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current tier sizes."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "disk_bytes": self._disk_bytes or 0,
+            "max_memory_bytes": self.max_memory_bytes,
+            "max_disk_bytes": self.max_disk_bytes,
+        }
+
+    async def migrate_legacy_dir(self) -> None:
+        """
+        Move a cache left by older versions (inside the public audio
+        directory, served at /audio) to cache_dir, or delete it if
+        cache_dir already exists.
+        """
+        if self.legacy_dir and os.path.isdir(self.legacy_dir):
+            await asyncio.to_thread(self._migrate_legacy_dir)
+
+    def _migrate_legacy_dir(self) -> None:
+        try:
+            if os.path.exists(self.cache_dir):
+                shutil.rmtree(self.legacy_dir)
+                logger.info(f"Removed legacy TTS cache at {self.legacy_dir}")
+            else:
+                os.makedirs(os.path.dirname(self.cache_dir) or ".", exist_ok=True)
+                shutil.move(self.legacy_dir, self.cache_dir)
+                logger.info(f"Moved legacy TTS cache from {self.legacy_dir} to {self.cache_dir}")
+        except OSError as e:
+            logger.warning(f"Could not migrate legacy TTS cache at {self.legacy_dir}: {str(e)}")
+
+    # ----- memory tier -----
+
+    def _remember(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_memory_bytes:
+            return
+
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+
+        while self._memory_bytes > self.max_memory_bytes and self._memory:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    # ----- disk tier (runs in worker threads) -----
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.wav")
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            # Refresh mtime so eviction treats this entry as recently used
+            os.utime(path, None)
+            return data
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"TTS cache read failed for {key[:12]}: {str(e)}")
+            return None
+
+    def _write_disk(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with self._disk_lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = self._scan_disk_usage()
+
+            existed = os.path.exists(path)
+            old_size = os.path.getsize(path) if existed else 0
+
+            # Write to a temp file then rename so readers never see partial chunks
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+            self._disk_bytes += len(data) - old_size
+
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict_disk()
+
+    def _scan_disk_usage(self) -> int:
+        total = 0
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                try:
+                    total += os.path.getsize(os.path.join(root, name))
+                except OSError:
+                    continue
+        return total
+
+    def _evict_disk(self) -> None:
+        """Delete least-recently-used files until usage is under 90% of the cap."""
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+
+        entries.sort()
+        target = int(self.max_disk_bytes * 0.9)
+
+        for _, size, path in entries:
+            if self._disk_bytes <= target:
+                break
+            try:
+                os.remove(path)
+                self._disk_bytes -= size
+                self.evictions += 1
+            except OSError:
+                continue
+
+        logger.info(f"TTS cache evicted down to {self._disk_bytes / (1024 * 1024):.1f} MB")
+
+
+# Global instance
+tts_chunk_cache = TTSChunkCache(
+    cache_dir=settings.TTS_CACHE_PATH,
+    max_disk_bytes=settings.TTS_CACHE_MAX_DISK_MB * 1024 * 1024,
+    max_memory_bytes=settings.TTS_CACHE_MAX_MEMORY_MB * 1024 * 1024,
+    legacy_dir=os.path.join(settings.AUDIO_STORAGE_PATH, ".tts_cache"),
+)
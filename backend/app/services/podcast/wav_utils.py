@@ -0,0 +1,149 @@
+# services/podcast/wav_utils.py
+import struct
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Size value used in streaming headers where the final length is unknown
+STREAMING_SIZE = 0xFFFFFFFF
+
+
+class WavFormatError(ValueError):
+    """Raised when bytes are not a PCM WAV file this module can handle."""
+
+
+def parse_wav(data: bytes) -> Tuple[Dict[str, int], int, int]:
+    """
+    Parse a RIFF/WAVE file's header chunks without copying the audio.
+    
+    Args:
+        data: Complete WAV file bytes
+    
+    Returns:
+        (fmt, data_offset, data_length) where fmt has keys
+        "audio_format", "channels", "sample_rate", "byte_rate",
+        "block_align", "bits_per_sample"
+    
+    Raises:
+        WavFormatError: if the RIFF header, fmt chunk or data chunk is missing
+                 or truncated
+    """
+    if len(data) < 12 or data[0:4] != b"RIFF" or data[8:12] != b"WAVE":
+        raise WavFormatError("Not a RIFF/WAVE file")
+
+    fmt = None
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id = data[offset:offset + 4]
+        chunk_size = struct.unpack_from("<I", data, offset + 4)[0]
+        body = offset + 8
+
+        if chunk_id == b"fmt ":
+            try:
+                audio_format, channels, sample_rate, byte_rate, block_align, bits = struct.unpack_from(
+                    "<HHIIHH", data, body
+                )
+            except struct.error:
+                raise WavFormatError("Truncated fmt chunk")
+            fmt = {
+                "audio_format": audio_format,
+                "channels": channels,
+                "sample_rate": sample_rate,
+                "byte_rate": byte_rate,
+                "block_align": block_align,
+                "bits_per_sample": bits,
+            }
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise WavFormatError("data chunk before fmt chunk")
+            # Streaming encoders write 0xFFFFFFFF / 0; trust the actual length then
+            available = len(data) - body
+            if chunk_size in (0, STREAMING_SIZE) or chunk_size > available:
+                chunk_size = available
+            chunk_size -= chunk_size % max(fmt["block_align"], 1)
+            return fmt, body, chunk_size
+
+        # Chunks are word-aligned
+        offset = body + chunk_size + (chunk_size & 1)
+
+    raise WavFormatError("No fmt/data chunk found")
+
+
+def same_format(a: Dict[str, int], b: Dict[str, int]) -> bool:
+    """True if two fmt dicts describe identical PCM layouts."""
+    return (
+        a["audio_format"] == b["audio_format"]
+        and a["channels"] == b["channels"]
+        and a["sample_rate"] == b["sample_rate"]
+        and a["bits_per_sample"] == b["bits_per_sample"]
+    )
+
+
+def build_wav_header(fmt: Dict[str, int], data_length: int = STREAMING_SIZE) -> bytes:
+    """
+    Build a canonical 44-byte PCM WAV header.
+    Pass the default data_length for progressive streams of unknown length.
+    """
+    if data_length == STREAMING_SIZE:
+        riff_size = STREAMING_SIZE
+    else:
+        riff_size = 36 + data_length
+
+    channels = fmt["channels"]
+    sample_rate = fmt["sample_rate"]
+    bits = fmt["bits_per_sample"]
+    block_align = channels * bits // 8
+
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", riff_size, b"WAVE",
+        b"fmt ", 16, fmt.get("audio_format", 1), channels, sample_rate,
+        sample_rate * block_align, block_align, bits,
+        b"data", data_length,
+    )
+
+
+def concat_wav(
+    chunks: List[bytes],
+    conform: Optional[Callable[[bytes, Dict[str, int]], bytes]] = None,
+) -> bytearray:
+    """
+    Concatenate WAV chunks into one WAV file in a single linear pass.
+    
+    Each chunk's header is parsed once; the PCM payloads are copied
+    straight into a preallocated buffer behind one rewritten header.
+    The first chunk defines the output format. A chunk in any other
+    format is passed to `conform(chunk_bytes, target_fmt)`, which must
+    return raw PCM in the target format (e.g. by resampling).
+    
+    Raises:
+        WavFormatError: if a chunk cannot be parsed, or its format differs
+                        and no `conform` callable was given
+    """
+    if not chunks:
+        raise WavFormatError("No chunks to concatenate")
+
+    target_fmt = None
+    parts: List[memoryview] = []
+
+    for idx, chunk in enumerate(chunks, 1):
+        fmt, offset, length = parse_wav(chunk)
+        if target_fmt is None:
+            target_fmt = fmt
+
+        if same_format(target_fmt, fmt):
+            parts.append(memoryview(chunk)[offset:offset + length])
+        elif conform is not None:
+            parts.append(memoryview(conform(chunk, target_fmt)))
+        else:
+            raise WavFormatError(f"Chunk {idx} format {fmt} differs from {target_fmt}")
+
+    total = sum(len(part) for part in parts)
+    header = build_wav_header(target_fmt, total)
+
+    out = bytearray(len(header) + total)
+    out[:len(header)] = header
+    pos = len(header)
+    for part in parts:
+        out[pos:pos + len(part)] = part
+        pos += len(part)
+
+    return out
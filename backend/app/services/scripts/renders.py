@@ -0,0 +1,109 @@
+# services/scripts/renders.py
+import os
+import re
+import json
+import uuid
+from datetime import datetime
+from typing import Dict, Any, Optional, Tuple
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.services.storage.backends import StorageBackend, storage_backend
+
+_SPEAKER_PATTERN = re.compile(r'^[A-Za-z0-9-]+$')
+
+
+class RenderStore:
+    """
+    Persists the audio of rendered scripts for incremental re-rendering.
+    
+    One render is kept per (script_id, language, speaker): a master WAV of
+    the whole episode's PCM, plus a JSON manifest listing every TTS chunk
+    with its text and byte offset/length in the master's PCM data. When a
+    script is edited, chunks whose text is unchanged are copied out of the
+    master instead of being synthesized again.
+    """
+
+    def __init__(self, store_dir: str, storage: Optional[StorageBackend] = None):
+        self.store_dir = store_dir
+        self.storage = storage or storage_backend
+
+    @staticmethod
+    def make_id(script_id: str, language: str, speaker: str) -> Optional[str]:
+        """Render id, or None if any part is not a safe file name component"""
+        if not script_id.isalnum() or not language.isalpha() or not _SPEAKER_PATTERN.match(speaker):
+            return None
+        return f"{script_id}_{language}_{speaker}"
+
+    async def save(
+        self,
+        script_id: str,
+        language: str,
+        speaker: str,
+        manifest: Dict[str, Any],
+        master_wav: bytes
+    ) -> Optional[str]:
+        """Persist a render (replacing any earlier render of the same target) and return its id."""
+        render_id = self.make_id(script_id, language, speaker)
+        if render_id is None:
+            logger.warning(f"Render of script {script_id} not stored: invalid target ({language}, {speaker})")
+            return None
+
+        record = {
+            **manifest,
+            "render_id": render_id,
+            "script_id": script_id,
+            "language": language,
+            "speaker": speaker,
+            "created_at": datetime.now().isoformat(),
+        }
+        await self._write(render_id, record, master_wav)
+        logger.info(f"✓ Render {render_id} stored ({len(record['chunks'])} chunks)")
+        return render_id
+
+    async def get(self, script_id: str, language: str, speaker: str) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        """Return (manifest, master WAV bytes) of a stored render, or None if there is none."""
+        render_id = self.make_id(script_id, language, speaker)
+        if render_id is None:
+            return None
+        return await self._read(render_id)
+
+    # ----- storage -----
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.store_dir, name)
+
+    async def _read(self, render_id: str) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        manifest = await self.storage.read(self._path(f"{render_id}.json"))
+        if manifest is None:
+            return None
+        manifest = json.loads(manifest)
+        master_wav = await self.storage.read(self._path(manifest["master"]))
+        if master_wav is None:
+            return None
+        return manifest, master_wav
+
+    async def _write(self, render_id: str, record: Dict[str, Any], master_wav: bytes):
+        manifest_path = self._path(f"{render_id}.json")
+        try:
+            previous = await self.storage.read(manifest_path)
+            previous_master = json.loads(previous).get("master") if previous is not None else None
+        except ValueError:
+            previous_master = None
+
+        # Each master gets a fresh name and is written before the manifest
+        # pointing at it, so a reader never pairs a manifest with other audio
+        record["master"] = f"{render_id}_{uuid.uuid4().hex[:8]}.wav"
+        await self.storage.write(self._path(record["master"]), master_wav, content_type="audio/wav")
+        await self.storage.write(
+            manifest_path,
+            json.dumps(record, indent=2, ensure_ascii=False).encode("utf-8"),
+            content_type="application/json"
+        )
+
+        if previous_master:
+            await self.storage.delete(self._path(previous_master))
+
+
+# Global instance
+render_store = RenderStore(store_dir=settings.RENDER_STORE_PATH)
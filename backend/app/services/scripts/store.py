@@ -0,0 +1,85 @@
+# services/scripts/store.py
+import os
+import json
+import hashlib
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.services.storage.backends import StorageBackend, storage_backend
+
+
+class ScriptStore:
+    """
+    Persists generated podcast scripts as first-class artifacts.
+    
+    Each script set (eng_pod + hin_pod) is stored as one JSON file named
+    by its script_id. Ids are content hashes, so saving the same scripts
+    twice (e.g. a script-cache hit) returns the existing id.
+    
+    Stored scripts can be rendered again to other voices and languages
+    without re-running the research agent. Records go through the storage
+    backend (local disk or S3-compatible), written atomically.
+    """
+
+    def __init__(self, store_dir: str, storage: Optional[StorageBackend] = None):
+        self.store_dir = store_dir
+        self.storage = storage or storage_backend
+
+    @staticmethod
+    def make_id(scripts: Dict[str, str]) -> str:
+        canonical = json.dumps(scripts, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:24]
+
+    async def save(
+        self,
+        scripts: Dict[str, str],
+        date: str,
+        attribution: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Persist scripts and return their script_id. Scripts that were not generated (None) are omitted."""
+        scripts = {key: text for key, text in scripts.items() if text}
+        script_id = self.make_id(scripts)
+        record = {
+            "script_id": script_id,
+            "date": date,
+            "attribution": attribution,
+            "scripts": scripts,
+            "script_lengths": {key: len(text) for key, text in scripts.items()},
+            "metadata": metadata or {},
+            "created_at": datetime.now().isoformat(),
+        }
+        created = await self._write(script_id, record)
+        if created:
+            logger.info(f"✓ Script {script_id} stored")
+        return script_id
+
+    async def get(self, script_id: str) -> Optional[Dict[str, Any]]:
+        """Return the stored script record, or None if unknown."""
+        if not script_id.isalnum():
+            return None
+        return await self._read(script_id)
+
+    # ----- storage -----
+
+    def _path(self, script_id: str) -> str:
+        return os.path.join(self.store_dir, f"{script_id}.json")
+
+    async def _read(self, script_id: str) -> Optional[Dict[str, Any]]:
+        data = await self.storage.read(self._path(script_id))
+        return json.loads(data) if data is not None else None
+
+    async def _write(self, script_id: str, record: Dict[str, Any]) -> bool:
+        path = self._path(script_id)
+        if await self.storage.exists(path):
+            return False
+
+        data = json.dumps(record, indent=2, ensure_ascii=False).encode("utf-8")
+        await self.storage.write(path, data, content_type="application/json")
+        return True
+
+
+# Global instance
+script_store = ScriptStore(store_dir=settings.SCRIPT_STORE_PATH)
@@ -0,0 +1,205 @@
+# services/storage/backends.py
+import os
+import asyncio
+import mimetypes
+import posixpath
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from app.core.config import settings
+from app.core.logger import logger
+
+try:
+    import boto3
+    from botocore.exceptions import ClientError
+    BOTO3_AVAILABLE = True
+except ImportError:
+    BOTO3_AVAILABLE = False
+
+
+def write_file_atomic(path: str, data: bytes) -> None:
+    """
+    Write bytes to a temp file in the target directory, then rename it into
+    place, so readers (e.g. the /audio static mount) never see a partial file.
+    Blocking: call through asyncio.to_thread from async code.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+
+    # Dot-prefixed so a half-written temp file is never listed as an artifact
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class StorageBackend(ABC):
+    """
+    Async storage for generated artifacts: audio files, saved scripts, raw
+    agent output and the script/render stores.
+
+    Artifacts are addressed by the same relative paths used on local disk
+    (e.g. "storage/audio/podcast_en_....mp3"), so call sites do not change
+    with the backend. Writes are atomic: a reader sees the previous content
+    or the complete new content, never a partial write.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    async def write(self, path: str, data: bytes, content_type: Optional[str] = None) -> str:
+        """Store data at path (replacing it). Returns the stored location."""
+
+    @abstractmethod
+    async def read(self, path: str) -> Optional[bytes]:
+        """Return the data stored at path, or None if there is none."""
+
+    @abstractmethod
+    async def exists(self, path: str) -> bool:
+        """True if something is stored at path."""
+
+    @abstractmethod
+    async def delete(self, path: str) -> None:
+        """Remove path (no error if it does not exist)."""
+
+    async def write_text(self, path: str, text: str, content_type: str = "text/plain; charset=utf-8") -> str:
+        return await self.write(path, text.encode("utf-8"), content_type)
+
+    async def read_text(self, path: str) -> Optional[str]:
+        data = await self.read(path)
+        return data.decode("utf-8") if data is not None else None
+
+
+class LocalStorageBackend(StorageBackend):
+    """Files on local disk, written off the event loop via temp file + os.replace."""
+
+    name = "local"
+
+    async def write(self, path: str, data: bytes, content_type: Optional[str] = None) -> str:
+        await asyncio.to_thread(write_file_atomic, path, data)
+        return path
+
+    async def read(self, path: str) -> Optional[bytes]:
+        return await asyncio.to_thread(self._read, path)
+
+    async def exists(self, path: str) -> bool:
+        return await asyncio.to_thread(os.path.exists, path)
+
+    async def delete(self, path: str) -> None:
+        await asyncio.to_thread(self._delete, path)
+
+    @staticmethod
+    def _read(path: str) -> Optional[bytes]:
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _delete(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class S3StorageBackend(StorageBackend):
+    """
+    Objects in an S3-compatible bucket (AWS S3, MinIO, ...).
+    A path maps to the object key S3_PREFIX + path; a PUT only becomes
+    visible once the whole object is uploaded, so writes are atomic.
+    boto3 is blocking, so every call runs in a worker thread.
+    """
+
+    name = "s3"
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "",
+        endpoint_url: Optional[str] = None,
+        region: Optional[str] = None,
+        access_key_id: Optional[str] = None,
+        secret_access_key: Optional[str] = None
+    ):
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self._client = boto3.client(
+            "s3",
+            endpoint_url=endpoint_url or None,
+            region_name=region or None,
+            aws_access_key_id=access_key_id or None,
+            aws_secret_access_key=secret_access_key or None,
+        )
+
+    def _key(self, path: str) -> str:
+        key = posixpath.normpath(path.replace(os.sep, "/")).lstrip("/")
+        return f"{self.prefix}/{key}" if self.prefix else key
+
+    async def write(self, path: str, data: bytes, content_type: Optional[str] = None) -> str:
+        key = self._key(path)
+        content_type = content_type or mimetypes.guess_type(path)[0] or "application/octet-stream"
+        await asyncio.to_thread(
+            self._client.put_object, Bucket=self.bucket, Key=key, Body=data, ContentType=content_type
+        )
+        return f"s3://{self.bucket}/{key}"
+
+    async def read(self, path: str) -> Optional[bytes]:
+        return await asyncio.to_thread(self._read, self._key(path))
+
+    async def exists(self, path: str) -> bool:
+        return await asyncio.to_thread(self._exists, self._key(path))
+
+    async def delete(self, path: str) -> None:
+        await asyncio.to_thread(self._client.delete_object, Bucket=self.bucket, Key=self._key(path))
+
+    def _read(self, key: str) -> Optional[bytes]:
+        try:
+            return self._client.get_object(Bucket=self.bucket, Key=key)["Body"].read()
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                return None
+            raise
+
+    def _exists(self, key: str) -> bool:
+        try:
+            self._client.head_object(Bucket=self.bucket, Key=key)
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404", "NotFound"):
+                return False
+            raise
+
+
+def create_storage_backend(kind: str) -> StorageBackend:
+    """Build the configured storage backend ('local' or 's3')."""
+    if kind == "s3":
+        if not BOTO3_AVAILABLE:
+            logger.warning("STORAGE_BACKEND is 's3' but boto3 is not installed, falling back to local storage")
+        elif not settings.S3_BUCKET:
+            logger.warning("STORAGE_BACKEND is 's3' but S3_BUCKET is not set, falling back to local storage")
+        else:
+            return S3StorageBackend(
+                bucket=settings.S3_BUCKET,
+                prefix=settings.S3_PREFIX,
+                endpoint_url=settings.S3_ENDPOINT_URL,
+                region=settings.S3_REGION,
+                access_key_id=settings.S3_ACCESS_KEY_ID,
+                secret_access_key=settings.S3_SECRET_ACCESS_KEY,
+            )
+        return LocalStorageBackend()
+
+    if kind != "local":
+        logger.warning(f"Unknown STORAGE_BACKEND '{kind}', falling back to local storage")
+    return LocalStorageBackend()
+
+
+# Global instance
+storage_backend = create_storage_backend(settings.STORAGE_BACKEND)
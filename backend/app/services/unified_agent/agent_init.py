@@ -4,10 +4,12 @@ from typing import Optional, Tuple
 from app.core.config import settings
 from app.core.logger import logger
 
+from .session_store import create_session_service
+
 try:
     from google.adk.agents import Agent
     from google.adk.runners import Runner
-    from google.adk.sessions import InMemorySessionService
+    from google.adk.sessions import BaseSessionService
     from google.adk.tools import google_search
     ADK_AVAILABLE = True
 except ImportError:
@@ -15,9 +17,10 @@ except ImportError:
     logger.warning("Google ADK not installed. Install with: pip install google-adk")
 
 
-def initialize_agent() -> Tuple[Optional[Agent], Optional[InMemorySessionService], bool]:
+def initialize_agent() -> Tuple[Optional[Agent], Optional[BaseSessionService], bool]:
     """
     Initialize Google ADK Agent and SessionService.
+    The session store is pluggable (AGENT_SESSION_BACKEND, SQLite by default).
     Returns (agent, session_service, success)
     """
     if not ADK_AVAILABLE:
@@ -40,11 +43,35 @@ def initialize_agent() -> Tuple[Optional[Agent], Optional[InMemorySessionService
             tools=[google_search]
         )
 
-        session_service = InMemorySessionService()
+        session_service = create_session_service()
 
         logger.info("✓ UnifiedAgentService components initialized successfully")
         return agent, session_service, True
 
     except Exception as e:
         logger.error(f"Failed to initialize ADK agent: {str(e)}", exc_info=True)
-        return None, None, False
\ No newline at end of file
+        return None, None, False
+
+def initialize_writer_agent() -> Optional[Agent]:
+    """
+    Initialize the script-writer agent used by the pipeline generation mode.
+    It writes from research findings, so it has no search tool.
+    Returns the agent, or None on failure.
+    """
+    if not ADK_AVAILABLE or not settings.GEMINI_API_KEY:
+        return None
+
+    try:
+        return Agent(
+            name="podcast_writer_agent",
+            model=settings.GEMINI_MODEL,
+            description="Podcast script writing from research findings",
+            instruction=(
+                "You are a financial podcast script writer. "
+                "Write natural, TTS-ready scripts using only the findings you are given."
+            )
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to initialize writer agent: {str(e)}", exc_info=True)
+        return None
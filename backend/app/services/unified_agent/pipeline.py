@@ -0,0 +1,157 @@
+import asyncio
+import json
+import re
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from app.core.logger import logger
+
+from .prompt_builder import SCRIPT_KEYS, SCRIPT_LANGUAGES, build_research_prompt, build_writer_prompt
+from .runner_execution import run_agent_text, stream_agent_response
+
+# Pipeline generation mode: one research call produces structured findings,
+# then the English and Hindi scripts are written concurrently from them,
+# instead of one call writing English and then translating it.
+
+_CODE_FENCE_PATTERN = re.compile(r'^```(?:json)?\s*|\s*```$')
+
+
+def parse_research_findings(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse the research agent's JSON findings.
+    Tolerates code fences and text around the JSON object.
+    Returns None if no usable findings are found.
+    """
+    text = _CODE_FENCE_PATTERN.sub('', text.strip())
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end <= start:
+        return None
+
+    try:
+        findings = json.loads(text[start:end + 1])
+    except json.JSONDecodeError:
+        return None
+
+    if not isinstance(findings, dict) or not findings.get("segments"):
+        return None
+    return findings
+
+
+async def run_research(
+    research_agent,
+    session_service,
+    target_date: str,
+    app_name: str = "podcast_agent"
+) -> Optional[Dict[str, Any]]:
+    """
+    Run the research step and return its findings.
+    If the agent does not return valid JSON, its text is passed on as
+    free-form notes so the writers still have the research to work from.
+    """
+    text = await run_agent_text(
+        agent=research_agent,
+        session_service=session_service,
+        prompt=build_research_prompt(target_date),
+        app_name=app_name
+    )
+    if not text:
+        return None
+
+    findings = parse_research_findings(text)
+    if findings is None:
+        logger.warning("Research findings are not valid JSON — passing raw notes to the writers")
+        return {"date": target_date, "notes": text.strip()}
+
+    logger.info(f"✓ Research complete — {len(findings['segments'])} segments")
+    return findings
+
+
+async def run_pipeline_and_get_scripts(
+    research_agent,
+    writer_agent,
+    session_service,
+    target_date: str,
+    attribution: str,
+    app_name: str = "podcast_agent",
+    languages: Tuple[str, ...] = SCRIPT_LANGUAGES
+) -> Optional[dict]:
+    """
+    Research once, then write the requested scripts concurrently.
+    Returns {"eng_pod": ..., "hin_pod": ...} like run_agent_and_get_script
+    (only the requested keys), or None if any step fails.
+    """
+    findings = await run_research(research_agent, session_service, target_date, app_name)
+    if not findings:
+        logger.error("Research step returned no findings")
+        return None
+
+    texts = await asyncio.gather(*(
+        run_agent_text(
+            agent=writer_agent,
+            session_service=session_service,
+            prompt=build_writer_prompt(findings, language, target_date, attribution),
+            app_name=app_name
+        )
+        for language in languages
+    ))
+
+    if not all(texts):
+        logger.error("A writer agent returned no script")
+        return None
+
+    scripts = {SCRIPT_KEYS[language]: text.strip() for language, text in zip(languages, texts)}
+    logger.info("Pipeline scripts written — " + ", ".join(f"{key} ({len(text)} chars)" for key, text in scripts.items()))
+    return scripts
+
+
+async def stream_pipeline_response(
+    research_agent,
+    writer_agent,
+    session_service,
+    target_date: str,
+    attribution: str,
+    app_name: str = "podcast_agent",
+    languages: Tuple[str, ...] = SCRIPT_LANGUAGES
+) -> AsyncIterator[Tuple[str, Optional[str]]]:
+    """
+    Streaming variant of run_pipeline_and_get_scripts.
+    
+    Yields (language, text delta) from the writers as they stream, and
+    (language, None) when a writer has finished.
+    
+    Raises:
+        RuntimeError: if research or a writer fails
+    """
+    findings = await run_research(research_agent, session_service, target_date, app_name)
+    if not findings:
+        raise RuntimeError("Research step returned no findings")
+
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def write(language: str) -> None:
+        try:
+            async for delta in stream_agent_response(
+                agent=writer_agent,
+                session_service=session_service,
+                prompt=build_writer_prompt(findings, language, target_date, attribution),
+                app_name=app_name
+            ):
+                await queue.put((language, delta))
+        finally:
+            await queue.put((language, None))
+
+    tasks = {language: asyncio.create_task(write(language)) for language in languages}
+    try:
+        remaining = len(tasks)
+        while remaining:
+            language, delta = await queue.get()
+            if delta is None:
+                remaining -= 1
+                # Surface a writer failure instead of ending its language early
+                task = tasks[language]
+                await asyncio.wait([task])
+                task.result()
+            yield language, delta
+    finally:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
@@ -1,9 +1,62 @@
-from typing import Optional
+import json
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# Bump whenever the prompt text changes so cached scripts built from an
+# older prompt are not served (see script_cache.py)
+PROMPT_VERSION = "1"
+
+# Same, for the research/writer prompts used by the pipeline generation mode
+PIPELINE_PROMPT_VERSION = "1"
+
+LANGUAGE_NAMES = {"en": "English", "hi": "Hindi"}
+
+# Script languages in output order, and the result key of each script
+SCRIPT_LANGUAGES = ("en", "hi")
+SCRIPT_KEYS = {"en": "eng_pod", "hi": "hin_pod"}
+
+SCRIPT_MARKERS = {
+    "en": "=====ENGLISH PODCAST SCRIPT=====",
+    "hi": "=====HINDI PODCAST SCRIPT=====",
+}
+
+# Attribution used for batch generation: scripts are written once with this
+# placeholder and each podcast name is substituted afterwards (see
+# services/podcast/branding.py). No underscores, which the cleaner strips.
+BRAND_PLACEHOLDER = "{BRAND}"
+
+
+def resolve_languages(language: Optional[Iterable[str]] = None) -> Tuple[str, ...]:
+    """
+    Normalize a requested language set to script languages in output order.
+    Accepts "en", "hi", "both", None (both) or an iterable of languages.
+    """
+    if language is None or language == "both":
+        return SCRIPT_LANGUAGES
+    requested = {language} if isinstance(language, str) else set(language)
+    return tuple(lang for lang in SCRIPT_LANGUAGES if lang in requested)
+
+
+def opening_line(language: str, target_date: str, attribution: str) -> str:
+    """The line every script starts with (the only place the attribution is spoken)"""
+    if language == "hi":
+        return f"{attribution} वित्तीय पॉडकास्ट में आपका स्वागत है। आज का संस्करण: {target_date}"
+    return f"Welcome to the {attribution} Financial Podcast. Today's Edition: {target_date}"
+
+
+def _placeholder_rule(attribution: str) -> str:
+    """Extra requirement line when the attribution is the batch placeholder"""
+    if attribution != BRAND_PLACEHOLDER:
+        return ""
+    return (
+        f"\n                - Write {BRAND_PLACEHOLDER} exactly as shown (it is replaced with the podcast name later); "
+        f"use it ONLY in the opening line and nowhere else"
+    )
 
 
 def build_podcast_prompt(
     target_date: str = "yesterday",
-    attribution: str = "Financial Research Team"
+    attribution: str = "Financial Research Team",
+    languages: Tuple[str, ...] = SCRIPT_LANGUAGES
 ) -> str:
     """
     Builds the detailed prompt for generating a financial podcast script.
@@ -13,7 +66,13 @@ def build_podcast_prompt(
     Output will be split into two files:
     - eng_pod: English podcast script
     - hin_pod: Hindi podcast script
+    
+    When only one language is requested, the prompt asks for that script
+    alone (see build_single_language_prompt).
     """
+    if len(languages) == 1:
+        return build_single_language_prompt(target_date, attribution, languages[0])
+
     return f"""You are an elite financial researcher creating professional podcast scripts for Indian audience.
 
                 TASK:
@@ -152,4 +211,143 @@ def build_podcast_prompt(
                 - Explain why each topic matters for Indian investors/economy
                 - Ready to be processed by Sarvam TTS
                 - Do NOT use markdown, asterisks, or special formatting in either script
-                - Write as continuous prose that flows naturally when read aloud in each language"""
\ No newline at end of file
+                - Write as continuous prose that flows naturally when read aloud in each language{_placeholder_rule(attribution)}"""
+
+
+def build_single_language_prompt(
+    target_date: str,
+    attribution: str,
+    language: str
+) -> str:
+    """
+    Builds the prompt for a single-language request: the agent researches
+    and writes only the script that will be voiced, so a language="en"
+    request does not pay for a Hindi translation (and vice versa).
+    The output keeps that language's marker so the same splitter applies.
+    """
+    language_name = LANGUAGE_NAMES[language]
+    marker = SCRIPT_MARKERS[language]
+
+    opening = opening_line(language, target_date, attribution)
+
+    if language == "hi":
+        language_rules = """- Proper Hindi (Devanagari script), NOT Hinglish
+                - Segment names in Hindi
+                - Natural Hindi speech patterns and pacing
+                - Suitable for text-to-speech conversion"""
+    else:
+        language_rules = """- Professional English, natural speech patterns for text-to-speech"""
+
+    return f"""You are an elite financial researcher creating a professional podcast script for Indian audience.
+
+                TASK:
+                1. Search for latest FINANCIAL NEWS AND UPDATES from {target_date}
+                2. Do NOT search for predefined sectors or specific stock data
+                3. Search broadly: "What are the major financial updates from {target_date}?" or similar open-ended financial queries
+                4. Based on the search results, automatically identify 3 main financial themes/topics
+                5. Generate ONE COMPLETE {language_name.upper()} SCRIPT (5-6 minutes, 600-900 words)
+                6. Prioritize impact and relevance for Indian audience throughout
+
+                SCRIPT REQUIREMENTS:
+                - 5-6 minute duration (approximately 600-900 words, MINIMUM 600)
+                - Start with "{opening}"
+                - 3 auto-generated segments based on the actual content found, each introduced as [SEGMENT N: title]
+                - One continuous narrative per segment (no bullet points, headers within text)
+                - Specific numbers, data, and facts from search results
+                - Explain cause-and-effect relationships
+                - Focus on Indian market/economy implications
+                {language_rules}
+                - NO markdown, asterisks, or special formatting
+                - Written as continuous prose for smooth TTS reading{_placeholder_rule(attribution)}
+
+                OUTPUT FORMAT - CRITICAL:
+                - MUST start with exactly: {marker}
+                - Everything after the marker is the script
+                - Do NOT add notes, warnings, or extra text after the script"""
+
+
+def build_research_prompt(target_date: str = "yesterday") -> str:
+    """
+    Builds the research step of the pipeline generation mode.
+    The agent searches once and returns structured findings (JSON) that the
+    English and Hindi writers then work from in parallel.
+    """
+    return f"""You are an elite financial researcher preparing material for a podcast for Indian audience.
+
+                TASK:
+                1. Search for latest FINANCIAL NEWS AND UPDATES from {target_date}
+                2. Do NOT search for predefined sectors or specific stock data
+                3. Search broadly: "What are the major financial updates from {target_date}?" or similar open-ended financial queries
+                4. Based on the search results, automatically identify 3 main financial themes/topics
+                5. Prioritize impact and relevance for Indian audience throughout
+
+                Do NOT write a podcast script. Return ONLY the research findings as JSON in EXACTLY this shape:
+
+                {{
+                  "date": "{target_date}",
+                  "segments": [
+                    {{
+                      "title_en": "Auto-generated segment title in English",
+                      "title_hi": "Same title in Hindi (Devanagari)",
+                      "summary": "Two or three sentences on what happened",
+                      "key_facts": ["Specific numbers, data and facts from the search results", "..."],
+                      "india_impact": "Why this matters for Indian investors, savers and the economy"
+                    }}
+                  ]
+                }}
+
+                REQUIREMENTS:
+                - Exactly 3 segments, most important first
+                - Include actual numbers and data from search findings in key_facts
+                - Explain cause-and-effect relationships in summary and india_impact
+                - Output valid JSON only: no markdown fences, no commentary before or after"""
+
+
+def build_writer_prompt(
+    findings: Dict[str, Any],
+    language: str,
+    target_date: str = "yesterday",
+    attribution: str = "Financial Research Team"
+) -> str:
+    """
+    Builds a writer step of the pipeline generation mode: one podcast script
+    in one language, written from the research findings (no searching).
+    The English and Hindi writers run concurrently from the same findings,
+    so both scripts share the segment structure without translating.
+    """
+    language_name = LANGUAGE_NAMES[language]
+    findings_json = json.dumps(findings, ensure_ascii=False, indent=2)
+
+    opening = opening_line(language, target_date, attribution)
+
+    if language == "hi":
+        language_rules = """- Proper Hindi (Devanagari script), NOT Hinglish
+                - Use the title_hi segment titles
+                - Natural Hindi speech patterns and pacing"""
+    else:
+        language_rules = """- Professional English, natural speech patterns for text-to-speech
+                - Use the title_en segment titles"""
+
+    return f"""You are a professional podcast script writer for Indian audience.
+
+                TASK:
+                Write ONE {language_name} financial podcast script from the research findings below.
+                Do NOT search; use only these findings.
+
+                RESEARCH FINDINGS:
+                {findings_json}
+
+                SCRIPT REQUIREMENTS:
+                - 5-6 minute duration (approximately 600-900 words, MINIMUM 600)
+                - Start with exactly: "{opening}"
+                - One segment per finding, in the given order, each introduced as [SEGMENT N: title]
+                - One continuous narrative per segment (no bullet points, headers within text)
+                - Specific numbers, data, and facts from the findings
+                - Explain cause-and-effect relationships
+                - Major focus on Indian audience perspective and implications
+                {language_rules}
+                - NO markdown, asterisks, or special formatting
+                - Written as continuous prose for smooth TTS reading{_placeholder_rule(attribution)}
+
+                OUTPUT:
+                Return ONLY the script text. No title line, notes or commentary before or after it."""
@@ -1,5 +1,5 @@
-import hashlib
-from typing import Optional
+from contextlib import aclosing
+from typing import AsyncIterator, List, Optional, Tuple
 
 try:
     from google.genai import types
@@ -8,75 +8,126 @@ except ImportError:
     GENAI_AVAILABLE = False
 
 try:
-    from google.adk.runners import Runner
+    from google.adk.agents.run_config import RunConfig, StreamingMode
     ADK_RUNNER_AVAILABLE = True
 except ImportError:
     ADK_RUNNER_AVAILABLE = False
 
 from app.core.logger import logger
 
+from .prompt_builder import SCRIPT_KEYS, SCRIPT_LANGUAGES, SCRIPT_MARKERS
+from .runner_pool import runner_pool
+from .session_store import session_tracker
 
-async def run_agent_and_get_script(
+ENG_MARKER = SCRIPT_MARKERS["en"]
+HIN_MARKER = SCRIPT_MARKERS["hi"]
+
+# Trailing note the model sometimes appends to the English script
+_IMPORTANT_NOTE = "IMPORTANT:"
+
+
+async def _run_events(
     agent,
     session_service,
     prompt: str,
-    app_name: str = "podcast_agent"
-) -> Optional[dict]:
+    app_name: str,
+    run_config=None
+):
     """
-    Execute the agent using Runner and collect the final text response.
-    Splits the response into two separate files: eng_pod (English) and hin_pod (Hindi).
-    Returns a dictionary with both scripts.
+    Take a pooled runner (waiting if the concurrent-run cap is reached),
+    open a fresh session for the prompt and iterate the agent's events.
+    The session is deleted and the runner returned when iteration ends;
+    consume with contextlib.aclosing() so that also happens on an early
+    break.
     """
-    if not GENAI_AVAILABLE or not ADK_RUNNER_AVAILABLE:
-        logger.error("Google GenAI or ADK Runner not installed. Cannot execute agent.")
-        return None
-
-    try:
-        user_id = f"user_{hashlib.md5(prompt.encode()).hexdigest()[:8]}"
-        session_id = f"session_{hashlib.md5(prompt.encode()).hexdigest()[:10]}"
-
-        await session_service.create_session(
-            app_name=app_name,
-            user_id=user_id,
-            session_id=session_id
-        )
-
-        runner = Runner(
-            agent=agent,
-            app_name=app_name,
-            session_service=session_service
-        )
-
+    async with runner_pool.runner(agent, session_service, app_name) as runner, \
+            session_tracker.agent_session(session_service, app_name) as (user_id, session_id):
+        # A fresh Content per run: ADK stores the message in the session
         user_content = types.Content(
             role='user',
             parts=[types.Part(text=prompt)]
         )
 
-        final_response = None
-        async for event in runner.run_async(
+        kwargs = {"run_config": run_config} if run_config is not None else {}
+        events = runner.run_async(
             user_id=user_id,
             session_id=session_id,
-            new_message=user_content
-        ):
-            if event.is_final_response():
-                if event.content and event.content.parts:
-                    final_response = event.content.parts[0].text
-                    break
+            new_message=user_content,
+            **kwargs
+        )
+        # Close the runner's generator here, in this task, so its tracing
+        # context is not torn down later by garbage collection
+        async with aclosing(events):
+            async for event in events:
+                yield event
+
+
+def _event_text(event) -> str:
+    if not event.content or not event.content.parts:
+        return ""
+    return "".join(part.text for part in event.content.parts if getattr(part, "text", None))
+
+
+async def run_agent_text(
+    agent,
+    session_service,
+    prompt: str,
+    app_name: str = "podcast_agent"
+) -> Optional[str]:
+    """
+    Execute the agent using Runner and return its final response text
+    (None if the agent produced none or the run failed).
+    """
+    if not GENAI_AVAILABLE or not ADK_RUNNER_AVAILABLE:
+        logger.error("Google GenAI or ADK Runner not installed. Cannot execute agent.")
+        return None
+
+    try:
+        final_response = None
+        async with aclosing(_run_events(agent, session_service, prompt, app_name)) as events:
+            async for event in events:
+                if event.is_final_response():
+                    if event.content and event.content.parts:
+                        final_response = event.content.parts[0].text
+                        break
 
         if not final_response:
             logger.error("Agent returned no final response text")
             return None
 
         logger.info(f"Agent response received — length: {len(final_response)} chars")
-        
-        # Split the response into English and Hindi scripts
-        scripts = split_podcast_scripts(final_response.strip())
+        return final_response
+
+    except Exception as e:
+        logger.error(f"Runner execution failed: {str(e)}", exc_info=True)
+        return None
+
+
+async def run_agent_and_get_script(
+    agent,
+    session_service,
+    prompt: str,
+    app_name: str = "podcast_agent",
+    languages: Tuple[str, ...] = SCRIPT_LANGUAGES
+) -> Optional[dict]:
+    """
+    Execute the agent using Runner and collect the final text response.
+    Splits the response into two separate files: eng_pod (English) and hin_pod (Hindi).
+    Returns a dictionary with the scripts of the requested languages.
+    """
+    final_response = await run_agent_text(agent, session_service, prompt, app_name)
+    if not final_response:
+        return None
+
+    try:
+        # Split the response into the requested scripts
+        scripts = split_podcast_scripts(final_response.strip(), languages)
         
         if not scripts:
-            logger.error("Failed to split response into English and Hindi scripts")
+            logger.error(f"Failed to split response into scripts for {', '.join(languages)}")
             return None
         
-        logger.info(f"Successfully split into eng_pod ({len(scripts['eng_pod'])} chars) and hin_pod ({len(scripts['hin_pod'])} chars)")
+        logger.info("Successfully split into " + ", ".join(f"{key} ({len(text)} chars)" for key, text in scripts.items()))
         return scripts
 
     except Exception as e:
@@ -84,9 +135,145 @@ async def run_agent_and_get_script(
         return None
 
 
-def split_podcast_scripts(full_response: str) -> Optional[dict]:
+async def stream_agent_response(
+    agent,
+    session_service,
+    prompt: str,
+    app_name: str = "podcast_agent"
+) -> AsyncIterator[str]:
     """
-    Split the agent response into two separate podcast scripts: English and Hindi.
+    Execute the agent with SSE streaming and yield response text as it is
+    generated.
+
+    Partial events are yielded as deltas. If the model (or ADK) sends no
+    partials, the final response text is yielded in one piece; if the
+    partials only cover part of the final text, the remainder is yielded.
+
+    Raises:
+        RuntimeError: if ADK is not installed or the agent returns no text
+    """
+    if not GENAI_AVAILABLE or not ADK_RUNNER_AVAILABLE:
+        raise RuntimeError("Google GenAI or ADK Runner not installed. Cannot execute agent.")
+
+    streamed = ""
+    run_config = RunConfig(streaming_mode=StreamingMode.SSE)
+
+    async with aclosing(_run_events(agent, session_service, prompt, app_name, run_config)) as events:
+        async for event in events:
+            text = _event_text(event)
+            if getattr(event, "partial", False):
+                if text:
+                    streamed += text
+                    yield text
+                continue
+
+            if event.is_final_response():
+                # The aggregated final event repeats the streamed text
+                if text.startswith(streamed):
+                    remainder = text[len(streamed):]
+                    if remainder:
+                        streamed += remainder
+                        yield remainder
+                elif not streamed:
+                    streamed = text
+                    yield text
+                if text or streamed:
+                    break
+
+    if not streamed:
+        raise RuntimeError("Agent returned no final response text")
+
+    logger.info(f"Agent response streamed — length: {len(streamed)} chars")
+
+
+class ScriptSectionSplitter:
+    """
+    Incremental counterpart of split_podcast_scripts() for streamed agent
+    output.
+
+    feed() returns (language, text) pieces as soon as they are known to
+    belong to a language's section; text before the first marker is
+    dropped. Up to len(marker) - 1 characters are held back so a marker
+    split across deltas is still recognised, and English text from
+    "IMPORTANT:" onwards is dropped as in the batch splitter.
+    """
+
+    def __init__(self, languages: Tuple[str, ...] = SCRIPT_LANGUAGES):
+        self.languages = languages
+        self._buffer = ""
+        self._index = -1  # section being read; -1 before the first marker
+        self._eng_truncated = False
+        # Languages whose section is over (the next marker has been seen)
+        self.completed: List[str] = []
+
+    def feed(self, text: str) -> List[Tuple[str, str]]:
+        self._buffer += text
+        return self._drain(final=False)
+
+    def close(self) -> List[Tuple[str, str]]:
+        return self._drain(final=True)
+
+    def _drain(self, final: bool) -> List[Tuple[str, str]]:
+        pieces: List[Tuple[str, str]] = []
+        while True:
+            if self._index == -1:
+                marker = SCRIPT_MARKERS[self.languages[0]]
+                idx = self._buffer.find(marker)
+                if idx == -1:
+                    if not final:
+                        self._buffer = self._buffer[-(len(marker) - 1):]
+                    else:
+                        self._buffer = ""
+                    return pieces
+                self._buffer = self._buffer[idx + len(marker):]
+                self._index = 0
+                continue
+
+            language = self.languages[self._index]
+            if self._index + 1 == len(self.languages):
+                # The last section runs to the end of the response
+                self._emit(language, self._buffer, pieces)
+                self._buffer = ""
+                return pieces
+
+            next_marker = SCRIPT_MARKERS[self.languages[self._index + 1]]
+            idx = self._buffer.find(next_marker)
+            if idx != -1:
+                self._emit(language, self._buffer[:idx], pieces)
+                self._buffer = self._buffer[idx + len(next_marker):]
+                self.completed.append(language)
+                self._index += 1
+                continue
+
+            keep = 0 if final else len(next_marker) - 1
+            cut = max(0, len(self._buffer) - keep)
+            # The held-back window is longer than "IMPORTANT:", so a note
+            # starting before the cut is always complete in the buffer
+            important = self._buffer.find(_IMPORTANT_NOTE) if language == "en" else -1
+            if important != -1 and important < cut:
+                cut = important + len(_IMPORTANT_NOTE)
+            self._emit(language, self._buffer[:cut], pieces)
+            self._buffer = self._buffer[cut:]
+            return pieces
+
+    def _emit(self, language: str, text: str, pieces: List[Tuple[str, str]]) -> None:
+        if language == "en":
+            if self._eng_truncated:
+                return
+            idx = text.find(_IMPORTANT_NOTE)
+            if idx != -1:
+                text = text[:idx]
+                self._eng_truncated = True
+        if text:
+            pieces.append((language, text))
+
+
+def split_podcast_scripts(
+    full_response: str,
+    languages: Tuple[str, ...] = SCRIPT_LANGUAGES
+) -> Optional[dict]:
+    """
+    Split the agent response into separate podcast scripts: English and Hindi.
     
     Expected format:
     =====ENGLISH PODCAST SCRIPT=====
@@ -95,48 +282,43 @@ def split_podcast_scripts(full_response: str) -> Optional[dict]:
     =====HINDI PODCAST SCRIPT=====
     [Hindi content]
     
+    Only the sections of the requested languages are expected (a
+    single-language prompt produces just its own marker).
+    
     Returns:
-        dict with 'eng_pod' and 'hin_pod' keys, or None if split fails
+        dict with 'eng_pod' and/or 'hin_pod' keys, or None if split fails
     """
     try:
-        # Define markers for English and Hindi sections
-        eng_marker_start = "=====ENGLISH PODCAST SCRIPT====="
-        hin_marker_start = "=====HINDI PODCAST SCRIPT====="
-        
         # Find the positions of markers
-        eng_start_idx = full_response.find(eng_marker_start)
-        hin_start_idx = full_response.find(hin_marker_start)
+        starts = [full_response.find(SCRIPT_MARKERS[language]) for language in languages]
         
-        if eng_start_idx == -1 or hin_start_idx == -1:
-            logger.error("Could not find both English and Hindi script markers in response")
+        if -1 in starts:
+            missing = [language for language, start in zip(languages, starts) if start == -1]
+            logger.error(f"Could not find script markers in response for: {', '.join(missing)}")
             return None
         
-        # Extract English script (from marker to before Hindi marker)
-        eng_script = full_response[
-            eng_start_idx + len(eng_marker_start):hin_start_idx
-        ].strip()
+        scripts = {}
+        for i, language in enumerate(languages):
+            # Each section runs from its marker to the next marker (or the end)
+            start = starts[i] + len(SCRIPT_MARKERS[language])
+            end = starts[i + 1] if i + 1 < len(languages) else len(full_response)
+            script = full_response[start:end].strip()
+            
+            # Remove "IMPORTANT:" note if present at the end of English script
+            if language == "en" and _IMPORTANT_NOTE in script:
+                script = script[:script.find(_IMPORTANT_NOTE)].strip()
+            
+            # Validate every script has content
+            if not script:
+                logger.error(f"{SCRIPT_KEYS[language]} script is empty after splitting")
+                return None
+            
+            scripts[SCRIPT_KEYS[language]] = script
         
-        # Extract Hindi script (from marker to end)
-        hin_script = full_response[
-            hin_start_idx + len(hin_marker_start):
-        ].strip()
+        logger.info(f"Successfully split podcast scripts into {' and '.join(scripts)}")
         
-        # Remove "IMPORTANT:" note if present at the end of English script
-        if "IMPORTANT:" in eng_script:
-            eng_script = eng_script[:eng_script.find("IMPORTANT:")].strip()
-        
-        # Validate both scripts have content
-        if not eng_script or not hin_script:
-            logger.error("One or both scripts are empty after splitting")
-            return None
-        
-        logger.info("Successfully split podcast scripts into eng_pod and hin_pod")
-        
-        return {
-            "eng_pod": eng_script,
-            "hin_pod": hin_script
-        }
+        return scripts
     
     except Exception as e:
         logger.error(f"Failed to split podcast scripts: {str(e)}", exc_info=True)
-        return None
\ No newline at end of file
+        return None
@@ -0,0 +1,134 @@
+# services/unified_agent/runner_pool.py
+import time
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Deque, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.logger import logger
+
+try:
+    from google.adk.runners import Runner
+    ADK_RUNNER_AVAILABLE = True
+except ImportError:
+    ADK_RUNNER_AVAILABLE = False
+
+
+class RunnerPool:
+    """
+    Warm, reusable ADK Runner instances with a cap on concurrent agent runs.
+
+    A Runner only binds (agent, app_name, session_service); per-run state
+    lives in the session, so runners are created once and handed out to
+    one run at a time instead of being rebuilt per request.
+
+    - At most max_concurrency runs execute at once; further runs wait
+      for a free slot (the wait is recorded for stats())
+    - Runners are kept per agent; start() pre-builds them so the first
+      requests do not pay for construction
+    """
+
+    def __init__(self, max_concurrency: int, wait_window: int = 1000):
+        self.max_concurrency = max(1, max_concurrency)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._free: Dict[int, List[Any]] = {}
+        self._session_service = None
+        self._app_name = "podcast_agent"
+
+        self.runners_created = 0
+        self.acquisitions = 0
+        self.in_use = 0
+        self.waiting = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self._recent_waits: Deque[float] = deque(maxlen=wait_window)
+
+    def start(self, agents: List[Any], session_service, app_name: str):
+        """Pre-build max_concurrency runners for each agent (called at app startup)"""
+        if not ADK_RUNNER_AVAILABLE:
+            return
+        self._session_service = session_service
+        self._app_name = app_name
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        for agent in agents:
+            if agent is None:
+                continue
+            free = self._free.setdefault(id(agent), [])
+            while len(free) < self.max_concurrency:
+                free.append(self._build(agent))
+
+        logger.info(f"✓ Runner pool warm — {self.runners_created} runner(s), max {self.max_concurrency} concurrent runs")
+
+    async def close(self):
+        """Close every pooled runner (called at app shutdown)"""
+        runners = [runner for free in self._free.values() for runner in free]
+        self._free.clear()
+        for runner in runners:
+            try:
+                await runner.close()
+            except Exception as e:
+                logger.warning(f"Failed to close runner: {str(e)}")
+
+    @asynccontextmanager
+    async def runner(self, agent, session_service, app_name: str):
+        """
+        Wait for a run slot and yield a runner for `agent`.
+        Agents not registered at start() get runners built on first use.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        started = time.perf_counter()
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self._record_wait(time.perf_counter() - started)
+
+        free = self._free.setdefault(id(agent), [])
+        runner = free.pop() if free else None
+        if runner is None or runner.session_service is not session_service or runner.app_name != app_name:
+            runner = self._build(agent, session_service, app_name)
+
+        self.in_use += 1
+        try:
+            yield runner
+        finally:
+            self.in_use -= 1
+            free.append(runner)
+            self._semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        recent = sorted(self._recent_waits)
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_use": self.in_use,
+            "waiting": self.waiting,
+            "idle_runners": sum(len(free) for free in self._free.values()),
+            "runners_created": self.runners_created,
+            "acquisitions": self.acquisitions,
+            "avg_wait_ms": round(self.total_wait_seconds / self.acquisitions * 1000, 2) if self.acquisitions else 0.0,
+            "p95_wait_ms": round(recent[int(0.95 * (len(recent) - 1))] * 1000, 2) if recent else 0.0,
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 2),
+        }
+
+    def _build(self, agent, session_service=None, app_name: Optional[str] = None):
+        self.runners_created += 1
+        return Runner(
+            agent=agent,
+            app_name=app_name or self._app_name,
+            session_service=session_service or self._session_service
+        )
+
+    def _record_wait(self, seconds: float):
+        self.acquisitions += 1
+        self.total_wait_seconds += seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+        self._recent_waits.append(seconds)
+
+
+# Global instance
+runner_pool = RunnerPool(max_concurrency=settings.AGENT_MAX_CONCURRENT_RUNS)
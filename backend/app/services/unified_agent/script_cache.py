@@ -0,0 +1,189 @@
+# services/unified_agent/script_cache.py
+import os
+import json
+import time
+import asyncio
+import hashlib
+import tempfile
+from datetime import date
+from typing import Dict, Any, Optional, Callable, Awaitable
+
+from app.core.config import settings
+from app.core.logger import logger
+
+
+class ScriptCache:
+    """
+    Memoizes agent script generation per (target date, attribution, prompt version).
+    
+    - In-memory map backed by one JSON file per entry, so cached scripts
+      survive restarts and are shared by processes on the same disk
+    - Entries expire after `ttl_seconds`
+    - Single-flight: concurrent requests for the same key await one
+      in-flight agent run instead of each starting their own
+    
+    Only successful results are cached; failures are returned to every
+    waiter of that run and the next request tries again.
+    """
+
+    def __init__(self, cache_dir: str, ttl_seconds: int):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+
+        self._memory: Dict[str, Dict[str, Any]] = {}
+        # Runs per key: tasks started by get_or_create, or futures of
+        # caller-driven (streamed) runs registered with claim()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def make_key(target_date: str, attribution: str, prompt_version: str) -> str:
+        """
+        Hash the request identity into a cache key.
+        Relative dates ("yesterday") are pinned to today's date so the
+        entry cannot be served on a later day.
+        """
+        if target_date == "yesterday" or not target_date[:1].isdigit():
+            target_date = f"{target_date}@{date.today().isoformat()}"
+        identity = json.dumps([target_date, attribution, prompt_version], ensure_ascii=False)
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    async def get_or_create(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Return the cached result for key, or run `factory` once and cache
+        its result if it has success=True.
+        """
+        cached = await self.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            logger.info(f"Script generation for {key[:12]} already running; awaiting it")
+        else:
+            self.misses += 1
+            task = asyncio.create_task(self._run(key, factory))
+            self._in_flight[key] = task
+
+        # Shield so one caller disconnecting does not cancel the shared run
+        return await asyncio.shield(task)
+
+    def claim(self, key: str) -> bool:
+        """
+        Register a run the caller drives itself (a streamed generation) as
+        the in-flight run for key, so identical get_or_create() calls
+        await it. Returns False if a run for key is already in flight.
+        The caller must call release() with the run's result when done.
+        """
+        if key in self._in_flight:
+            return False
+        self._in_flight[key] = asyncio.get_running_loop().create_future()
+        return True
+
+    def release(self, key: str, result: Dict[str, Any]) -> None:
+        """
+        Finish a claimed run and hand its result to every waiter.
+        Cache a successful result with put() before releasing, so later
+        requests find it instead of starting a new run.
+        """
+        future = self._in_flight.pop(key, None)
+        if future is not None and not future.done():
+            future.set_result(result)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return an unexpired cached result, or None."""
+        entry = self._memory.get(key)
+        if entry is None:
+            entry = await asyncio.to_thread(self._read_disk, key)
+            if entry is not None:
+                self._memory[key] = entry
+
+        if entry is None:
+            return None
+
+        if time.time() - entry["created_at"] > self.ttl_seconds:
+            self._memory.pop(key, None)
+            await asyncio.to_thread(self._remove_disk, key)
+            return None
+
+        return dict(entry["result"])
+
+    async def put(self, key: str, result: Dict[str, Any]) -> None:
+        entry = {"created_at": time.time(), "result": result}
+        self._memory[key] = entry
+        try:
+            await asyncio.to_thread(self._write_disk, key, entry)
+        except Exception as e:
+            logger.warning(f"Script cache write failed for {key[:12]}: {str(e)}")
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "in_flight": len(self._in_flight),
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+    async def _run(self, key: str, factory: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        try:
+            result = await factory()
+            if result.get("success"):
+                await self.put(key, result)
+            return result
+        finally:
+            self._in_flight.pop(key, None)
+
+    # ----- disk (runs in worker threads) -----
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Script cache read failed for {key[:12]}: {str(e)}")
+            return None
+
+    def _write_disk(self, key: str, entry: Dict[str, Any]) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # Write to a temp file then rename so readers never see partial entries
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _remove_disk(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+
+# Global instance
+script_cache = ScriptCache(
+    cache_dir=settings.SCRIPT_CACHE_PATH,
+    ttl_seconds=settings.SCRIPT_CACHE_TTL_SECONDS,
+)
@@ -3,6 +3,59 @@ import re
 from app.core.logger import logger
 
 
+# The cleaning passes, in their original order. The order matters: each
+# pass sees the output of the ones before it, so "***x***" loses its bold
+# markers first and is then an italic span, and "- 1. item" loses both
+# markers. (A single combined tokenizer cannot reproduce that, since the
+# leftmost construct would win instead of the earliest pass.)
+#
+# Each pass is precompiled and only runs when its trigger can occur in the
+# current text: a substring check for the inline passes, and a search for
+# a line starting with a marker (a literal "\n" prefix, so the engine can
+# skip ahead) for the line-start passes. Typical agent output has almost
+# no markdown, so most passes are skipped.
+_MARKDOWN_PASSES = (
+    ("#", None, re.compile(r'^#+\s+', re.MULTILINE), ''),
+    ("**", None, re.compile(r'\*\*(.+?)\*\*'), r'\1'),
+    ("*", None, re.compile(r'\*(.+?)\*'), r'\1'),
+    ("__", None, re.compile(r'__(.+?)__'), r'\1'),
+    ("_", None, re.compile(r'_(.+?)_'), r'\1'),
+    ("```", None, re.compile(r'```[\s\S]*?```'), ''),
+    ("`", None, re.compile(r'`([^`]+)`'), r'\1'),
+    (None, re.compile(r'\n[^\S\n]*[-*+]'), re.compile(r'^\s*[-*+]\s+', re.MULTILINE), ''),
+    (None, re.compile(r'\n[^\S\n]*\d'), re.compile(r'^\s*\d+\.\s+', re.MULTILINE), ''),
+)
+
+# Stands in for the end of the previous line when a streamed segment is
+# cleaned on its own; it is not whitespace or markup, so no pass matches it
+_LINE_CONTINUATION = "\x00"
+
+_BLANK_LINES_PATTERN = re.compile(r'\n\n+')
+
+# A line that cleans to nothing but a list/header marker (or to blank); a
+# stream cut after it could split a marker from the whitespace that the
+# line-start passes would remove with it
+_MARKER_LINE_PATTERN = re.compile(r'\s*(?:[-*+]|\d+\.|#+)?')
+
+
+def _clean_markdown(text: str, line_start: bool = True) -> str:
+    """
+    Remove markdown with the ordered passes; no whitespace normalization.
+    line_start=False means text continues a line (used when streaming).
+    """
+    if not line_start:
+        return _clean_markdown(_LINE_CONTINUATION + text)[1:]
+
+    for trigger, line_hint, pattern, replacement in _MARKDOWN_PASSES:
+        if trigger is not None:
+            if trigger not in text:
+                continue
+        elif not line_hint.search("\n" + text):
+            continue
+        text = pattern.sub(replacement, text)
+    return text
+
+
 def clean_generated_script(raw_script: str) -> str:
     """
     Remove markdown artifacts and normalize whitespace for clean TTS input.
@@ -11,25 +64,10 @@ def clean_generated_script(raw_script: str) -> str:
         return ""
 
     try:
-        # Headers
-        script = re.sub(r'^#+\s+', '', raw_script, flags=re.MULTILINE)
-
-        # Bold / italic
-        script = re.sub(r'\*\*(.+?)\*\*', r'\1', script)
-        script = re.sub(r'\*(.+?)\*', r'\1', script)
-        script = re.sub(r'__(.+?)__', r'\1', script)
-        script = re.sub(r'_(.+?)_', r'\1', script)
-
-        # Code blocks & inline code
-        script = re.sub(r'```[\s\S]*?```', '', script)
-        script = re.sub(r'`([^`]+)`', r'\1', script)
-
-        # Lists
-        script = re.sub(r'^\s*[-*+]\s+', '', script, flags=re.MULTILINE)
-        script = re.sub(r'^\s*\d+\.\s+', '', script, flags=re.MULTILINE)
+        script = _clean_markdown(raw_script)
 
         # Collapse multiple newlines
-        script = re.sub(r'\n\n+', '\n\n', script)
+        script = _BLANK_LINES_PATTERN.sub('\n\n', script)
 
         # Trim
         script = script.strip()
@@ -39,4 +77,98 @@ def clean_generated_script(raw_script: str) -> str:
 
     except Exception as e:
         logger.warning(f"Script cleaning failed: {str(e)} — returning original")
-        return raw_script
\ No newline at end of file
+        return raw_script
+
+
+class StreamingScriptCleaner:
+    """
+    Incremental version of clean_generated_script for agent output that
+    arrives in pieces.
+
+    feed() returns the cleaned text that is final so far; close() returns
+    the rest. Concatenating every returned piece gives the same text as
+    clean_generated_script() on the whole input.
+
+    Raw text is only cleaned up to the end of the last complete line that
+    leaves no backtick open and does not clean to a bare marker (markdown
+    constructs never span such a cut), and trailing whitespace is held back
+    so blank-line collapsing and the final strip see whole whitespace runs.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._consumed = False
+        self._started = False
+        self._pending_whitespace = ""
+
+    def feed(self, text: str) -> str:
+        """Add raw text; return newly available cleaned text (may be empty)."""
+        if not text:
+            return ""
+        self._buffer += text
+
+        cut = self._safe_cut()
+        if cut <= 0:
+            return ""
+
+        segment, self._buffer = self._buffer[:cut], self._buffer[cut:]
+        return self._emit(segment)
+
+    def close(self) -> str:
+        """Flush and return the remaining cleaned text."""
+        segment, self._buffer = self._buffer, ""
+        out = self._emit(segment) if segment else ""
+        self._pending_whitespace = ""
+        return out
+
+    def _safe_cut(self) -> int:
+        """
+        Index just before the last newline that ends a content line, or 0.
+        The held-back tail then starts with its whole newline run.
+        """
+        search_end = len(self._buffer)
+        while True:
+            newline = self._buffer.rfind("\n", 0, search_end)
+            if newline <= 0:
+                return 0
+
+            cut = newline
+            while cut > 0 and self._buffer[cut - 1].isspace():
+                cut -= 1
+            if cut == 0:
+                return 0
+            line_start = self._buffer.rfind("\n", 0, cut) + 1
+
+            if "`" in self._buffer[:cut]:
+                # Code spans and blocks can cross lines: every backtick
+                # before the cut must already be paired (cleaned away)
+                cleaned = _clean_markdown(self._buffer[:cut])
+                open_code = "`" in cleaned
+                last_line = cleaned[cleaned.rfind("\n") + 1:]
+            else:
+                open_code = False
+                last_line = _clean_markdown(self._buffer[line_start:cut])
+
+            if not open_code and not _MARKER_LINE_PATTERN.fullmatch(last_line):
+                return cut
+            if line_start == 0:
+                return 0
+            search_end = line_start - 1
+
+    def _emit(self, segment: str) -> str:
+        # Only the first segment starts at a line start; later ones start
+        # at the newline run that ended the previous segment
+        cleaned = _clean_markdown(segment, line_start=not self._consumed)
+        self._consumed = True
+
+        out = _BLANK_LINES_PATTERN.sub('\n\n', self._pending_whitespace + cleaned)
+
+        if not self._started:
+            out = out.lstrip()
+            if not out:
+                return ""
+            self._started = True
+
+        stripped = out.rstrip()
+        self._pending_whitespace = out[len(stripped):]
+        return stripped
@@ -1,101 +1,432 @@
-from typing import Dict, Any, Optional
+from contextlib import aclosing
+from typing import AsyncIterator, Dict, Any, Iterable, Optional, Tuple
 
+from app.core.config import settings
 from app.core.logger import logger
 
-from .agent_init import initialize_agent, ADK_AVAILABLE
-from .prompt_builder import build_podcast_prompt
-from .runner_execution import run_agent_and_get_script
-from .script_cleaner import clean_generated_script
+from .agent_init import initialize_agent, initialize_writer_agent, ADK_AVAILABLE
+from .prompt_builder import (
+    build_podcast_prompt,
+    resolve_languages,
+    LANGUAGE_NAMES,
+    PROMPT_VERSION,
+    PIPELINE_PROMPT_VERSION,
+    SCRIPT_KEYS,
+    SCRIPT_LANGUAGES,
+)
+from .pipeline import run_pipeline_and_get_scripts, stream_pipeline_response
+from .runner_execution import run_agent_and_get_script, stream_agent_response, ScriptSectionSplitter
+from .script_cleaner import clean_generated_script, StreamingScriptCleaner
 from .error_handling import error_response
+from .script_cache import script_cache
+from .runner_pool import runner_pool
+from .session_store import session_tracker
 
 
 class UnifiedAgentService:
+    """
+    Agent-backed script generation.
+    
+    Nothing is built at import time: startup() (called from the app
+    lifespan) creates the agents and session store, warms the runner pool
+    and purges stale sessions.
+    """
+
     def __init__(self):
         self.agent = None
+        self.writer_agent = None
         self.session_service = None
         self.app_name = "podcast_agent"
 
-        if ADK_AVAILABLE:
-            self.agent, self.session_service, success = initialize_agent()
-            if not success:
-                logger.error("UnifiedAgentService failed to initialize properly")
+    async def startup(self):
+        """Initialize agents, warm the runner pool and purge stale sessions"""
+        if not ADK_AVAILABLE or self.agent is not None:
+            return
+
+        self.agent, self.session_service, success = initialize_agent()
+        if not success:
+            logger.error("UnifiedAgentService failed to initialize properly")
+            return
+
+        self.writer_agent = initialize_writer_agent()
+        runner_pool.start([self.agent, self.writer_agent], self.session_service, self.app_name)
+        await session_tracker.purge_stale(self.session_service, self.app_name)
+
+    async def shutdown(self):
+        """Close pooled runners (called from the app lifespan)"""
+        await runner_pool.close()
+
+    def get_runner_pool_stats(self) -> Dict[str, Any]:
+        """Runner pool utilization and wait times"""
+        return runner_pool.stats()
+
+    def get_session_stats(self) -> Dict[str, Any]:
+        """Agent session lifecycle counters and process RSS"""
+        return session_tracker.stats(self.session_service)
+
+    @property
+    def pipeline_mode(self) -> bool:
+        """True when scripts are generated by the research + parallel writers pipeline"""
+        return settings.AGENT_GENERATION_MODE == "pipeline"
+
+    def _cache_key(self, target_date: str, attribution: str, languages: Tuple[str, ...]) -> str:
+        # Pipeline and single-call scripts come from different prompts
+        prompt_version = f"pipeline-{PIPELINE_PROMPT_VERSION}" if self.pipeline_mode else PROMPT_VERSION
+        if languages != SCRIPT_LANGUAGES:
+            prompt_version += ":" + "+".join(languages)
+        return script_cache.make_key(target_date, attribution, prompt_version)
+
+    async def _cached_bilingual(
+        self,
+        target_date: str,
+        attribution: str,
+        languages: Tuple[str, ...]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        For a single-language request, reuse a cached bilingual result
+        (no agent run needed); None otherwise.
+        """
+        if languages == SCRIPT_LANGUAGES:
+            return None
+        cached = await script_cache.get(self._cache_key(target_date, attribution, SCRIPT_LANGUAGES))
+        if cached is None:
+            return None
+        script_cache.hits += 1
+        logger.info(f"Serving {'+'.join(languages)} scripts from the cached bilingual result")
+        return self._build_result(
+            {SCRIPT_KEYS[language]: cached[SCRIPT_KEYS[language]] for language in languages},
+            attribution,
+            target_date
+        )
 
     async def process_podcast_request(
         self,
         target_date: Optional[str] = None,
-        attribution: Optional[str] = None
+        attribution: Optional[str] = None,
+        use_cache: bool = True,
+        languages: Optional[Iterable[str]] = None
     ) -> Dict[str, Any]:
         """
         Main entry point: generate financial podcast scripts (English and Hindi) using Google ADK agent.
         Returns two separate podcast scripts: eng_pod (English) and hin_pod (Hindi).
+        
+        `languages` ("en", "hi", "both" or an iterable; default both) limits
+        generation and validation to the scripts that will be voiced; the
+        other script key is None in the result.
+        
+        Results are memoized per (date, attribution, prompt version,
+        languages), and concurrent identical requests share one agent run.
+        Single-language requests are also served from a cached bilingual
+        result. Pass use_cache=False to force a fresh research run.
+        
+        With AGENT_GENERATION_MODE="pipeline", one research call is
+        followed by the writers running concurrently.
         """
         target_date = target_date or "yesterday"
         attribution = attribution or "Financial Research Team"
+        languages = resolve_languages(languages)
+
+        if not settings.SCRIPT_CACHE_ENABLED or not use_cache:
+            return await self._generate_scripts(target_date, attribution, languages)
+
+        cached = await self._cached_bilingual(target_date, attribution, languages)
+        if cached is not None:
+            return cached
 
+        key = self._cache_key(target_date, attribution, languages)
+        return await script_cache.get_or_create(
+            key,
+            lambda: self._generate_scripts(target_date, attribution, languages)
+        )
+
+    async def _generate_scripts(
+        self,
+        target_date: str,
+        attribution: str,
+        languages: Tuple[str, ...] = SCRIPT_LANGUAGES
+    ) -> Dict[str, Any]:
+        """Run the agent once and clean/validate the requested scripts"""
         if not self.agent or not self.session_service:
             return error_response("Agent or session service not initialized")
 
+        if self.pipeline_mode and not self.writer_agent:
+            return error_response("Writer agent not initialized")
+
         try:
-            logger.info(f"Starting podcast script generation for date: {target_date}")
+            logger.info(f"Starting podcast script generation for date: {target_date} (languages: {', '.join(languages)})")
 
-            prompt = build_podcast_prompt(target_date, attribution)
+            if self.pipeline_mode:
+                # Research once, then write the scripts concurrently
+                scripts_dict = await run_pipeline_and_get_scripts(
+                    research_agent=self.agent,
+                    writer_agent=self.writer_agent,
+                    session_service=self.session_service,
+                    target_date=target_date,
+                    attribution=attribution,
+                    app_name=self.app_name,
+                    languages=languages
+                )
+            else:
+                prompt = build_podcast_prompt(target_date, attribution, languages)
 
-            # Run agent and get dictionary with both scripts
-            scripts_dict = await run_agent_and_get_script(
-                agent=self.agent,
-                session_service=self.session_service,
-                prompt=prompt,
-                app_name=self.app_name
-            )
+                # Run agent and get dictionary with the requested scripts
+                scripts_dict = await run_agent_and_get_script(
+                    agent=self.agent,
+                    session_service=self.session_service,
+                    prompt=prompt,
+                    app_name=self.app_name,
+                    languages=languages
+                )
 
             if not scripts_dict:
                 return error_response("No valid response received from agent")
 
-            # Validate that we have both scripts
-            if "eng_pod" not in scripts_dict or "hin_pod" not in scripts_dict:
-                logger.error("Agent response missing eng_pod or hin_pod")
-                return error_response("Invalid response format - missing eng_pod or hin_pod")
-
-            # Extract and clean both scripts
-            eng_pod_raw = scripts_dict.get("eng_pod", "")
-            hin_pod_raw = scripts_dict.get("hin_pod", "")
-
-            # Clean both scripts
-            eng_pod_cleaned = clean_generated_script(eng_pod_raw)
-            hin_pod_cleaned = clean_generated_script(hin_pod_raw)
+            # Validate that we have every requested script
+            missing = [SCRIPT_KEYS[language] for language in languages if SCRIPT_KEYS[language] not in scripts_dict]
+            if missing:
+                logger.error(f"Agent response missing {' and '.join(missing)}")
+                return error_response(f"Invalid response format - missing {' and '.join(missing)}")
 
-            # Validate both scripts have sufficient content
-            min_length = 300
-            if len(eng_pod_cleaned) < min_length:
-                logger.warning(f"English script too short: {len(eng_pod_cleaned)} chars")
-                return error_response(f"English script too short ({len(eng_pod_cleaned)} chars)")
-
-            if len(hin_pod_cleaned) < min_length:
-                logger.warning(f"Hindi script too short: {len(hin_pod_cleaned)} chars")
-                return error_response(f"Hindi script too short ({len(hin_pod_cleaned)} chars)")
-
-            logger.info(
-                f"✓ Podcast scripts generated successfully — "
-                f"eng_pod: {len(eng_pod_cleaned)} chars, "
-                f"hin_pod: {len(hin_pod_cleaned)} chars"
+            return self._finalize_scripts(
+                {SCRIPT_KEYS[language]: scripts_dict[SCRIPT_KEYS[language]] for language in languages},
+                attribution,
+                target_date
             )
 
-            return {
-                "eng_pod": eng_pod_cleaned,
-                "hin_pod": hin_pod_cleaned,
-                "success": True,
-                "attribution": attribution,
-                "date": target_date,
-                "eng_pod_length": len(eng_pod_cleaned),
-                "hin_pod_length": len(hin_pod_cleaned),
-                "total_length": len(eng_pod_cleaned) + len(hin_pod_cleaned),
-                "scripts_generated": 2
-            }
-
         except Exception as e:
             logger.error(f"Critical error in podcast generation: {str(e)}", exc_info=True)
             return error_response(str(e))
 
+    async def stream_podcast_request(
+        self,
+        target_date: Optional[str] = None,
+        attribution: Optional[str] = None,
+        use_cache: bool = True,
+        languages: Optional[Iterable[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming variant of process_podcast_request.
+        
+        Yields events while the agent is still writing, so cleaning,
+        splitting and TTS can start on the English script before the Hindi
+        one is finished:
+            {"type": "text", "language": "en" | "hi", "text": "<cleaned delta>"}
+            {"type": "end", "language": "en" | "hi"}   (no more text for that language)
+            {"type": "result", "result": {...}}        (always last; same dict as process_podcast_request)
+        
+        Only the requested languages are generated (see process_podcast_request).
+        Concatenated text deltas equal the cleaned script in the result.
+        A cached result is replayed as one text event per language; a
+        request identical to one already in flight (streamed or not) waits
+        for that run and is replayed the same way.
+        """
+        target_date = target_date or "yesterday"
+        attribution = attribution or "Financial Research Team"
+        languages = resolve_languages(languages)
+        use_cache = use_cache and settings.SCRIPT_CACHE_ENABLED
+        key = self._cache_key(target_date, attribution, languages)
+
+        claimed = False
+        if use_cache:
+            cached = await self._cached_bilingual(target_date, attribution, languages)
+            if cached is None:
+                cached = await script_cache.get(key)
+                if cached is not None:
+                    script_cache.hits += 1
+            if cached is None:
+                claimed = script_cache.claim(key)
+                if not claimed:
+                    # An identical run (streamed or not) is in flight: share it
+                    # instead of starting another research pass, then replay it
+                    cached = await script_cache.get_or_create(
+                        key,
+                        lambda: self._generate_scripts(target_date, attribution, languages)
+                    )
+                    if not cached.get("success"):
+                        yield {"type": "result", "result": cached}
+                        return
+            if cached is not None:
+                for language in languages:
+                    yield {"type": "text", "language": language, "text": cached[SCRIPT_KEYS[language]]}
+                    yield {"type": "end", "language": language}
+                yield {"type": "result", "result": cached}
+                return
+            script_cache.misses += 1
+
+        result = None
+        try:
+            async with aclosing(self._stream_scripts(target_date, attribution, languages)) as events:
+                async for event in events:
+                    if event["type"] == "result":
+                        result = event["result"]
+                        break
+                    yield event
+
+            if claimed and result.get("success"):
+                await script_cache.put(key, result)
+        finally:
+            # Waiters get the result, or an error if this stream was abandoned
+            if claimed:
+                script_cache.release(key, result or error_response("Streamed script generation was interrupted"))
+
+        yield {"type": "result", "result": result}
+
+    async def _stream_scripts(
+        self,
+        target_date: str,
+        attribution: str,
+        languages: Tuple[str, ...]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Run the agent with streaming and yield the events of stream_podcast_request (uncached)"""
+        if not self.agent or not self.session_service:
+            yield {"type": "result", "result": error_response("Agent or session service not initialized")}
+            return
+
+        if self.pipeline_mode and not self.writer_agent:
+            yield {"type": "result", "result": error_response("Writer agent not initialized")}
+            return
+
+        cleaners = {language: StreamingScriptCleaner() for language in languages}
+        raw = {language: [] for language in languages}
+        ended = set()
+
+        try:
+            logger.info(f"Starting streamed podcast script generation for date: {target_date}")
+
+            if self.pipeline_mode:
+                sections = stream_pipeline_response(
+                    research_agent=self.agent,
+                    writer_agent=self.writer_agent,
+                    session_service=self.session_service,
+                    target_date=target_date,
+                    attribution=attribution,
+                    app_name=self.app_name,
+                    languages=languages
+                )
+            else:
+                sections = self._stream_single_call_sections(target_date, attribution, languages)
+
+            async for language, text in sections:
+                if text is None:
+                    ended.add(language)
+                    cleaned = cleaners[language].close()
+                    if cleaned:
+                        yield {"type": "text", "language": language, "text": cleaned}
+                    yield {"type": "end", "language": language}
+                    continue
+
+                raw[language].append(text)
+                cleaned = cleaners[language].feed(text)
+                if cleaned:
+                    yield {"type": "text", "language": language, "text": cleaned}
+
+            for language in languages:
+                if language in ended:
+                    continue
+                cleaned = cleaners[language].close()
+                if cleaned:
+                    yield {"type": "text", "language": language, "text": cleaned}
+                yield {"type": "end", "language": language}
+
+            result = self._finalize_scripts(
+                {SCRIPT_KEYS[language]: "".join(raw[language]) for language in languages},
+                attribution,
+                target_date
+            )
+
+        except Exception as e:
+            logger.error(f"Critical error in streamed podcast generation: {str(e)}", exc_info=True)
+            result = error_response(str(e))
+
+        yield {"type": "result", "result": result}
+
+    async def _stream_single_call_sections(
+        self,
+        target_date: str,
+        attribution: str,
+        languages: Tuple[str, ...]
+    ) -> AsyncIterator[Tuple[str, Optional[str]]]:
+        """
+        Stream the single agent call as (language, raw delta) pieces, with
+        (language, None) once a section is complete. English is complete
+        as soon as the Hindi marker appears.
+        """
+        sections = ScriptSectionSplitter(languages)
+        announced = 0
+
+        async for delta in stream_agent_response(
+            agent=self.agent,
+            session_service=self.session_service,
+            prompt=build_podcast_prompt(target_date, attribution, languages),
+            app_name=self.app_name
+        ):
+            for piece in sections.feed(delta):
+                yield piece
+
+            for language in sections.completed[announced:]:
+                announced += 1
+                logger.info(f"{LANGUAGE_NAMES[language]} script complete; next section still streaming")
+                yield language, None
+
+        for piece in sections.close():
+            yield piece
+
+    def _finalize_scripts(
+        self,
+        raw_scripts: Dict[str, str],
+        attribution: str,
+        target_date: str
+    ) -> Dict[str, Any]:
+        """
+        Clean the raw scripts (keyed eng_pod / hin_pod), validate their
+        length and build the result dict. Only the given scripts are
+        validated; a language that was not requested cannot fail the run.
+        """
+        cleaned_scripts = {}
+        for language in SCRIPT_LANGUAGES:
+            key = SCRIPT_KEYS[language]
+            if key not in raw_scripts:
+                continue
+            cleaned = clean_generated_script(raw_scripts[key])
+
+            # Validate the script has sufficient content
+            min_length = 300
+            if len(cleaned) < min_length:
+                name = LANGUAGE_NAMES[language]
+                logger.warning(f"{name} script too short: {len(cleaned)} chars")
+                return error_response(f"{name} script too short ({len(cleaned)} chars)")
+
+            cleaned_scripts[key] = cleaned
+
+        logger.info(
+            f"✓ Podcast scripts generated successfully — "
+            + ", ".join(f"{key}: {len(text)} chars" for key, text in cleaned_scripts.items())
+        )
+
+        return self._build_result(cleaned_scripts, attribution, target_date)
+
+    @staticmethod
+    def _build_result(
+        scripts: Dict[str, str],
+        attribution: str,
+        target_date: str
+    ) -> Dict[str, Any]:
+        """Result dict for cleaned scripts; scripts not generated are None"""
+        eng_pod = scripts.get("eng_pod")
+        hin_pod = scripts.get("hin_pod")
+        return {
+            "eng_pod": eng_pod,
+            "hin_pod": hin_pod,
+            "success": True,
+            "attribution": attribution,
+            "date": target_date,
+            "languages": [language for language in SCRIPT_LANGUAGES if scripts.get(SCRIPT_KEYS[language])],
+            "eng_pod_length": len(eng_pod or ""),
+            "hin_pod_length": len(hin_pod or ""),
+            "total_length": len(eng_pod or "") + len(hin_pod or ""),
+            "scripts_generated": len(scripts)
+        }
+
     async def process_podcast_request_for_tts(
         self,
         target_date: Optional[str] = None,
@@ -0,0 +1,190 @@
+# services/unified_agent/session_store.py
+import os
+import sys
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.core.logger import logger
+
+try:
+    from google.adk.sessions import DatabaseSessionService, InMemorySessionService
+    ADK_SESSIONS_AVAILABLE = True
+except ImportError:
+    ADK_SESSIONS_AVAILABLE = False
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+SESSION_BACKENDS = ("sqlite", "memory")
+
+# All agent runs share one ADK user; sessions are unique per run
+SESSION_USER_ID = "podcast_worker"
+
+
+def create_session_service(backend: Optional[str] = None, db_url: Optional[str] = None):
+    """
+    Build the ADK session service for agent runs.
+
+    Backends:
+    - "sqlite" (default): DatabaseSessionService on AGENT_SESSION_DB_URL, so
+      session state lives on disk instead of the worker's heap
+    - "memory": InMemorySessionService
+
+    Falls back to in-memory if the database service cannot be created.
+    Returns None if ADK is not installed.
+    """
+    if not ADK_SESSIONS_AVAILABLE:
+        return None
+
+    backend = backend or settings.AGENT_SESSION_BACKEND
+    if backend not in SESSION_BACKENDS:
+        logger.warning(f"Unknown session backend '{backend}', using 'sqlite'")
+        backend = "sqlite"
+
+    if backend == "sqlite":
+        db_url = db_url or settings.AGENT_SESSION_DB_URL
+        try:
+            _ensure_sqlite_dir(db_url)
+            service = DatabaseSessionService(db_url=db_url)
+            logger.info(f"✓ Agent sessions stored in {db_url}")
+            return service
+        except Exception as e:
+            logger.warning(f"Database session store unavailable ({str(e)}) — using in-memory sessions")
+
+    return InMemorySessionService()
+
+
+def _ensure_sqlite_dir(db_url: str):
+    prefix = "sqlite:///"
+    if db_url.startswith(prefix) and db_url[len(prefix):] not in ("", ":memory:"):
+        directory = os.path.dirname(db_url[len(prefix):])
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Resident set size of this process (None if it cannot be read)"""
+    if PSUTIL_AVAILABLE:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process (None if unavailable)"""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS, kilobytes elsewhere
+        return peak if sys.platform == "darwin" else peak * 1024
+    except (ImportError, OSError):
+        return None
+
+
+class SessionTracker:
+    """
+    Lifecycle of ADK sessions used by agent runs.
+
+    agent_session() opens a session with a unique id and deletes it when
+    the run finishes (or fails), so neither the in-memory nor the database
+    store grows with the number of runs. Counters and an RSS gauge are
+    exposed through stats().
+    """
+
+    def __init__(self):
+        self.created = 0
+        self.deleted = 0
+        self.delete_failures = 0
+        self.purged = 0
+        self.active = 0
+
+    @asynccontextmanager
+    async def agent_session(self, session_service, app_name: str):
+        """Yield (user_id, session_id) of a fresh session; delete it on exit."""
+        session_id = f"session_{uuid.uuid4().hex}"
+        await session_service.create_session(
+            app_name=app_name,
+            user_id=SESSION_USER_ID,
+            session_id=session_id
+        )
+        self.created += 1
+        self.active += 1
+        try:
+            yield SESSION_USER_ID, session_id
+        finally:
+            self.active -= 1
+            try:
+                await session_service.delete_session(
+                    app_name=app_name,
+                    user_id=SESSION_USER_ID,
+                    session_id=session_id
+                )
+                self.deleted += 1
+            except Exception as e:
+                self.delete_failures += 1
+                logger.warning(f"Failed to delete agent session {session_id}: {str(e)}")
+
+    async def purge_stale(self, session_service, app_name: str, max_age_seconds: Optional[int] = None) -> int:
+        """
+        Delete sessions left behind by runs that never finished (e.g. a
+        crashed worker sharing the database). Only sessions idle for longer
+        than max_age_seconds are removed, so live runs of other workers on
+        the same database are kept.
+        """
+        if session_service is None:
+            return 0
+        if max_age_seconds is None:
+            max_age_seconds = settings.AGENT_SESSION_MAX_AGE_SECONDS
+
+        try:
+            response = await session_service.list_sessions(app_name=app_name, user_id=SESSION_USER_ID)
+        except Exception as e:
+            logger.warning(f"Could not list agent sessions for purge: {str(e)}")
+            return 0
+
+        cutoff = time.time() - max_age_seconds
+        purged = 0
+        for session in response.sessions:
+            if session.last_update_time and session.last_update_time > cutoff:
+                continue
+            try:
+                await session_service.delete_session(
+                    app_name=app_name,
+                    user_id=SESSION_USER_ID,
+                    session_id=session.id
+                )
+                purged += 1
+            except Exception as e:
+                logger.warning(f"Failed to purge agent session {session.id}: {str(e)}")
+
+        self.purged += purged
+        if purged:
+            logger.info(f"✓ Purged {purged} stale agent session(s)")
+        return purged
+
+    def stats(self, session_service=None) -> Dict[str, Any]:
+        rss = current_rss_bytes()
+        peak = peak_rss_bytes()
+        return {
+            "backend": type(session_service).__name__ if session_service is not None else None,
+            "created": self.created,
+            "deleted": self.deleted,
+            "delete_failures": self.delete_failures,
+            "purged": self.purged,
+            "active": self.active,
+            "rss_mb": round(rss / (1024 * 1024), 2) if rss is not None else None,
+            "peak_rss_mb": round(peak / (1024 * 1024), 2) if peak is not None else None,
+        }
+
+
+# Global instance
+session_tracker = SessionTracker()
@@ -0,0 +1,253 @@
+"""
+Benchmark: end-to-end podcast generation, offline.
+
+Runs the real pipeline (agent service, runner pool, sessions, splitting,
+TTS client with retries, WAV/MP3 encoding, storage) against local
+stand-ins: a mock Sarvam TTS server (benchmarks/mock_sarvam.py) and a
+fake ADK runner with canned bilingual replies (benchmarks/fake_adk.py).
+Episodes are generated at a fixed concurrency, either by calling
+OrchestratorService.generate_podcast directly or through POST /generate
+and job polling, and the report gives p50/p95/p99 per pipeline stage
+(from each result's "timings"), end-to-end latency, episodes per minute,
+peak RSS and TTS request counts.
+
+Everything runs in a throwaway working directory, and the script and TTS
+caches are off unless --warm-caches is given, so runs are comparable.
+
+Usage (from backend/):
+    python -m benchmarks.bench_pipeline [--episodes 8] [--concurrency 4] [--mode direct|route]
+        [--language both] [--tts-latency 0.4] [--error-rate 0.02] [--rate-limit 10] [--json out.json]
+"""
+import os
+import sys
+import json
+import math
+import time
+import asyncio
+import logging
+import argparse
+import tempfile
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.core.logger import logger
+
+from benchmarks.mock_sarvam import MockSarvamServer, add_mock_arguments, mock_from_args
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def flatten_timings(timings: Dict[str, Any]) -> Dict[str, float]:
+    """{"tts": {"en": 1.2, "hi": 1.4}, "agent": 3.0} -> {"tts[en]": 1.2, "tts[hi]": 1.4, "agent": 3.0}"""
+    flat = {}
+    for stage, value in timings.items():
+        if isinstance(value, dict):
+            flat.update({f"{stage}[{lang}]": seconds for lang, seconds in value.items()})
+        else:
+            flat[stage] = value
+    return flat
+
+
+def configure(args: argparse.Namespace, tts_url: str):
+    """Point settings at the stand-ins (before the app services are imported)."""
+    settings.SARVAM_API_KEY = "offline-benchmark"
+    settings.SARVAM_TTS_URL = tts_url
+    settings.GEMINI_API_KEY = "offline-benchmark"
+    settings.SCRIPT_CACHE_ENABLED = args.warm_caches
+    settings.TTS_CACHE_ENABLED = args.warm_caches
+    settings.AGENT_GENERATION_MODE = args.generation_mode
+    if args.streaming is not None:
+        settings.AGENT_STREAMING_ENABLED = args.streaming
+    if args.client_rate_limit is not None:
+        settings.SARVAM_TTS_RATE_LIMIT_PER_SECOND = args.client_rate_limit
+    settings.JOB_WORKERS = args.job_workers or args.concurrency
+
+
+async def run_direct(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    from app.services.orchestrator_service import orchestrator_service
+    from app.services.podcast.service import podcast_service
+    from app.services.unified_agent.service import unified_agent_service
+
+    await podcast_service.startup()
+    await unified_agent_service.startup()
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def episode(index: int) -> Dict[str, Any]:
+        async with semaphore:
+            started = time.perf_counter()
+            result = await orchestrator_service.generate_podcast(
+                f"Benchmark Podcast {index}", language=args.language
+            )
+            return {"seconds": time.perf_counter() - started, "result": result}
+
+    try:
+        return await asyncio.gather(*(episode(i) for i in range(args.episodes)))
+    finally:
+        await unified_agent_service.shutdown()
+        await podcast_service.shutdown()
+
+
+async def run_route(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    import httpx
+    from app.main import app
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def episode(client: "httpx.AsyncClient", index: int) -> Dict[str, Any]:
+        async with semaphore:
+            started = time.perf_counter()
+            resp = await client.post(
+                f"{settings.API_V1_STR}/generate",
+                json={"name": f"Benchmark Podcast {index}", "language": args.language}
+            )
+            resp.raise_for_status()
+            status_url = resp.json()["status_url"]
+            while True:
+                job = (await client.get(status_url)).json()
+                if job["status"] in ("succeeded", "failed"):
+                    break
+                await asyncio.sleep(args.poll_interval)
+            result = job.get("result") or {"status": "error", "error": job.get("error"), "timings": {}}
+            return {"seconds": time.perf_counter() - started, "result": result}
+
+    # ASGITransport does not run the lifespan, so enter it here
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            return await asyncio.gather(*(episode(client, i) for i in range(args.episodes)))
+
+
+def summarize(
+    episodes: List[Dict[str, Any]],
+    wall_seconds: float,
+    mock_stats: Dict[str, Any],
+    client_stats: Dict[str, Any],
+    peak_rss: Optional[int]
+) -> Dict[str, Any]:
+    succeeded = [e for e in episodes if e["result"].get("status") == "success"]
+    stages: Dict[str, List[float]] = {"end_to_end": [e["seconds"] for e in succeeded]}
+    for e in succeeded:
+        for stage, seconds in flatten_timings(e["result"].get("timings") or {}).items():
+            stages.setdefault(stage, []).append(seconds)
+
+    return {
+        "episodes": len(episodes),
+        "succeeded": len(succeeded),
+        "failed": len(episodes) - len(succeeded),
+        "errors": sorted({str(e["result"].get("error")) for e in episodes if e not in succeeded}),
+        "wall_seconds": round(wall_seconds, 3),
+        "episodes_per_minute": round(len(succeeded) / wall_seconds * 60, 2) if wall_seconds else 0.0,
+        "peak_rss_mb": round(peak_rss / (1024 * 1024), 1) if peak_rss is not None else None,
+        "stages": {
+            stage: {
+                "n": len(values),
+                "p50": round(percentile(values, 50), 3),
+                "p95": round(percentile(values, 95), 3),
+                "p99": round(percentile(values, 99), 3),
+            }
+            for stage, values in stages.items() if values
+        },
+        "mock_tts": mock_stats,
+        "sarvam_client": client_stats,
+    }
+
+
+def print_report(args: argparse.Namespace, summary: Dict[str, Any]):
+    print(
+        f"\nPipeline benchmark — mode={args.mode} language={args.language} "
+        f"generation={args.generation_mode} episodes={args.episodes} concurrency={args.concurrency}\n"
+    )
+    print(f"{'stage':<22}{'n':>5}{'p50 (s)':>11}{'p95 (s)':>11}{'p99 (s)':>11}")
+    print("-" * 60)
+    for stage, row in summary["stages"].items():
+        print(f"{stage:<22}{row['n']:>5}{row['p50']:>11.3f}{row['p95']:>11.3f}{row['p99']:>11.3f}")
+
+    mock, client = summary["mock_tts"], summary["sarvam_client"]
+    print()
+    print(f"succeeded:            {summary['succeeded']}/{summary['episodes']} in {summary['wall_seconds']:.1f}s")
+    print(f"episodes/minute:      {summary['episodes_per_minute']:.2f}")
+    print(f"peak RSS:             {summary['peak_rss_mb']} MB")
+    print(
+        f"TTS requests:         {mock['requests']} ({mock['ok']} ok, {mock['rate_limited']} rate-limited, "
+        f"{mock['errors']} errors, max {mock['max_in_flight']} in flight)"
+    )
+    print(f"client retries:       {client.get('retries', 0)}")
+    for error in summary["errors"]:
+        print(f"error:                {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--episodes", type=int, default=8, help="Episodes to generate (default: 8)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Episodes in flight at once (default: 4)")
+    parser.add_argument("--mode", choices=("direct", "route"), default="direct",
+                        help="Call the orchestrator directly or go through POST /generate + job polling")
+    parser.add_argument("--language", choices=("en", "hi", "both"), default="both")
+    parser.add_argument("--generation-mode", choices=("single", "pipeline"), default=settings.AGENT_GENERATION_MODE)
+    streaming = parser.add_mutually_exclusive_group()
+    streaming.add_argument("--streaming", dest="streaming", action="store_true", default=None,
+                           help="Stream agent output into TTS (default: AGENT_STREAMING_ENABLED)")
+    streaming.add_argument("--no-streaming", dest="streaming", action="store_false")
+    parser.add_argument("--warm-caches", action="store_true", help="Keep the script and TTS caches on")
+    parser.add_argument("--client-rate-limit", type=float, default=None,
+                        help="Override SARVAM_TTS_RATE_LIMIT_PER_SECOND (0 disables the client limiter)")
+    parser.add_argument("--job-workers", type=int, default=None, help="JOB_WORKERS in route mode (default: --concurrency)")
+    parser.add_argument("--poll-interval", type=float, default=0.1, help="Job polling interval in route mode (default: 0.1)")
+    parser.add_argument("--workdir", default=None, help="Working directory for storage/ (default: a temporary directory)")
+    parser.add_argument("--json", dest="json_path", default=None, help="Also write the summary as JSON to this path")
+
+    agent = parser.add_argument_group("fake agent")
+    agent.add_argument("--agent-first-token", type=float, default=2.0, help="Seconds before the agent's first output (default: 2.0)")
+    agent.add_argument("--agent-chars-per-second", type=float, default=1500.0, help="Agent output speed (default: 1500)")
+    agent.add_argument("--script-words", type=int, default=700, help="Words per language script (default: 700)")
+    add_mock_arguments(parser)
+    args = parser.parse_args()
+
+    logger.setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    json_path = os.path.abspath(args.json_path) if args.json_path else None
+    workdir = args.workdir or tempfile.mkdtemp(prefix="bench_pipeline_")
+    os.makedirs(workdir, exist_ok=True)
+    # Storage paths are relative ("storage/..."); keep benchmark artifacts out of the tree
+    os.chdir(workdir)
+
+    server = MockSarvamServer(mock_from_args(args)).start()
+    try:
+        configure(args, server.url)
+
+        from benchmarks import fake_adk
+        from app.services.podcast.service import podcast_service
+        from app.services.unified_agent.session_store import peak_rss_bytes
+
+        fake_adk.install(args.agent_first_token, args.agent_chars_per_second, args.script_words)
+
+        runner = run_route if args.mode == "route" else run_direct
+        started = time.perf_counter()
+        episodes = asyncio.run(runner(args))
+        wall_seconds = time.perf_counter() - started
+
+        summary = summarize(
+            episodes, wall_seconds, server.mock.stats(),
+            podcast_service.sarvam_client.stats(), peak_rss_bytes()
+        )
+    finally:
+        server.stop()
+
+    print_report(args, summary)
+    print(f"\nartifacts:            {workdir}")
+
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump({"args": vars(args), **summary}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Benchmark: precompiled, gated script cleaner vs the original chain of re.sub passes.
+
+Also checks golden-output equivalence: for every sample (built-in markdown
+cases plus real raw agent output from storage/raw_data, if present) the new
+clean_generated_script and StreamingScriptCleaner (fed in random pieces)
+must produce exactly what the original cleaner produced.
+
+Usage (from backend/):
+    python -m benchmarks.bench_script_cleaner [--repeat 200] [--stream-trials 50]
+"""
+import os
+import re
+import sys
+import glob
+import json
+import time
+import random
+import logging
+import argparse
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.services.unified_agent.script_cleaner import clean_generated_script, StreamingScriptCleaner
+
+
+def legacy_clean_generated_script(raw_script: str) -> str:
+    """The original ten-pass cleaner, kept verbatim as the golden reference."""
+    if not raw_script:
+        return ""
+    script = re.sub(r'^#+\s+', '', raw_script, flags=re.MULTILINE)
+    script = re.sub(r'\*\*(.+?)\*\*', r'\1', script)
+    script = re.sub(r'\*(.+?)\*', r'\1', script)
+    script = re.sub(r'__(.+?)__', r'\1', script)
+    script = re.sub(r'_(.+?)_', r'\1', script)
+    script = re.sub(r'```[\s\S]*?```', '', script)
+    script = re.sub(r'`([^`]+)`', r'\1', script)
+    script = re.sub(r'^\s*[-*+]\s+', '', script, flags=re.MULTILINE)
+    script = re.sub(r'^\s*\d+\.\s+', '', script, flags=re.MULTILINE)
+    script = re.sub(r'\n\n+', '\n\n', script)
+    return script.strip()
+
+
+GOLDEN_CASES = [
+    "",
+    "Plain text with no markdown at all.",
+    "# Title\n\nWelcome to the **Nippon India** Financial Podcast.\n\n## Segment 1: Rates\nThe *RBI* held rates.",
+    "- first item\n- second *item*\n* third\n+ fourth\n\n1. one\n2. two\n10. ten",
+    "Intro paragraph.\n\n\n\n\nAfter many blank lines.\n\n",
+    "Use `inline code` and ```\ncode block\nwith lines\n``` then text.",
+    "__bold underscore__ and _italic underscore_ and snake_case_name here.",
+    "**bold with _nested italic_ inside** and *italic with `code`*",
+    "   \n\n  leading whitespace\n  - indented bullet\n\t* tab bullet\n",
+    "Price moved 5*3 points; a * b * c; end*",
+    "Segment — **Markets:** Sensex rose 1.2%, Nifty *up* 0.9%.\n\nSegment — __Rupee__: 83.2/USD.",
+    "रिज़र्व बैंक ने **रेपो दर** को स्थिर रखा।\n\n- मुद्रास्फीति *नियंत्रण* में\n- रुपया मज़बूत",
+    "=====ENGLISH PODCAST SCRIPT=====\n# Heading\nBody **text**.\n=====HINDI PODCAST SCRIPT=====\nहिंदी *पाठ*।",
+    "Trailing spaces   \n\n\n   \nmore\n",
+    "Numbers 1. inline are fine\n3.5 percent growth\n2024. A year.",
+    # Adjacent and stacked markup, where each pass sees the previous pass's output
+    "*a**a* and **S****S**",
+    "***bold italic*** and x *a**b** y",
+    "- 1. stacked markers\n# - header then bullet\n***\nafter a rule",
+    "`\n`*\ncode span ending on a marker line",
+    "`*`*` emphasis building a fence, and a stray ` backtick",
+]
+
+# Typical agent output: prose with only the section markers
+PROSE = (
+    "The Reserve Bank of India kept the repo rate unchanged at 6.5 percent, citing sticky food inflation. "
+    "Bond yields eased slightly after the announcement, and the rupee ended the day at 83.2 against the dollar. "
+    "Foreign portfolio investors were net buyers for the third straight session.\n\n"
+    "भारतीय रिज़र्व बैंक ने रेपो दर को 6.5 प्रतिशत पर स्थिर रखा। रुपया डॉलर के मुकाबले 83.2 पर बंद हुआ।\n\n"
+)
+
+
+def load_samples() -> List[Tuple[str, str]]:
+    samples = [(f"golden-{i}", case) for i, case in enumerate(GOLDEN_CASES)]
+    for path in sorted(glob.glob(os.path.join(settings.RAW_DATA_STORAGE_PATH, "*.json"))):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for key in ("raw_response", "eng_pod", "hin_pod"):
+                if isinstance(data.get(key), str):
+                    samples.append((f"{os.path.basename(path)}:{key}", data[key]))
+        except Exception as e:
+            print(f"Skipping {path}: {e}")
+
+    # A realistic, full-length agent response built from the golden cases
+    samples.append(("synthetic-episode", "\n\n".join(GOLDEN_CASES[2:]) * 8))
+    samples.append((
+        "prose-episode",
+        "=====ENGLISH PODCAST SCRIPT=====\n" + PROSE * 10 + "=====HINDI PODCAST SCRIPT=====\n" + PROSE * 10
+    ))
+    return samples
+
+
+def stream_clean(text: str, rng: random.Random) -> str:
+    cleaner = StreamingScriptCleaner()
+    out, i = [], 0
+    while i < len(text):
+        step = rng.randint(1, 40)
+        out.append(cleaner.feed(text[i:i + step]))
+        i += step
+    out.append(cleaner.close())
+    return "".join(out)
+
+
+def timed(fn, text: str, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(text)
+    return (time.perf_counter() - start) * 1e6 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--stream-trials", type=int, default=50)
+    args = parser.parse_args()
+
+    # clean_generated_script logs every call at INFO
+    logger.setLevel(logging.WARNING)
+
+    rng = random.Random(0)
+    failures = 0
+    samples = load_samples()
+
+    for name, text in samples:
+        expected = legacy_clean_generated_script(text)
+        mismatch = clean_generated_script(text) != expected
+        if mismatch:
+            print(f"MISMATCH (batch)  {name}")
+        for _ in range(args.stream_trials):
+            if stream_clean(text, rng) != expected:
+                mismatch = True
+                print(f"MISMATCH (stream) {name}")
+                break
+        failures += mismatch
+
+    print(f"Golden equivalence: {len(samples) - failures}/{len(samples)} samples identical "
+          f"(batch + {args.stream_trials} random stream splits each)\n")
+
+    print(f"{'sample':<32} {'chars':>7} {'legacy µs':>10} {'cleaner µs':>15} {'speedup':>8}")
+    for name, text in samples:
+        if len(text) < 500:
+            continue
+        legacy_us = timed(legacy_clean_generated_script, text, args.repeat)
+        new_us = timed(clean_generated_script, text, args.repeat)
+        print(f"{name[:32]:<32} {len(text):>7} {legacy_us:>10.1f} {new_us:>15.1f} {legacy_us / new_us:>7.2f}x")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
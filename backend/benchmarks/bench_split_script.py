@@ -0,0 +1,140 @@
+"""
+Benchmark: balanced vs greedy (legacy) chunk packing in split_script.
+
+Compares chunk count, chunk size spread and oversized chunks per strategy.
+Uses real scripts when available - raw agent output (storage/raw_data),
+stored script artifacts (storage/scripts) or any JSON/TXT files passed on
+the command line - and falls back to a built-in sample otherwise.
+
+Usage (from backend/):
+    python -m benchmarks.bench_split_script [files ...] [--max-length 500]
+"""
+import os
+import sys
+import json
+import glob
+import time
+import logging
+import argparse
+import statistics
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.services.podcast.script_splitting import split_script, SPLIT_STRATEGIES
+
+
+SAMPLE_ENG = (
+    "Welcome to the Finance Research Team Financial Podcast. Today we look at three stories that moved "
+    "Indian markets. The Reserve Bank of India kept the repo rate unchanged at 6.5 percent, citing sticky "
+    "food inflation, while signalling that it remains watchful of global crude prices, currency volatility, "
+    "and the pace of credit growth in unsecured retail loans, which has run well ahead of deposit growth "
+    "for several quarters and has prompted the regulator to raise risk weights on consumer credit, credit "
+    "cards and loans to non-bank lenders, a move that analysts expect to slow disbursements by fintech "
+    "platforms, tighten liquidity for smaller finance companies, and nudge lending rates higher. Bond yields eased slightly after the announcement. "
+    "The rupee ended the day at 83.2 against the dollar! Foreign portfolio investors were net buyers for "
+    "the third straight session. Why does this matter for you? Lower volatility in the currency keeps "
+    "imported inflation in check and supports margins for companies that rely on imported inputs. "
+    "Finally, GST collections rose 10 percent year on year, pointing to steady consumption. "
+)
+
+SAMPLE_HIN = (
+    "फाइनेंस रिसर्च टीम वित्तीय पॉडकास्ट में आपका स्वागत है। आज हम तीन खबरों पर नज़र डालेंगे जिन्होंने भारतीय बाज़ारों को प्रभावित किया। "
+    "भारतीय रिज़र्व बैंक ने रेपो दर को 6.5 प्रतिशत पर स्थिर रखा, खाद्य महंगाई को कारण बताते हुए, और साथ ही यह संकेत दिया कि वह "
+    "वैश्विक कच्चे तेल की कीमतों, मुद्रा की अस्थिरता, और असुरक्षित खुदरा ऋणों में तेज़ वृद्धि पर नज़र रखे हुए है, जो कई तिमाहियों से "
+    "जमा वृद्धि से आगे चल रही है और जिसके कारण नियामक ने उपभोक्ता ऋण, क्रेडिट कार्ड और गैर-बैंक ऋणदाताओं को दिए गए ऋणों पर "
+    "जोखिम भार बढ़ाया है। घोषणा के बाद बॉन्ड यील्ड में हल्की गिरावट आई। रुपया डॉलर के मुकाबले 83.2 पर बंद हुआ। "
+    "विदेशी निवेशक लगातार तीसरे सत्र में शुद्ध खरीदार रहे। यह आपके लिए क्यों मायने रखता है? "
+    "जीएसटी संग्रह में साल-दर-साल 10 प्रतिशत की वृद्धि हुई, जो स्थिर खपत की ओर इशारा करती है। "
+)
+
+
+def load_scripts(paths: List[str]) -> List[Tuple[str, str, str]]:
+    """Return (source, language, text) triples from the given or default paths."""
+    if not paths:
+        paths = sorted(
+            glob.glob(os.path.join(settings.RAW_DATA_STORAGE_PATH, "*.json"))
+            + glob.glob(os.path.join(settings.SCRIPT_STORE_PATH, "*.json"))
+        )
+
+    scripts = []
+    for path in paths:
+        name = os.path.basename(path)
+        try:
+            if path.endswith(".json"):
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                data = data.get("scripts", data)
+                for key, language in (("eng_pod", "en"), ("hin_pod", "hi")):
+                    if isinstance(data.get(key), str) and data[key]:
+                        scripts.append((name, language, data[key]))
+            else:
+                with open(path, "r", encoding="utf-8") as f:
+                    text = f.read()
+                language = "hi" if any("ऀ" <= ch <= "ॿ" for ch in text) else "en"
+                scripts.append((name, language, text))
+        except Exception as e:
+            print(f"Skipping {path}: {e}")
+
+    if not scripts:
+        scripts = [("sample", "en", SAMPLE_ENG * 4), ("sample", "hi", SAMPLE_HIN * 4)]
+    return scripts
+
+
+def measure(text: str, language: str, max_length: int, strategy: str, repeat: int) -> Dict:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        chunks = split_script(text, max_length=max_length, language=language, strategy=strategy)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / repeat
+
+    sizes = [len(chunk) for chunk in chunks]
+    return {
+        "chunks": len(chunks),
+        "max": max(sizes),
+        "min": min(sizes),
+        "stdev": statistics.pstdev(sizes),
+        "oversized": sum(1 for size in sizes if size > max_length),
+        "ms": elapsed_ms,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", help="JSON (eng_pod/hin_pod) or TXT scripts")
+    parser.add_argument("--max-length", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    # split_script logs every chunk at INFO
+    logger.setLevel(logging.WARNING)
+
+    scripts = load_scripts(args.files)
+    header = f"{'source':<32} {'lang':<4} {'chars':>6}  " + "  ".join(
+        f"{strategy + ' n/max/min/sd/over':>30}" for strategy in SPLIT_STRATEGIES
+    )
+    print(header)
+    print("-" * len(header))
+
+    totals = {strategy: {"chunks": 0, "oversized": 0, "ms": 0.0} for strategy in SPLIT_STRATEGIES}
+    for source, language, text in scripts:
+        row = f"{source[:32]:<32} {language:<4} {len(text):>6}  "
+        cells = []
+        for strategy in SPLIT_STRATEGIES:
+            r = measure(text, language, args.max_length, strategy, args.repeat)
+            for key in totals[strategy]:
+                totals[strategy][key] += r[key]
+            cells.append(f"{r['chunks']:>4}/{r['max']:>4}/{r['min']:>4}/{r['stdev']:>5.0f}/{r['oversized']:>2} {r['ms']:>5.2f}ms")
+        print(row + "  ".join(f"{cell:>30}" for cell in cells))
+
+    print()
+    for strategy, total in totals.items():
+        print(
+            f"{strategy:<9} total chunks: {total['chunks']:>5}  oversized: {total['oversized']:>3}  "
+            f"split time: {total['ms']:.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
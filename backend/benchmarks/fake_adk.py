@@ -0,0 +1,188 @@
+"""
+Stand-in for the ADK Runner (and the Gemini calls behind it), for offline
+benchmarks.
+
+FakeRunner has the Runner interface the runner pool uses: run_async()
+appends the user message and the reply to the real session service and
+yields ADK Events, streamed as partial events when the run config asks
+for SSE. The reply is a canned script shaped by the prompt: both markers
+for the bilingual prompt, one section for a single-language prompt, JSON
+findings for the research step and a plain script for a pipeline writer.
+Time to first token and output speed are configurable.
+
+install() swaps it in for google.adk.runners.Runner; agents, sessions,
+the runner pool and everything downstream stay real.
+"""
+import re
+import json
+import time
+import asyncio
+from typing import List, Optional
+
+from google.adk.agents.run_config import StreamingMode
+from google.adk.events import Event
+from google.genai import types
+
+from app.services.unified_agent import runner_pool as runner_pool_module
+from app.services.unified_agent.prompt_builder import SCRIPT_MARKERS
+
+_OPENING_PATTERN = re.compile(r'[Ss]tart with (?:exactly: )?"([^"]+)"')
+_DEVANAGARI = re.compile(r'[ऀ-ॿ]')
+
+_ENG_SENTENCES = [
+    "The Reserve Bank of India kept the repo rate at {a}.{b} percent, citing sticky food inflation.",
+    "Bond yields eased by {b} basis points after the announcement, as traders priced in a longer pause.",
+    "The rupee ended the session at {c}.{b} against the dollar, supported by steady foreign inflows.",
+    "Foreign portfolio investors were net buyers of {d} hundred crore rupees for the {a}th straight session.",
+    "Why does this matter for you? Stable borrowing costs keep home and auto loan EMIs in check for now.",
+    "GST collections rose {e} percent year on year, pointing to resilient consumption in tier two cities.",
+    "Banking stocks led the gains, with the Nifty Bank index closing {a}.{b} percent higher.",
+    "Crude oil slipped to {c} dollars a barrel, easing pressure on India's import bill and fiscal math.",
+]
+
+_HIN_SENTENCES = [
+    "भारतीय रिज़र्व बैंक ने रेपो दर को {a}.{b} प्रतिशत पर स्थिर रखा और खाद्य महंगाई को कारण बताया।",
+    "घोषणा के बाद बॉन्ड यील्ड में {b} आधार अंकों की गिरावट आई।",
+    "रुपया डॉलर के मुकाबले {c}.{b} पर बंद हुआ, जिसे विदेशी निवेश से सहारा मिला।",
+    "विदेशी निवेशक लगातार {a}वें सत्र में {d} सौ करोड़ रुपये के शुद्ध खरीदार रहे।",
+    "यह आपके लिए क्यों मायने रखता है? स्थिर ब्याज दरों से होम और ऑटो लोन की ईएमआई फिलहाल नियंत्रण में रहेगी।",
+    "जीएसटी संग्रह में साल-दर-साल {e} प्रतिशत की वृद्धि हुई, जो मज़बूत खपत की ओर इशारा करती है।",
+    "बैंकिंग शेयरों ने बढ़त की अगुवाई की और निफ्टी बैंक सूचकांक {a}.{b} प्रतिशत ऊपर बंद हुआ।",
+    "कच्चा तेल {c} डॉलर प्रति बैरल पर फिसल गया, जिससे भारत के आयात बिल पर दबाव कम हुआ।",
+]
+
+_SEGMENT_TITLES = {
+    "en": ["Rates and the rupee", "Foreign flows and banks", "Consumption and crude"],
+    "hi": ["ब्याज दरें और रुपया", "विदेशी निवेश और बैंक", "खपत और कच्चा तेल"],
+}
+
+_FINDINGS = {
+    "date": "yesterday",
+    "segments": [
+        {
+            "title_en": title_en,
+            "title_hi": title_hi,
+            "summary": "Canned benchmark findings.",
+            "key_facts": ["Repo rate 6.5 percent", "Rupee at 83.2", "GST up 10 percent"],
+            "india_impact": "Borrowing costs and import prices for Indian households.",
+        }
+        for title_en, title_hi in zip(_SEGMENT_TITLES["en"], _SEGMENT_TITLES["hi"])
+    ],
+}
+
+
+class AgentProfile:
+    """
+    Latency model of the fake agent.
+
+    - first_token_seconds: time before the first output (search + thinking)
+    - chars_per_second: output speed once text flows
+    - script_words: approximate words per language script
+    """
+
+    def __init__(self, first_token_seconds: float = 2.0, chars_per_second: float = 1500.0, script_words: int = 700):
+        self.first_token_seconds = first_token_seconds
+        self.chars_per_second = chars_per_second
+        self.script_words = script_words
+
+    def generation_seconds(self, text: str) -> float:
+        return len(text) / self.chars_per_second if self.chars_per_second > 0 else 0.0
+
+
+profile = AgentProfile()
+
+
+def canned_script(language: str, words: int, opening: Optional[str] = None) -> str:
+    """A deterministic script of roughly `words` words in three segments."""
+    sentences = _HIN_SENTENCES if language == "hi" else _ENG_SENTENCES
+    titles = _SEGMENT_TITLES[language]
+    paragraphs: List[str] = [opening] if opening else []
+    segment_words = max(1, words // len(titles))
+    for number, title in enumerate(titles, start=1):
+        body: List[str] = []
+        segment_count = 0
+        i = 0
+        while segment_count < segment_words:
+            template = sentences[(number + i) % len(sentences)]
+            sentence = template.format(a=number + i % 7, b=(i * 7) % 10, c=80 + i % 9, d=12 + i % 30, e=5 + i % 11)
+            body.append(sentence)
+            segment_count += len(sentence.split())
+            i += 1
+        label = "खंड" if language == "hi" else "SEGMENT"
+        paragraphs.append(f"[{label} {number}: {title}]\n" + " ".join(body))
+    return "\n\n".join(paragraphs)
+
+
+def canned_reply(prompt: str) -> str:
+    """The text a well-behaved model would return for one of the app's prompts."""
+    openings = {
+        ("hi" if _DEVANAGARI.search(line) else "en"): line
+        for line in _OPENING_PATTERN.findall(prompt)
+    }
+
+    if "RESEARCH FINDINGS:" in prompt:
+        language = "hi" if "Write ONE Hindi" in prompt else "en"
+        return canned_script(language, profile.script_words, openings.get(language))
+
+    if "Do NOT write a podcast script" in prompt:
+        return json.dumps(_FINDINGS, ensure_ascii=False)
+
+    sections = [
+        f"{marker}\n{canned_script(language, profile.script_words, openings.get(language))}"
+        for language, marker in SCRIPT_MARKERS.items()
+        if marker in prompt
+    ]
+    return "\n\n".join(sections)
+
+
+class FakeRunner:
+    """Drop-in for google.adk.runners.Runner that answers with canned_reply()"""
+
+    runs = 0
+
+    def __init__(self, agent, app_name: str, session_service):
+        self.agent = agent
+        self.app_name = app_name
+        self.session_service = session_service
+
+    async def run_async(self, *, user_id: str, session_id: str, new_message: types.Content, state_delta=None, run_config=None):
+        FakeRunner.runs += 1
+        session = await self.session_service.get_session(app_name=self.app_name, user_id=user_id, session_id=session_id)
+        await self.session_service.append_event(session, Event(author="user", content=new_message))
+
+        prompt = "".join(part.text or "" for part in new_message.parts)
+        reply = canned_reply(prompt)
+        author = getattr(self.agent, "name", "agent")
+        await asyncio.sleep(profile.first_token_seconds)
+
+        if run_config is not None and run_config.streaming_mode == StreamingMode.SSE:
+            started = time.perf_counter()
+            step = 200
+            for i in range(0, len(reply), step):
+                # Pace deltas to chars_per_second from the first token
+                delay = profile.generation_seconds(reply[:i + step]) - (time.perf_counter() - started)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                yield Event(
+                    author=author,
+                    partial=True,
+                    content=types.Content(role="model", parts=[types.Part(text=reply[i:i + step])]),
+                )
+        else:
+            await asyncio.sleep(profile.generation_seconds(reply))
+
+        final = Event(author=author, content=types.Content(role="model", parts=[types.Part(text=reply)]))
+        await self.session_service.append_event(session, final)
+        yield final
+
+    async def close(self):
+        pass
+
+
+def install(first_token_seconds: float = 2.0, chars_per_second: float = 1500.0, script_words: int = 700):
+    """Route every pooled agent run to FakeRunner (call before the agent service starts)."""
+    profile.first_token_seconds = first_token_seconds
+    profile.chars_per_second = chars_per_second
+    profile.script_words = script_words
+    runner_pool_module.Runner = FakeRunner
+    runner_pool_module.ADK_RUNNER_AVAILABLE = True
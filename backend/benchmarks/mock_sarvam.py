@@ -0,0 +1,253 @@
+"""
+Local stand-in for the Sarvam text-to-speech API, for offline benchmarks.
+
+POST /text-to-speech answers like Sarvam: {"audios": [<base64 WAV>, ...]},
+one deterministic WAV per input (a tone derived from the text, with a
+duration proportional to its length), after a configurable latency.
+A seeded fraction of requests fails with 503, and a token bucket answers
+429 with Retry-After once the request rate is exceeded, so the client's
+retry, backoff and circuit breaker paths run as they do against the API.
+
+bench_pipeline starts it in a background thread; it can also be run on
+its own and the backend pointed at it with SARVAM_TTS_URL.
+
+Usage (from backend/):
+    python -m benchmarks.mock_sarvam [--port 8090] [--latency 0.4] [--error-rate 0.02] [--rate-limit 10]
+"""
+import os
+import sys
+import json
+import math
+import time
+import wave
+import base64
+import random
+import struct
+import asyncio
+import hashlib
+import argparse
+import threading
+from io import BytesIO
+from typing import Any, Dict, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+try:
+    import uvicorn
+    UVICORN_AVAILABLE = True
+except ImportError:
+    UVICORN_AVAILABLE = False
+
+# Sarvam's default output: 22.05 kHz, 16-bit mono PCM
+SAMPLE_RATE = 22050
+
+
+def synthetic_wav(text: str, seconds_per_char: float = 0.06) -> bytes:
+    """
+    Deterministic WAV for a TTS input: a tone whose pitch is derived from
+    the text, lasting seconds_per_char per character (~0.06s is close to
+    Sarvam's speaking rate at pace 1.0).
+    """
+    digest = hashlib.sha256(text.encode("utf-8")).digest()
+    frequency = 220 + digest[0] * 2
+    # One period tiled over the duration keeps generation cheap
+    period = max(1, SAMPLE_RATE // frequency)
+    cycle = b"".join(
+        struct.pack("<h", int(8000 * math.sin(2 * math.pi * i / period)))
+        for i in range(period)
+    )
+    frames = max(period, int(len(text) * seconds_per_char * SAMPLE_RATE))
+    pcm = (cycle * (frames // period + 1))[:frames * 2]
+
+    buffer = BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(pcm)
+    return buffer.getvalue()
+
+
+class MockSarvamTTS:
+    """
+    Behaviour and counters of the mock TTS endpoint.
+
+    - latency: seconds per request, plus latency_per_char per input
+      character and up to `jitter` seconds of random extra
+    - error_rate: fraction of requests answered with 503
+    - rate_limit: requests per second allowed (token bucket with a
+      burst of one second's worth); 0 disables the limit
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.4,
+        latency_per_char: float = 0.0005,
+        jitter: float = 0.1,
+        error_rate: float = 0.0,
+        rate_limit: float = 0.0,
+        seconds_per_char: float = 0.06,
+        seed: int = 0
+    ):
+        self.latency = latency
+        self.latency_per_char = latency_per_char
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.seconds_per_char = seconds_per_char
+        self._random = random.Random(seed)
+        self._tokens = rate_limit
+        self._refilled = time.monotonic()
+
+        self.requests = 0
+        self.inputs = 0
+        self.ok = 0
+        self.rate_limited = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _take_token(self) -> Optional[float]:
+        """Consume a rate-limit token; returns the seconds to wait if none is left."""
+        if self.rate_limit <= 0:
+            return None
+        now = time.monotonic()
+        self._tokens = min(self.rate_limit, self._tokens + (now - self._refilled) * self.rate_limit)
+        self._refilled = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return None
+        return (1 - self._tokens) / self.rate_limit
+
+    async def handle(self, payload: Dict[str, Any]):
+        self.requests += 1
+        wait = self._take_token()
+        if wait is not None:
+            self.rate_limited += 1
+            return 429, {"error": {"message": "Rate limit exceeded"}}, {"Retry-After": f"{wait:.2f}"}
+
+        inputs = payload.get("inputs") or []
+        if not inputs or not all(isinstance(text, str) and text for text in inputs):
+            return 400, {"error": {"message": "inputs must be non-empty strings"}}, {}
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            chars = sum(len(text) for text in inputs)
+            await asyncio.sleep(self.latency + chars * self.latency_per_char + self._random.uniform(0, self.jitter))
+
+            if self._random.random() < self.error_rate:
+                self.errors += 1
+                return 503, {"error": {"message": "Service temporarily unavailable"}}, {}
+
+            audios = [
+                base64.b64encode(synthetic_wav(text, self.seconds_per_char)).decode("ascii")
+                for text in inputs
+            ]
+            self.inputs += len(inputs)
+            self.ok += 1
+            return 200, {"request_id": f"mock-{self.requests}", "audios": audios}, {}
+        finally:
+            self.in_flight -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "ok": self.ok,
+            "inputs": self.inputs,
+            "rate_limited": self.rate_limited,
+            "errors": self.errors,
+            "max_in_flight": self.max_in_flight,
+        }
+
+
+def create_app(mock: MockSarvamTTS) -> FastAPI:
+    app = FastAPI(title="Mock Sarvam TTS")
+
+    @app.post("/text-to-speech")
+    async def text_to_speech(request: Request):
+        try:
+            payload = await request.json()
+        except json.JSONDecodeError:
+            return JSONResponse({"error": {"message": "Invalid JSON"}}, status_code=400)
+        status, body, headers = await mock.handle(payload)
+        return JSONResponse(body, status_code=status, headers=headers)
+
+    @app.get("/stats")
+    async def stats():
+        return mock.stats()
+
+    return app
+
+
+class MockSarvamServer:
+    """Serve a MockSarvamTTS with uvicorn on a background thread (own event loop)."""
+
+    def __init__(self, mock: MockSarvamTTS, host: str = "127.0.0.1", port: int = 0):
+        if not UVICORN_AVAILABLE:
+            raise RuntimeError("uvicorn is required to serve the mock Sarvam API")
+        self.mock = mock
+        config = uvicorn.Config(create_app(mock), host=host, port=port, log_level="warning", access_log=False)
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, name="mock-sarvam", daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.servers[0].sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}/text-to-speech"
+
+    def start(self, timeout: float = 10.0) -> "MockSarvamServer":
+        self._thread.start()
+        deadline = time.monotonic() + timeout
+        while not self._server.started:
+            if not self._thread.is_alive() or time.monotonic() > deadline:
+                raise RuntimeError("Mock Sarvam server failed to start")
+            time.sleep(0.01)
+        return self
+
+    def stop(self):
+        self._server.should_exit = True
+        self._thread.join(timeout=5)
+
+
+def add_mock_arguments(parser: argparse.ArgumentParser):
+    """Mock TTS options shared with bench_pipeline"""
+    group = parser.add_argument_group("mock Sarvam TTS")
+    group.add_argument("--tts-latency", type=float, default=0.4, help="Seconds per TTS request (default: 0.4)")
+    group.add_argument("--tts-latency-per-char", type=float, default=0.0005, help="Extra seconds per input character (default: 0.0005)")
+    group.add_argument("--tts-jitter", type=float, default=0.1, help="Up to this many random extra seconds per request (default: 0.1)")
+    group.add_argument("--error-rate", type=float, default=0.0, help="Fraction of TTS requests answered with 503 (default: 0)")
+    group.add_argument("--rate-limit", type=float, default=0.0, help="TTS requests per second before 429s, 0 = unlimited (default: 0)")
+    group.add_argument("--seed", type=int, default=0, help="Seed for jitter and injected errors (default: 0)")
+
+
+def mock_from_args(args: argparse.Namespace) -> MockSarvamTTS:
+    return MockSarvamTTS(
+        latency=args.tts_latency,
+        latency_per_char=args.tts_latency_per_char,
+        jitter=args.tts_jitter,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        seed=args.seed,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    add_mock_arguments(parser)
+    args = parser.parse_args()
+
+    if not UVICORN_AVAILABLE:
+        sys.exit("uvicorn is required: pip install uvicorn")
+
+    print(f"Mock Sarvam TTS on http://{args.host}:{args.port}/text-to-speech (stats: /stats)")
+    uvicorn.run(create_app(mock_from_args(args)), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,14 +9,32 @@ const apiClient = axios.create({
     },
 });
 
+const JOB_POLL_INTERVAL_MS = 3000;
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+// POST /generate enqueues a background job; poll it until it finishes.
+const waitForJob = async (statusUrl) => {
+    const jobPath = statusUrl.replace(/^.*\/jobs\//, '/jobs/');
+    for (;;) {
+        const { data: job } = await apiClient.get(jobPath);
+        if (job.status === 'succeeded') return job.result;
+        if (job.status === 'failed') {
+            throw job.error || 'Failed to generate podcast. Please try again.';
+        }
+        await sleep(JOB_POLL_INTERVAL_MS);
+    }
+};
+
 export const generatePodcast = async (topic, voice = null, language = "both") => {
     try {
         const payload = { name: topic, language };
         if (voice) payload.voice_agent = voice;
         const response = await apiClient.post('/generate', payload);
-        return response.data;
+        return await waitForJob(response.data.status_url);
     } catch (error) {
         console.error('API Error:', error);
+        if (typeof error === 'string') throw error;
         throw error.response?.data?.detail || 'Failed to generate podcast. Please try again.';
     }
 };